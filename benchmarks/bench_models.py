@@ -0,0 +1,100 @@
+"""
+Memory benchmark for the model classes.
+
+Compares the __slots__ models with an equivalent __dict__-backed layout
+(a plain subclass without __slots__, i.e. the pre-slots representation).
+
+    python -m benchmarks.bench_models [count]
+"""
+import sys
+import tracemalloc
+
+from src.models.event import Event
+from src.models.participant import Participant
+from src.models.ticket import Ticket
+from src.models.venue import Venue
+
+
+def _make_ticket(cls, i):
+    return cls(
+        event_id="event-1",
+        participant_id="part-1",
+        price=50.0,
+        seat_number="A1",
+        ticket_type="Standard",
+        purchase_date="2025-01-01",
+        id=str(i)
+    )
+
+
+def _make_venue(cls, i):
+    return cls(
+        name="Hall",
+        address="Street 1",
+        capacity=100,
+        manager_name="John Doe",
+        phone="0501234567",
+        id=str(i)
+    )
+
+
+def _make_event(cls, i):
+    return cls(
+        name="Concert",
+        date="2025-12-31",
+        time="20:00",
+        category="Music",
+        description="",
+        duration_minutes=120,
+        venue_id="venue-1",
+        id=str(i)
+    )
+
+
+def _make_participant(cls, i):
+    return cls(
+        full_name="Alice Smith",
+        email="alice@example.com",
+        phone="0501234567",
+        age=25,
+        gender="F",
+        registration_date="2025-01-01",
+        id=str(i)
+    )
+
+
+CASES = [
+    (Ticket, _make_ticket),
+    (Venue, _make_venue),
+    (Event, _make_event),
+    (Participant, _make_participant),
+]
+
+
+def measure(factory, cls, count: int) -> float:
+    """
+    Returns allocated bytes per object (ids excluded: they are
+    created before tracing starts).
+    """
+    ids = [str(i) for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(cls, i) for i in ids]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main(count: int = 100_000):
+    print(f"{'model':<12} {'dict B/obj':>11} {'slots B/obj':>12} {'saved':>8}")
+    for cls, factory in CASES:
+        dict_cls = type(f"Dict{cls.__name__}", (cls,), {})
+        with_dict = measure(factory, dict_cls, count)
+        with_slots = measure(factory, cls, count)
+        saved = 100 * (1 - with_slots / with_dict)
+        print(f"{cls.__name__:<12} {with_dict:>11.0f} {with_slots:>12.0f} {saved:>7.0f}%")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
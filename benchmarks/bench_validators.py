@@ -0,0 +1,102 @@
+"""
+Validator throughput on N rows (default 1M): the previous
+implementation (pattern strings + strptime/strftime) vs the
+precompiled / ISO fast-path validators vs column-wise validation.
+
+    python -m benchmarks.bench_validators [rows]
+"""
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+from src.utils.validators import (
+    validate_column,
+    validate_date,
+    validate_email,
+    validate_phone,
+    validate_positive_int,
+    validate_time,
+)
+
+
+# ---------- Baseline: the validators before precompiling ---------- #
+
+def old_validate_positive_int(raw, field_name):
+    raw = raw.strip()
+    if not re.fullmatch(r"-?\d+", raw):
+        raise ValueError(f"{field_name} must be an integer number.")
+    value = int(raw)
+    if value <= 0:
+        raise ValueError(f"{field_name} must be greater than zero.")
+    return value
+
+
+def old_validate_phone(phone):
+    phone = phone.strip()
+    if not re.fullmatch(r"\d{10}", phone):
+        raise ValueError("Phone must contain exactly 10 digits (e.g. 0501234567).")
+    return phone
+
+
+def old_validate_email(email):
+    email = email.strip()
+    if not re.fullmatch(r"[^@\s]+@[^@\s]+\.[^@\s]+", email):
+        raise ValueError("Email format is invalid (e.g. user@example.com).")
+    return email
+
+
+def old_validate_date(date_str):
+    return datetime.strptime(date_str.strip(), "%Y-%m-%d").strftime("%Y-%m-%d")
+
+
+def old_validate_time(time_str):
+    return datetime.strptime(time_str.strip(), "%H:%M").strftime("%H:%M")
+
+
+def make_columns(rows: int) -> dict:
+    rnd = random.Random(42)
+    return {
+        "age": [str(rnd.randint(16, 90)) for _ in range(rows)],
+        "phone": [f"050{rnd.randrange(10**7):07d}" for _ in range(rows)],
+        "email": [f"user{i}@example.com" for i in range(rows)],
+        "date": [f"2025-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}" for _ in range(rows)],
+        "time": [f"{rnd.randint(0, 23):02d}:{rnd.choice((0, 15, 30, 45)):02d}" for _ in range(rows)],
+    }
+
+
+def _time(fn) -> float:
+    began = time.perf_counter()
+    fn()
+    return time.perf_counter() - began
+
+
+def _loop(check, values):
+    for value in values:
+        check(value)
+
+
+def main(rows: int = 1_000_000):
+    columns = make_columns(rows)
+    cases = [
+        ("age", lambda v: old_validate_positive_int(v, "Age"), lambda v: validate_positive_int(v, "Age")),
+        ("phone", old_validate_phone, validate_phone),
+        ("email", old_validate_email, validate_email),
+        ("date", old_validate_date, validate_date),
+        ("time", old_validate_time, validate_time),
+    ]
+
+    print(f"{rows:,} rows per column")
+    print(f"{'column':<8}{'old (s)':>10}{'new (s)':>10}{'column (s)':>12}{'speedup':>10}")
+    for name, old, new in cases:
+        values = columns[name]
+        t_old = _time(lambda: _loop(old, values))
+        t_new = _time(lambda: _loop(new, values))
+        t_col = _time(lambda: validate_column(values, new))
+        best = min(t_new, t_col)
+        print(f"{name:<8}{t_old:>10.2f}{t_new:>10.2f}{t_col:>12.2f}{t_old / best:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
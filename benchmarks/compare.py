@@ -0,0 +1,111 @@
+"""
+Compares two benchmark result files (benchmarks.suite --output) and
+flags regressions.
+
+    python -m benchmarks.compare baseline.json current.json [--threshold 0.10] [--metric p99_us]
+
+Exit status 1 if any benchmark got slower than the threshold allows.
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List
+
+# higher is better for throughput, lower for latencies
+HIGHER_IS_BETTER = {"ops_per_sec"}
+METRICS = ("ops_per_sec", "mean_us", "p50_us", "p95_us", "p99_us")
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = 0.10,
+    metric: str = "ops_per_sec"
+) -> List[Dict[str, object]]:
+    """
+    One row per benchmark: baseline value, current value, relative
+    change (positive = better) and status REGRESSION / IMPROVED / ok /
+    NEW / MISSING.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'. Available: {', '.join(METRICS)}")
+
+    old, new = baseline["results"], current["results"]
+    rows = []
+    for name in sorted(set(old) | set(new)):
+        row = {"name": name, "baseline": None, "current": None, "change": None}
+        if name not in new:
+            row["status"] = "MISSING"
+        elif name not in old:
+            row["status"] = "NEW"
+            row["current"] = new[name][metric]
+        else:
+            before, after = old[name][metric], new[name][metric]
+            row["baseline"], row["current"] = before, after
+            if before:
+                change = (after - before) / before
+                row["change"] = change if metric in HIGHER_IS_BETTER else -change
+            if row["change"] is None:
+                row["status"] = "ok"
+            elif row["change"] < -threshold:
+                row["status"] = "REGRESSION"
+            elif row["change"] > threshold:
+                row["status"] = "IMPROVED"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def mismatches(baseline: dict, current: dict) -> List[str]:
+    """
+    Run settings that make the two files not comparable.
+    """
+    notes = []
+    for key in ("data", "quick", "python", "sqlite"):
+        before = baseline.get("meta", {}).get(key)
+        after = current.get("meta", {}).get(key)
+        if before != after:
+            notes.append(f"warning: {key} differs (baseline {before}, current {after})")
+    return notes
+
+
+def format_report(rows: List[Dict[str, object]]) -> str:
+    lines = [f"{'benchmark':<48} {'baseline':>14} {'current':>14} {'change':>9}  status"]
+    for row in rows:
+        baseline = "-" if row["baseline"] is None else f"{row['baseline']:,.1f}"
+        current = "-" if row["current"] is None else f"{row['current']:,.1f}"
+        change = "-" if row["change"] is None else f"{row['change']:+.1%}"
+        lines.append(f"{row['name']:<48} {baseline:>14} {current:>14} {change:>9}  {row['status']}")
+    regressions = sum(row["status"] == "REGRESSION" for row in rows)
+    lines.append(f"{regressions} regression(s)")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare benchmark results with a baseline")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown (default: 0.10 = 10%%)")
+    parser.add_argument("--metric", choices=METRICS, default="ops_per_sec")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    documents = []
+    for path in (args.baseline, args.current):
+        with open(path, encoding="utf-8") as f:
+            documents.append(json.load(f))
+
+    rows = compare(*documents, threshold=args.threshold, metric=args.metric)
+    for note in mismatches(*documents):
+        print(note)
+    print(format_report(rows))
+    if any(row["status"] == "REGRESSION" for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
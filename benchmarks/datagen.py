@@ -0,0 +1,153 @@
+"""
+Synthetic data generator for benchmarks: venues, events, participants
+and tickets with realistic ids (random UUIDs), unique seats per event
+and a reproducible seed.
+
+    python -m benchmarks.datagen bench.db [--scale small|medium|large] [--seed 42]
+    python -m benchmarks.datagen bench.db --participants 2000000 --tickets 5000000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import time
+import uuid
+from itertools import islice
+from typing import Dict, Iterator
+
+from src.database.connection import apply_profile
+from src.database.schema import initialize_database
+
+SCALES: Dict[str, Dict[str, int]] = {
+    "tiny": {"venues": 5, "events": 20, "participants": 1_000, "tickets": 2_000},
+    "small": {"venues": 20, "events": 200, "participants": 20_000, "tickets": 50_000},
+    "medium": {"venues": 100, "events": 2_000, "participants": 200_000, "tickets": 500_000},
+    "large": {"venues": 500, "events": 10_000, "participants": 2_000_000, "tickets": 5_000_000},
+}
+
+CHUNK_SIZE = 10_000
+
+FIRST_NAMES = ["Aysel", "Nihad", "Leyla", "Murad", "Anna", "John", "Maria", "Elvin", "Sara", "Omar"]
+LAST_NAMES = ["Aliyev", "Mammadova", "Smith", "Huseynov", "Garcia", "Kim", "Novak", "Rossi"]
+CATEGORIES = ["Music", "Sport", "Theatre", "Conference", "Comedy"]
+TICKET_TYPES = ["Standard"] * 7 + ["VIP"] * 2 + ["Student"]
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _date(rng: random.Random, year: int) -> str:
+    return f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def _insert(conn: sqlite3.Connection, table: str, rows: Iterator[tuple]) -> int:
+    total = 0
+    while True:
+        chunk = list(islice(rows, CHUNK_SIZE))
+        if not chunk:
+            return total
+        placeholders = ", ".join("?" for _ in chunk[0])
+        conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", chunk)
+        total += len(chunk)
+
+
+def generate(
+    conn: sqlite3.Connection,
+    venues: int,
+    events: int,
+    participants: int,
+    tickets: int,
+    seed: int = 42
+) -> Dict[str, object]:
+    """
+    Fills an initialized database and returns the counts and the
+    elapsed time. Tickets are spread evenly over the events with seats
+    1..n per event; venue capacity always leaves room for more sales.
+    """
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    per_event = -(-tickets // events) if events else 0
+
+    venue_ids = [_uuid(rng) for _ in range(venues)]
+    event_ids = [_uuid(rng) for _ in range(events)]
+    participant_ids = [_uuid(rng) for _ in range(participants)]
+
+    with conn:
+        _insert(conn, "venues", (
+            (vid, f"Venue {i}", f"Street {i}", per_event * 4 + 1000,
+             f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", f"050{i:07d}", 1)
+            for i, vid in enumerate(venue_ids)
+        ))
+        _insert(conn, "events", (
+            (eid, f"Event {i}", _date(rng, 2025), f"{rng.randint(10, 22):02d}:00",
+             rng.choice(CATEGORIES), "", rng.choice((60, 90, 120)), venue_ids[i % venues], 1)
+            for i, eid in enumerate(event_ids)
+        ))
+        _insert(conn, "participants", (
+            (pid, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+             f"user{i}@example.com", f"05{i % 100_000_000:08d}", rng.randint(16, 80),
+             rng.choice(("Male", "Female")), _date(rng, 2024), int(rng.random() < 0.1))
+            for i, pid in enumerate(participant_ids)
+        ))
+        _insert(conn, "tickets", (
+            (_uuid(rng), event_ids[i // per_event], rng.choice(participant_ids),
+             rng.choice((25.0, 50.0, 100.0)), str(i % per_event + 1), rng.choice(TICKET_TYPES),
+             _date(rng, 2025), int(rng.random() < 0.3))
+            for i in range(tickets)
+        ))
+
+    return {
+        "venues": venues,
+        "events": events,
+        "participants": participants,
+        "tickets": tickets,
+        "tickets_per_event": per_event,
+        "elapsed_s": time.perf_counter() - started,
+    }
+
+
+def create_database(path: str, scale: str = "small", seed: int = 42, **counts) -> Dict[str, object]:
+    """
+    New database file at `path` filled with the given scale (counts
+    override single numbers of the scale).
+    """
+    if os.path.exists(path):
+        raise ValueError(f"{path} already exists – datagen only fills new databases.")
+    conn = sqlite3.connect(path)
+    try:
+        apply_profile(conn, "bulk-load")
+        initialize_database(conn)
+        return generate(conn, seed=seed, **dict(SCALES[scale], **counts))
+    finally:
+        conn.close()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark database")
+    parser.add_argument("db", help="New SQLite database file")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    for name in ("venues", "events", "participants", "tickets"):
+        parser.add_argument(f"--{name}", type=int, help=f"Override the scale's {name} count")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    counts = {
+        name: getattr(args, name)
+        for name in ("venues", "events", "participants", "tickets")
+        if getattr(args, name) is not None
+    }
+    stats = create_database(args.db, args.scale, args.seed, **counts)
+    rows = sum(stats[name] for name in ("venues", "events", "participants", "tickets"))
+    print(
+        f"{args.db}: {stats['venues']} venues, {stats['events']} events, "
+        f"{stats['participants']} participants, {stats['tickets']} tickets "
+        f"in {stats['elapsed_s']:.1f}s ({rows / stats['elapsed_s']:,.0f} rows/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
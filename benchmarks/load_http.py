@@ -0,0 +1,170 @@
+"""
+Local load generator for the HTTP JSON server (src/server.py).
+
+Starts the server in a subprocess on a temporary database, then
+`clients` threads sell seats of one event over keep-alive connections
+until it is sold out. With batch > 1 every request is a POST /batch
+carrying `batch` sales (one transaction on the server).
+
+    python -m benchmarks.load_http [clients] [capacity] [batch]
+"""
+import http.client
+import itertools
+import json
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from src.utils.histogram import LatencyHistogram
+from .stress_reservations import setup_event
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(db_path: str, port: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.server", "--db", db_path, "--port", str(port)],
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    # the server prints one line once it is listening
+    if not process.stdout.readline().startswith("Serving"):
+        process.kill()
+        raise RuntimeError("HTTP server did not start.")
+    return process
+
+
+def _sale(event_id: str, seat: int, client_id: int) -> dict:
+    return {
+        "event_id": event_id,
+        "participant_id": f"client-{client_id}",
+        "price": 50.0,
+        "seat_number": str(seat),
+        "ticket_type": "Standard",
+        "purchase_date": "2025-01-01",
+    }
+
+
+def _client(port, event_id, seats, batch, client_id, histogram, results):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    headers = {"Content-Type": "application/json"}
+    sold = rejected = 0
+    sold_out = False
+
+    while not sold_out:
+        numbers = list(itertools.islice(seats, batch))
+        if not numbers:
+            break
+        if batch == 1:
+            path, body = "/tickets", _sale(event_id, numbers[0], client_id)
+        else:
+            path = "/batch"
+            body = {"requests": [
+                {"method": "POST", "path": "/tickets", "body": _sale(event_id, n, client_id)}
+                for n in numbers
+            ]}
+
+        began = time.perf_counter()
+        conn.request("POST", path, json.dumps(body), headers)
+        response = conn.getresponse()
+        payload = json.loads(response.read())
+        histogram.record(time.perf_counter() - began)
+
+        statuses = (
+            [response.status] if batch == 1
+            else [item["status"] for item in payload["responses"]]
+        )
+        for status in statuses:
+            if status == 201:
+                sold += 1
+            else:
+                rejected += 1
+                sold_out = sold_out or status == 409 and "sold out" in str(payload)
+
+    conn.close()
+    results.append((sold, rejected))
+
+
+def run_load(db_path: str, clients: int = 8, capacity: int = 5000, batch: int = 20) -> dict:
+    event_id = setup_event(db_path, capacity)
+    port = _free_port()
+    server = start_server(db_path, port)
+
+    try:
+        # shared seat counter – itertools.count is safe to share between threads
+        seats = itertools.count(1)
+        histogram = LatencyHistogram()
+        results = []
+        threads = [
+            threading.Thread(
+                target=_client,
+                args=(port, event_id, seats, batch, i, histogram, results)
+            )
+            for i in range(clients)
+        ]
+
+        began = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - began
+
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        conn.request("GET", "/metrics")
+        server_metrics = json.loads(conn.getresponse().read())
+        conn.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+    db = sqlite3.connect(db_path)
+    in_db = db.execute(
+        "SELECT COUNT(*) FROM tickets WHERE event_id = ?", (event_id,)
+    ).fetchone()[0]
+    db.close()
+
+    sold = sum(r[0] for r in results)
+    latency = histogram.snapshot()
+    return {
+        "clients": clients,
+        "batch": batch,
+        "capacity": capacity,
+        "sold": sold,
+        "rejected": sum(r[1] for r in results),
+        "tickets_in_db": in_db,
+        "elapsed_s": elapsed,
+        "sales_per_sec": sold / elapsed if elapsed else 0.0,
+        "requests": latency["count"],
+        "client_p50_ms": latency["p50_ms"],
+        "client_p99_ms": latency["p99_ms"],
+        "server_routes": server_metrics["routes"],
+    }
+
+
+def main(clients: int = 8, capacity: int = 5000, batch: int = 20):
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = run_load(os.path.join(tmp, "load.db"), clients, capacity, batch)
+
+    routes = stats.pop("server_routes")
+    for key, value in stats.items():
+        print(f"{key:<15}: {value:.2f}" if isinstance(value, float) else f"{key:<15}: {value}")
+    for route, snapshot in routes.items():
+        print(f"server {route:<20} n={snapshot['count']} "
+              f"p50={snapshot['p50_ms']:.2f}ms p99={snapshot['p99_ms']:.2f}ms")
+    print("RESULT         :", "OK – no oversell" if stats["tickets_in_db"] <= stats["capacity"]
+          else "FAILED – oversold")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:4]]
+    main(*args)
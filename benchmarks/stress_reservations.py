@@ -0,0 +1,127 @@
+"""
+Multi-process on-sale stress test for TicketService.reserve_ticket.
+
+Several processes share one SQLite file and race for the same seats
+until the event is sold out. Verifies there is no oversell and no
+double-sold seat, and reports sales/sec.
+
+    python -m benchmarks.stress_reservations [processes] [capacity]
+"""
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from src.database.connection import apply_profile
+from src.database.schema import initialize_database
+from src.repositories.ticket_repository import TicketRepository
+from src.services.ticket_service import TicketService
+
+
+def setup_event(db_path: str, capacity: int) -> str:
+    conn = sqlite3.connect(db_path)
+    apply_profile(conn)
+    initialize_database(conn)
+    conn.execute(
+        "INSERT INTO venues VALUES ('venue-1', 'Arena', 'Street 1', ?, 'John Doe', '0501234567', 1)",
+        (capacity,)
+    )
+    conn.execute(
+        "INSERT INTO events VALUES ('event-1', 'On-sale', '2025-12-31', '20:00', 'Music', '', 90, 'venue-1', 1)"
+    )
+    conn.commit()
+    conn.close()
+    return "event-1"
+
+
+def _worker(db_path: str, event_id: str, seats: int, worker_id: int, start, results):
+    conn = sqlite3.connect(db_path, timeout=30)
+    apply_profile(conn)
+    service = TicketService(TicketRepository(conn))
+
+    order = list(range(1, seats + 1))
+    random.Random(worker_id).shuffle(order)
+
+    sold = rejected = 0
+    start.wait()
+    for seat in order:
+        try:
+            service.reserve_ticket(
+                event_id=event_id,
+                participant_id=f"worker-{worker_id}",
+                price=50.0,
+                seat_number=str(seat),
+                ticket_type="Standard",
+                purchase_date="2025-01-01"
+            )
+            sold += 1
+        except ValueError as exc:
+            rejected += 1
+            if "sold out" in str(exc):
+                break
+    conn.close()
+    results.put((sold, rejected))
+
+
+def run_stress(db_path: str, processes: int = 4, capacity: int = 200) -> dict:
+    """
+    Races `processes` workers over 1.5x capacity seat numbers.
+    Returns counts from the workers and from the database.
+    """
+    event_id = setup_event(db_path, capacity)
+    seats = capacity + capacity // 2
+
+    ctx = multiprocessing.get_context("spawn")
+    start = ctx.Event()
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(target=_worker, args=(db_path, event_id, seats, i, start, results))
+        for i in range(processes)
+    ]
+    for w in workers:
+        w.start()
+
+    began = time.perf_counter()
+    start.set()
+    outcomes = [results.get() for _ in workers]
+    elapsed = time.perf_counter() - began
+    for w in workers:
+        w.join()
+
+    conn = sqlite3.connect(db_path)
+    in_db, distinct_seats = conn.execute(
+        "SELECT COUNT(*), COUNT(DISTINCT seat_number) FROM tickets WHERE event_id = ?",
+        (event_id,)
+    ).fetchone()
+    conn.close()
+
+    sold = sum(o[0] for o in outcomes)
+    return {
+        "processes": processes,
+        "capacity": capacity,
+        "sold_reported": sold,
+        "rejected": sum(o[1] for o in outcomes),
+        "tickets_in_db": in_db,
+        "distinct_seats": distinct_seats,
+        "elapsed_s": elapsed,
+        "sales_per_sec": sold / elapsed if elapsed else 0.0,
+    }
+
+
+def main(processes: int = 8, capacity: int = 2000):
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = run_stress(os.path.join(tmp, "stress.db"), processes, capacity)
+
+    oversold = stats["tickets_in_db"] - stats["capacity"]
+    for key, value in stats.items():
+        print(f"{key:<15}: {value:.2f}" if isinstance(value, float) else f"{key:<15}: {value}")
+    print("RESULT         :", "OK – no oversell" if oversold <= 0 and
+          stats["distinct_seats"] == stats["tickets_in_db"] else "FAILED – oversold")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
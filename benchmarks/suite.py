@@ -0,0 +1,616 @@
+"""
+Benchmark suite: microbenchmarks for every repository method and
+service operation plus end-to-end scenarios, on a synthetic database
+(benchmarks.datagen). Results are written as JSON and can be compared
+with a stored baseline (benchmarks.compare).
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --scale medium --only ticket --output new.json --baseline base.json
+    python -m benchmarks.suite --db bench.db            # reuse a datagen database (copied first)
+
+Every micro benchmark times single calls (warm-up first) and reports
+ops/sec and p50/p95/p99 latency; scenarios report their own unit
+(sales, scans, rows).
+"""
+import argparse
+import fnmatch
+import gc
+import itertools
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Callable, Dict, List, Optional
+
+from src.database.connection import apply_profile, connect
+from src.models.ticket import Ticket
+from src.repositories.event_repository import EventRepository
+from src.repositories.participant_repository import ParticipantRepository
+from src.repositories.ticket_repository import TicketRepository
+from src.repositories.venue_repository import VenueRepository
+from src.services.checkin.check_in_service import CheckInService
+from src.services.event_service import EventService
+from src.services.inventory.seat_inventory import SeatInventory
+from src.services.participant_service import ParticipantService
+from src.services.ticket_service import TicketService
+from src.services.venue_service import VenueService
+from src.transfer.exporter import Exporter
+from src.utils.histogram import LatencyHistogram
+
+from .compare import compare, format_report, mismatches
+from .datagen import SCALES, create_database
+
+SAMPLE_SIZE = 1000
+GATE_BATCH = 50          # scans per check-in request of one gate
+
+MICRO: List[tuple] = []       # (name, iterations, factory)
+SCENARIOS: List[tuple] = []   # (name, function)
+
+
+def micro(name: str, iterations: int):
+    """
+    Registers a micro benchmark. The factory gets the BenchContext and
+    returns the operation (a no-argument callable) to time.
+    """
+    def register(factory: Callable[["BenchContext"], Callable[[], object]]):
+        MICRO.append((name, iterations, factory))
+        return factory
+    return register
+
+
+def scenario(name: str):
+    def register(function: Callable[["BenchContext", float], Dict[str, dict]]):
+        SCENARIOS.append((name, function))
+        return function
+    return register
+
+
+class BenchContext:
+    """
+    Connection, repositories, services and id samples shared by the
+    benchmarks. Writes go to a dedicated event whose venue has room
+    for any number of sales.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, seed: int = 7):
+        self.conn = conn
+        self.rng = random.Random(seed)
+
+        self.venue_repo = VenueRepository(conn)
+        self.event_repo = EventRepository(conn)
+        self.participant_repo = ParticipantRepository(conn)
+        self.ticket_repo = TicketRepository(conn)
+
+        inventory = SeatInventory(self.ticket_repo, self.event_repo, self.venue_repo)
+        self.venue_service = VenueService(self.venue_repo, inventory=inventory)
+        self.event_service = EventService(self.event_repo, inventory=inventory)
+        self.participant_service = ParticipantService(self.participant_repo)
+        self.ticket_service = TicketService(self.ticket_repo, inventory=inventory)
+
+        self.ticket_ids = self._sample("tickets")
+        self.participant_ids = self._sample("participants")
+        self.event_ids = self._sample("events")
+        self.participant_names = [
+            row[0] for row in conn.execute("SELECT full_name FROM participants LIMIT 100")
+        ]
+
+        self.write_event_id = self.new_event("Benchmark writes", capacity=10 ** 9)
+        self._seats = itertools.count(1)
+
+    def _sample(self, table: str) -> List[str]:
+        total = self.conn.execute(f"SELECT MAX(rowid) FROM {table}").fetchone()[0] or 0
+        rowids = self.rng.sample(range(1, total + 1), min(SAMPLE_SIZE, total))
+        ids = []
+        for start in range(0, len(rowids), 500):
+            chunk = rowids[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            ids.extend(row[0] for row in self.conn.execute(
+                f"SELECT id FROM {table} WHERE rowid IN ({placeholders})", chunk
+            ))
+        return ids
+
+    def new_event(self, name: str, capacity: int) -> str:
+        venue = self.venue_service.create_venue(
+            f"{name} venue", "Benchmark street 1", capacity, "Bench Runner", "0501234567"
+        )
+        event = self.event_service.create_event(
+            name, "2026-01-01", "20:00", "Music", "", 120, venue.id
+        )
+        return event.id
+
+    def next_seat(self) -> str:
+        return f"B{next(self._seats)}"
+
+    def new_ticket(self) -> Ticket:
+        return Ticket(
+            self.write_event_id, self.rng.choice(self.participant_ids), 50.0,
+            self.next_seat(), "Standard", "2026-01-01"
+        )
+
+    def sale(self) -> dict:
+        return {
+            "event_id": self.write_event_id,
+            "participant_id": self.rng.choice(self.participant_ids),
+            "price": 50.0,
+            "seat_number": self.next_seat(),
+            "ticket_type": self.rng.choice(("Standard", "VIP", "Student")),
+            "purchase_date": "2026-01-01",
+        }
+
+
+# ---------- Measurement ---------- #
+
+def _result(group: str, ops: int, elapsed: float, histogram: LatencyHistogram, **extra) -> dict:
+    snapshot = histogram.snapshot()
+    return dict(
+        group=group,
+        ops=ops,
+        elapsed_s=round(elapsed, 6),
+        ops_per_sec=round(ops / elapsed, 2) if elapsed else 0.0,
+        mean_us=round(snapshot["mean_ms"] * 1000, 3),
+        p50_us=round(snapshot["p50_ms"] * 1000, 3),
+        p95_us=round(snapshot["p95_ms"] * 1000, 3),
+        p99_us=round(snapshot["p99_ms"] * 1000, 3),
+        **extra
+    )
+
+
+def measure(op: Callable[[], object], iterations: int, group: str) -> dict:
+    for _ in range(max(1, iterations // 10)):
+        op()
+    gc.collect()
+
+    histogram = LatencyHistogram()
+    clock = time.perf_counter
+    started = clock()
+    for _ in range(iterations):
+        began = clock()
+        op()
+        histogram.record(clock() - began)
+    elapsed = clock() - started
+    return _result(group, iterations, elapsed, histogram)
+
+
+# ---------- Repository micro benchmarks ---------- #
+
+@micro("repository.venue.get_all", 200)
+def _venue_get_all(ctx):
+    return ctx.venue_repo.get_all
+
+
+@micro("repository.event.get_all", 50)
+def _event_get_all(ctx):
+    return ctx.event_repo.get_all
+
+
+@micro("repository.ticket.get_by_id", 5000)
+def _ticket_get_by_id(ctx):
+    return lambda: ctx.ticket_repo.get_by_id(ctx.rng.choice(ctx.ticket_ids))
+
+
+@micro("repository.participant.get_by_id", 5000)
+def _participant_get_by_id(ctx):
+    return lambda: ctx.participant_repo.get_by_id(ctx.rng.choice(ctx.participant_ids))
+
+
+@micro("repository.ticket.get_page.first", 1000)
+def _ticket_first_page(ctx):
+    return lambda: ctx.ticket_repo.get_page(page_size=20)
+
+
+@micro("repository.ticket.get_page.next", 1000)
+def _ticket_next_page(ctx):
+    state = {"cursor": None}
+
+    def op():
+        page = ctx.ticket_repo.get_page(page_size=20, cursor=state["cursor"])
+        state["cursor"] = page.next_cursor
+
+    return op
+
+
+@micro("repository.participant.get_page.start_at", 1000)
+def _participant_jump(ctx):
+    return lambda: ctx.participant_repo.get_page(
+        page_size=20, start_at=ctx.rng.choice(ctx.participant_names)[:3]
+    )
+
+
+@micro("repository.ticket.iter_all.10k", 20)
+def _ticket_iter_all(ctx):
+    return lambda: sum(1 for _ in islice(ctx.ticket_repo.iter_all(), 10_000))
+
+
+@micro("repository.ticket.load_batch.event", 200)
+def _ticket_load_batch(ctx):
+    return lambda: ctx.ticket_repo.load_batch(ctx.rng.choice(ctx.event_ids))
+
+
+@micro("repository.ticket.add", 2000)
+def _ticket_add(ctx):
+    return lambda: ctx.ticket_repo.add(ctx.new_ticket())
+
+
+@micro("repository.ticket.add_many.1000", 20)
+def _ticket_add_many(ctx):
+    return lambda: ctx.ticket_repo.add_many(ctx.new_ticket() for _ in range(1000))
+
+
+@micro("repository.ticket.reserve", 2000)
+def _ticket_reserve(ctx):
+    return lambda: ctx.ticket_repo.reserve(ctx.new_ticket())
+
+
+@micro("repository.ticket.update", 2000)
+def _ticket_update(ctx):
+    tickets = [ctx.ticket_repo.get_by_id(ticket_id) for ticket_id in ctx.ticket_ids]
+
+    def op():
+        ticket = ctx.rng.choice(tickets)
+        ticket._is_used = not ticket.is_used
+        ctx.ticket_repo.update(ticket)
+
+    return op
+
+
+@micro("repository.participant.update", 2000)
+def _participant_update(ctx):
+    people = [ctx.participant_repo.get_by_id(pid) for pid in ctx.participant_ids]
+
+    def op():
+        person = ctx.rng.choice(people)
+        person._is_vip = not person.is_vip
+        ctx.participant_repo.update(person)
+
+    return op
+
+
+@micro("repository.ticket.delete_by_id", 1000)
+def _ticket_delete(ctx):
+    tickets = [ctx.new_ticket() for _ in range(1100)]   # iterations + warm-up
+    ctx.ticket_repo.add_many(tickets)
+    ids = iter([ticket.id for ticket in tickets])
+    return lambda: ctx.ticket_repo.delete_by_id(next(ids))
+
+
+# ---------- Service micro benchmarks ---------- #
+
+@micro("service.ticket.sell_ticket", 2000)
+def _sell_ticket(ctx):
+    return lambda: ctx.ticket_service.sell_ticket(**ctx.sale())
+
+
+@micro("service.ticket.sell_ticket.unit_of_work_100", 20)
+def _sell_ticket_batch(ctx):
+    def op():
+        with ctx.ticket_service.unit_of_work():
+            for _ in range(100):
+                ctx.ticket_service.sell_ticket(**ctx.sale())
+    return op
+
+
+@micro("service.ticket.reserve_ticket", 2000)
+def _reserve_ticket(ctx):
+    return lambda: ctx.ticket_service.reserve_ticket(**ctx.sale())
+
+
+@micro("service.ticket.update_ticket", 1000)
+def _update_ticket(ctx):
+    tickets = [ctx.ticket_repo.get_by_id(ticket_id) for ticket_id in ctx.ticket_ids]
+
+    def op():
+        t = ctx.rng.choice(tickets)
+        ctx.ticket_service.update_ticket(
+            t.id, t.event_id, t.participant_id, t.price, t.seat_number,
+            t.ticket_type, t.purchase_date, not t.is_used
+        )
+
+    return op
+
+
+@micro("service.ticket.list_tickets_page", 1000)
+def _list_tickets_page(ctx):
+    return lambda: ctx.ticket_service.list_tickets_page(page_size=20)
+
+
+@micro("service.ticket.sales_batch.event", 200)
+def _sales_batch(ctx):
+    return lambda: ctx.ticket_service.sales_batch(ctx.rng.choice(ctx.event_ids)).revenue_by_event()
+
+
+@micro("service.ticket.reprice_event", 50)
+def _reprice_event(ctx):
+    return lambda: ctx.ticket_service.reprice_event(ctx.rng.choice(ctx.event_ids), 60.0)
+
+
+@micro("service.venue.list_venues", 200)
+def _list_venues(ctx):
+    return ctx.venue_service.list_venues
+
+
+@micro("service.event.list_events_page", 1000)
+def _list_events_page(ctx):
+    return lambda: ctx.event_service.list_events_page(page_size=20)
+
+
+@micro("service.participant.create_participant", 2000)
+def _create_participant(ctx):
+    counter = itertools.count()
+
+    def op():
+        n = next(counter)
+        ctx.participant_service.create_participant(
+            "Bench Person", f"bench{n}@example.com", "0501234567", 30, "Female", "2026-01-01"
+        )
+
+    return op
+
+
+# ---------- Scenarios ---------- #
+
+@scenario("scenario.on_sale_burst")
+def _on_sale_burst(ctx, scale: float) -> Dict[str, dict]:
+    """
+    A popular event goes on sale: buyers pick random seats (some
+    already taken) through reserve_ticket until it is sold out.
+    """
+    capacity = max(100, int(5000 * scale))
+    event_id = ctx.new_event("On-sale burst", capacity)
+    seats = [str(ctx.rng.randint(1, int(capacity * 1.2))) for _ in range(capacity * 3)]
+
+    histogram = LatencyHistogram()
+    sold = rejected = 0
+    started = time.perf_counter()
+    for seat in seats:
+        began = time.perf_counter()
+        try:
+            ctx.ticket_service.reserve_ticket(
+                event_id, ctx.rng.choice(ctx.participant_ids), 80.0, seat, "Standard", "2026-01-01"
+            )
+            sold += 1
+        except ValueError:
+            rejected += 1
+        histogram.record(time.perf_counter() - began)
+        if sold >= capacity:
+            break
+    elapsed = time.perf_counter() - started
+    return {"scenario.on_sale_burst": _result(
+        "scenario", sold + rejected, elapsed, histogram,
+        sold=sold, rejected=rejected, sales_per_sec=round(sold / elapsed, 2)
+    )}
+
+
+@scenario("scenario.check_in_rush")
+def _check_in_rush(ctx, scale: float) -> Dict[str, dict]:
+    """
+    Doors open: every ticket of the biggest events is scanned once,
+    plus 5% repeated scans and 2% unknown codes, through
+    CheckInService – first one scan per call (one commit per valid
+    scan), then again in gate batches of GATE_BATCH scans.
+    """
+    target = max(500, int(20_000 * scale))
+    scans: List[tuple] = []
+    events = ctx.conn.execute(
+        "SELECT event_id FROM tickets GROUP BY event_id ORDER BY COUNT(*) DESC"
+    ).fetchall()
+    for (event_id,) in events:
+        scans.extend((event_id, row[0]) for row in ctx.conn.execute(
+            "SELECT id FROM tickets WHERE event_id = ?", (event_id,)
+        ))
+        if len(scans) >= target:
+            break
+    scans = scans[:target]
+    event_ids = sorted({event_id for event_id, _ in scans})
+    scans += ctx.rng.sample(scans, len(scans) // 20)
+    scans += [(ctx.rng.choice(event_ids), f"unknown-{i}") for i in range(len(scans) // 50)]
+    ctx.rng.shuffle(scans)
+
+    def reset():
+        # the scanned events start unused, also on a reused --db
+        placeholders = ", ".join("?" for _ in event_ids)
+        ctx.conn.execute(f"UPDATE tickets SET is_used = 0 WHERE event_id IN ({placeholders})", event_ids)
+        ctx.conn.commit()
+        service = CheckInService(ctx.ticket_repo)
+        for event_id in event_ids:
+            service.open_event(event_id)
+        return service
+
+    service = reset()
+    statuses = []
+    histogram = LatencyHistogram()
+    started = time.perf_counter()
+    for event_id, ticket_id in scans:
+        began = time.perf_counter()
+        statuses.append(service.scan(ticket_id, event_id))
+        histogram.record(time.perf_counter() - began)
+    elapsed = time.perf_counter() - started
+    results = {"scenario.check_in_rush": _result(
+        "scenario", len(scans), elapsed, histogram, **service.summarize(statuses)
+    )}
+
+    # gates queue scans and send them per event in batches
+    service = reset()
+    by_event: Dict[str, List[str]] = {}
+    for event_id, ticket_id in scans:
+        by_event.setdefault(event_id, []).append(ticket_id)
+    batches = [
+        (event_id, ids[start:start + GATE_BATCH])
+        for event_id, ids in by_event.items()
+        for start in range(0, len(ids), GATE_BATCH)
+    ]
+    statuses = []
+    histogram = LatencyHistogram()
+    started = time.perf_counter()
+    for event_id, ids in batches:
+        began = time.perf_counter()
+        statuses.extend(service.scan_many(ids, event_id))
+        histogram.record(time.perf_counter() - began)
+    elapsed = time.perf_counter() - started
+    results["scenario.check_in_rush.gate_batches"] = _result(
+        "scenario", len(scans), elapsed, histogram,
+        batches=len(batches), **service.summarize(statuses)
+    )
+    return results
+
+
+@scenario("scenario.nightly_export")
+def _nightly_export(ctx, scale: float) -> Dict[str, dict]:
+    """
+    Full export of the tickets table in each format, then an
+    incremental run picking up the day's new sales.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        exporter = Exporter(ctx.conn)
+        high_watermark = None
+        for fmt in ("csv.gz", "jsonl.gz", "cols.gz"):
+            histogram = LatencyHistogram()
+            report = exporter.export("tickets", os.path.join(tmp, f"tickets.{fmt}"))
+            histogram.record(report.elapsed)
+            high_watermark = report.high_watermark
+            results[f"scenario.nightly_export.{fmt.split('.')[0]}"] = _result(
+                "scenario", report.rows, report.elapsed, histogram,
+                rows_per_sec=round(report.rows / report.elapsed, 2) if report.elapsed else 0.0,
+                file_bytes=os.path.getsize(report.path)
+            )
+
+        ctx.ticket_repo.add_many(ctx.new_ticket() for _ in range(max(100, int(5000 * scale))))
+        histogram = LatencyHistogram()
+        report = exporter.export(
+            "tickets", os.path.join(tmp, "delta.cols.gz"), "rowid", high_watermark
+        )
+        histogram.record(report.elapsed)
+        results["scenario.nightly_export.incremental"] = _result(
+            "scenario", report.rows, report.elapsed, histogram
+        )
+    return results
+
+
+# ---------- Runner ---------- #
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _copy_database(source: str, target: str) -> None:
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(target)
+    try:
+        src.backup(dst)
+    finally:
+        src.close()
+        dst.close()
+
+
+def run_suite(
+    db_path: str,
+    only: Optional[List[str]] = None,
+    iteration_scale: float = 1.0,
+    progress=None
+) -> Dict[str, dict]:
+    """
+    Runs the selected benchmarks (fnmatch patterns or substrings of
+    the names) against db_path, which is modified by the write
+    benchmarks – pass a copy.
+    """
+    def selected(name: str) -> bool:
+        return not only or any(p in name or fnmatch.fnmatch(name, p) for p in only)
+
+    conn = connect(db_path)
+    apply_profile(conn)
+    try:
+        ctx = BenchContext(conn)
+        results = {}
+        for name, iterations, factory in MICRO:
+            if selected(name):
+                group = name.split(".", 1)[0]
+                results[name] = measure(factory(ctx), max(1, int(iterations * iteration_scale)), group)
+                if progress:
+                    progress(name, results[name])
+        for name, function in SCENARIOS:
+            if selected(name):
+                for result_name, result in function(ctx, iteration_scale).items():
+                    results[result_name] = result
+                    if progress:
+                        progress(result_name, result)
+        return results
+    finally:
+        conn.close()
+
+
+def _print_result(name: str, result: dict) -> None:
+    print(
+        f"{name:<48} {result['ops_per_sec']:>12,.0f} ops/s  "
+        f"p50 {result['p50_us']:>9.1f} us  p99 {result['p99_us']:>9.1f} us",
+        flush=True
+    )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small",
+                        help="Synthetic data size when --db is not given (default: small)")
+    parser.add_argument("--db", help="Existing datagen database to benchmark (a copy is used)")
+    parser.add_argument("--only", action="append", help="Run only matching benchmarks (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="10x fewer iterations")
+    parser.add_argument("--output", help="Write the results JSON here")
+    parser.add_argument("--baseline", help="Compare with this results JSON; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown vs the baseline (default: 0.10 = 10%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        work = os.path.join(tmp, "bench.db")
+        if args.db:
+            _copy_database(args.db, work)
+            data = {"db": args.db}
+        else:
+            print(f"Generating {args.scale} dataset...", flush=True)
+            data = dict(create_database(work, args.scale), scale=args.scale)
+        results = run_suite(work, args.only, 0.1 if args.quick else 1.0, _print_result)
+
+    document = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "quick": args.quick,
+            "data": data,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(baseline, document, args.threshold)
+        for note in mismatches(baseline, document):
+            print(note)
+        print(format_report(rows))
+        if any(row["status"] == "REGRESSION" for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import asyncio
+import queue
+import sqlite3
+import threading
+from typing import Any, Callable, List, Optional
+
+from ..database.connection import DEFAULT_PROFILE, apply_profile, connect
+from ..database.unit_of_work import UnitOfWork
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_STOP = object()
+
+
+class _Job:
+    __slots__ = ("fn", "write", "loop", "future", "result", "error", "on_done")
+
+    def __init__(self, fn, write, loop, future, on_done=None):
+        self.fn = fn
+        self.write = write
+        self.loop = loop
+        self.future = future
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.on_done = on_done
+
+    def resolve(self) -> None:
+        self.loop.call_soon_threadsafe(self._set)
+
+    def _set(self) -> None:
+        if self.on_done is not None:
+            self.on_done()
+        if self.future.cancelled():
+            return
+        if self.error is not None:
+            self.future.set_exception(self.error)
+        else:
+            self.future.set_result(self.result)
+
+
+class SQLiteExecutor:
+    """
+    Runs all SQLite work of the async layer on ONE dedicated thread
+    that owns the connection, so coroutines never block the event loop
+    and thousands of pending requests do not each hold a thread.
+
+    - max_pending bounds the number of queued jobs; further callers wait
+      (asyncio backpressure) instead of growing the queue.
+    - Write jobs that are queued next to each other are grouped into one
+      transaction (one commit) of up to max_batch jobs. Each job runs in
+      its own SAVEPOINT, so a failing job only rolls back itself.
+      A write's future resolves after the commit.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "event_management.db",
+        profile: str = DEFAULT_PROFILE,
+        max_pending: int = 1024,
+        max_batch: int = 64
+    ):
+        if max_pending <= 0 or max_batch <= 0:
+            raise ValueError("max_pending and max_batch must be positive.")
+
+        self._db_path = db_path
+        self._profile = profile
+        self._max_batch = max_batch
+        self._slots = asyncio.Semaphore(max_pending)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._ready = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run, name="sqlite-executor", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+
+    # ---------- Public API ---------- #
+
+    async def run(self, fn: Callable[[sqlite3.Connection], Any], write: bool = False) -> Any:
+        """
+        Executes fn(connection) on the executor thread and returns its result.
+        """
+        if self._closed:
+            raise RuntimeError("Executor is closed.")
+
+        loop = asyncio.get_running_loop()
+        await self._slots.acquire()
+        # the slot is freed when the job has run, not when the caller
+        # stops waiting – a cancelled job is still queued
+        job = _Job(fn, write, loop, loop.create_future(), self._slots.release)
+        self._queue.put(job)
+        return await job.future
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        await asyncio.to_thread(self._thread.join)
+
+    # ---------- Executor thread ---------- #
+
+    def _run(self) -> None:
+        try:
+            conn = connect(self._db_path)
+            apply_profile(conn, self._profile)
+        except BaseException as exc:
+            self._startup_error = exc
+            self._ready.set()
+            return
+        self._ready.set()
+
+        pending: Optional[_Job] = None
+        try:
+            while True:
+                job = pending if pending is not None else self._queue.get()
+                pending = None
+                if job is _STOP:
+                    break
+
+                if not job.write:
+                    self._run_read(conn, job)
+                    continue
+
+                batch = [job]
+                while len(batch) < self._max_batch:
+                    try:
+                        nxt = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is _STOP or not nxt.write:
+                        pending = nxt
+                        break
+                    batch.append(nxt)
+                self._run_writes(conn, batch)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _run_read(conn: sqlite3.Connection, job: _Job) -> None:
+        try:
+            job.result = job.fn(conn)
+        except BaseException as exc:
+            job.error = exc
+        job.resolve()
+
+    @staticmethod
+    def _run_writes(conn: sqlite3.Connection, batch: List[_Job]) -> None:
+        try:
+            # write lock up front: jobs such as reserve() read before
+            # they write and must not hit SQLITE_BUSY on the upgrade
+            with UnitOfWork(conn, immediate=True):
+                for job in batch:
+                    conn.execute("SAVEPOINT job")
+                    try:
+                        job.result = job.fn(conn)
+                        conn.execute("RELEASE SAVEPOINT job")
+                    except BaseException as exc:
+                        conn.execute("ROLLBACK TO SAVEPOINT job")
+                        conn.execute("RELEASE SAVEPOINT job")
+                        job.error = exc
+        except BaseException as exc:
+            # commit failed – nothing of the batch is durable
+            logger.error("Write batch of %d jobs failed: %s", len(batch), exc)
+            try:
+                # a failed COMMIT can leave the transaction open
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            for job in batch:
+                job.error = job.error or exc
+
+        for job in batch:
+            job.resolve()
@@ -0,0 +1,79 @@
+from typing import Iterable, List, Optional
+
+from ..models.ticket import Ticket
+from ..repositories.base_repository import DEFAULT_CHUNK_SIZE
+from ..repositories.event_repository import EventRepository
+from ..repositories.pagination import DEFAULT_PAGE_SIZE, Page
+from ..repositories.participant_repository import ParticipantRepository
+from ..repositories.ticket_repository import TicketRepository
+from ..repositories.venue_repository import VenueRepository
+from .executor import SQLiteExecutor
+
+
+class AsyncRepository:
+    """
+    Async facade over a sync repository: every call runs the same SQL
+    code on the SQLiteExecutor thread and returns the same model types.
+    """
+    _repository_cls = None
+
+    def __init__(self, executor: SQLiteExecutor):
+        self._executor = executor
+        self._repository = None   # created lazily on the executor thread
+
+    def _get(self, conn):
+        if self._repository is None:
+            self._repository = self._repository_cls(conn)
+        return self._repository
+
+    async def _call(self, method: str, *args, write: bool = False):
+        return await self._executor.run(
+            lambda conn: getattr(self._get(conn), method)(*args),
+            write=write
+        )
+
+    async def add(self, model) -> None:
+        await self._call("add", model, write=True)
+
+    async def add_many(self, models: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        models = list(models)
+        return await self._call("add_many", models, chunk_size, write=True)
+
+    async def get_all(self) -> List:
+        return await self._call("get_all")
+
+    async def get_by_id(self, model_id: str) -> Optional[object]:
+        return await self._call("get_by_id", model_id)
+
+    async def get_page(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        start_at: Optional[str] = None
+    ) -> Page:
+        return await self._call("get_page", page_size, cursor, start_at)
+
+    async def update(self, model) -> None:
+        await self._call("update", model, write=True)
+
+    async def delete_by_id(self, model_id: str) -> bool:
+        return await self._call("delete_by_id", model_id, write=True)
+
+
+class AsyncVenueRepository(AsyncRepository):
+    _repository_cls = VenueRepository
+
+
+class AsyncEventRepository(AsyncRepository):
+    _repository_cls = EventRepository
+
+
+class AsyncParticipantRepository(AsyncRepository):
+    _repository_cls = ParticipantRepository
+
+
+class AsyncTicketRepository(AsyncRepository):
+    _repository_cls = TicketRepository
+
+    async def reserve(self, ticket: Ticket) -> None:
+        await self._call("reserve", ticket, write=True)
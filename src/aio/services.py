@@ -0,0 +1,173 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterable, List, Mapping
+
+from ..models.event import Event
+from ..models.participant import Participant
+from ..models.ticket import Ticket
+from ..models.venue import Venue
+from ..repositories.pagination import DEFAULT_PAGE_SIZE, Page
+from ..repositories.event_repository import EventRepository
+from ..repositories.participant_repository import ParticipantRepository
+from ..repositories.ticket_repository import TicketRepository
+from ..repositories.venue_repository import VenueRepository
+from ..services.event_service import EventService
+from ..services.participant_service import ParticipantService
+from ..services.ticket_service import TicketService
+from ..services.venue_service import VenueService
+from .executor import SQLiteExecutor
+
+
+class AsyncService(ABC):
+    """
+    Async facade over a sync service. The sync service (same validation,
+    pricing and logging) runs on the SQLiteExecutor thread; writes are
+    batched by the executor into shared transactions.
+    """
+
+    def __init__(self, executor: SQLiteExecutor):
+        self._executor = executor
+        self._service = None   # created lazily on the executor thread
+
+    @abstractmethod
+    def _create_service(self, conn):
+        """
+        Builds the sync service on the executor's connection.
+        """
+
+    def _get(self, conn):
+        if self._service is None:
+            self._service = self._create_service(conn)
+        return self._service
+
+    async def _call(self, method: str, *args, write: bool = False, **kwargs):
+        return await self._executor.run(
+            lambda conn: getattr(self._get(conn), method)(*args, **kwargs),
+            write=write
+        )
+
+
+class AsyncVenueService(AsyncService):
+    def _create_service(self, conn):
+        return VenueService(VenueRepository(conn))
+
+    async def create_venue(self, **fields) -> Venue:
+        return await self._call("create_venue", write=True, **fields)
+
+    async def get_venue(self, venue_id: str) -> Venue | None:
+        return await self._executor.run(
+            lambda conn: self._get(conn).repository.get_by_id(venue_id)
+        )
+
+    async def list_venues_page(
+        self, page_size: int = DEFAULT_PAGE_SIZE, cursor=None, start_at=None
+    ) -> Page:
+        return await self._call("list_venues_page", page_size, cursor, start_at)
+
+    async def update_venue(self, venue_id: str, **fields) -> Venue:
+        return await self._call("update_venue", venue_id, write=True, **fields)
+
+    async def delete_venue(self, venue_id: str) -> bool:
+        return await self._call("delete_venue", venue_id, write=True)
+
+
+class AsyncEventService(AsyncService):
+    def _create_service(self, conn):
+        return EventService(EventRepository(conn))
+
+    async def create_event(self, **fields) -> Event:
+        return await self._call("create_event", write=True, **fields)
+
+    async def get_event(self, event_id: str) -> Event | None:
+        return await self._executor.run(
+            lambda conn: self._get(conn).repository.get_by_id(event_id)
+        )
+
+    async def list_events_page(
+        self, page_size: int = DEFAULT_PAGE_SIZE, cursor=None, start_at=None
+    ) -> Page:
+        return await self._call("list_events_page", page_size, cursor, start_at)
+
+    async def update_event(self, event_id: str, **fields) -> Event:
+        return await self._call("update_event", event_id, write=True, **fields)
+
+    async def delete_event(self, event_id: str) -> bool:
+        return await self._call("delete_event", event_id, write=True)
+
+
+class AsyncParticipantService(AsyncService):
+    def _create_service(self, conn):
+        return ParticipantService(ParticipantRepository(conn))
+
+    async def create_participant(self, **fields) -> Participant:
+        return await self._call("create_participant", write=True, **fields)
+
+    async def create_participants_bulk(self, rows: Iterable[Mapping]) -> int:
+        rows = list(rows)
+        return await self._call("create_participants_bulk", rows, write=True)
+
+    async def get_participant(self, participant_id: str) -> Participant | None:
+        return await self._executor.run(
+            lambda conn: self._get(conn).repository.get_by_id(participant_id)
+        )
+
+    async def list_participants_page(
+        self, page_size: int = DEFAULT_PAGE_SIZE, cursor=None, start_at=None
+    ) -> Page:
+        return await self._call("list_participants_page", page_size, cursor, start_at)
+
+    async def update_participant(self, participant_id: str, **fields) -> Participant:
+        return await self._call("update_participant", participant_id, write=True, **fields)
+
+    async def delete_participant(self, participant_id: str) -> bool:
+        return await self._call("delete_participant", participant_id, write=True)
+
+
+class AsyncTicketService(AsyncService):
+    def _create_service(self, conn):
+        return TicketService(TicketRepository(conn))
+
+    async def sell_ticket(self, **fields) -> Ticket:
+        return await self._call("sell_ticket", write=True, **fields)
+
+    async def reserve_ticket(self, **fields) -> Ticket:
+        return await self._call("reserve_ticket", write=True, **fields)
+
+    async def sell_tickets_bulk(self, sales: Iterable[Mapping]) -> int:
+        sales = list(sales)
+        return await self._call("sell_tickets_bulk", sales, write=True)
+
+    async def get_ticket(self, ticket_id: str) -> Ticket | None:
+        return await self._executor.run(
+            lambda conn: self._get(conn).repository.get_by_id(ticket_id)
+        )
+
+    async def list_tickets_page(
+        self, page_size: int = DEFAULT_PAGE_SIZE, cursor=None, start_at=None
+    ) -> Page:
+        return await self._call("list_tickets_page", page_size, cursor, start_at)
+
+    async def iter_tickets(self, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Ticket]:
+        """
+        Streams tickets page by page; only one page is held and each
+        page is one short job on the executor thread.
+        """
+        cursor = None
+        while True:
+            page = await self.list_tickets_page(page_size, cursor)
+            for ticket in page.items:
+                yield ticket
+            if not page.has_next:
+                return
+            cursor = page.next_cursor
+
+    async def list_tickets(self) -> List[Ticket]:
+        """
+        Compatibility wrapper over iter_tickets (holds every ticket).
+        """
+        return [ticket async for ticket in self.iter_tickets()]
+
+    async def update_ticket(self, ticket_id: str, **fields) -> Ticket:
+        return await self._call("update_ticket", ticket_id, write=True, **fields)
+
+    async def delete_ticket(self, ticket_id: str) -> bool:
+        return await self._call("delete_ticket", ticket_id, write=True)
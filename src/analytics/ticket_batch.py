@@ -0,0 +1,166 @@
+from array import array
+from datetime import date
+from typing import Dict, List, Sequence
+
+DEFAULT_FETCH_SIZE = 5000
+
+# Columns TicketBatch.from_cursor expects, in this order.
+BATCH_COLUMNS = "event_id, participant_id, price, ticket_type, purchase_date, is_used"
+
+
+class _Dictionary:
+    """
+    Dictionary encoding: each distinct string gets a small int code,
+    the column itself only stores the codes.
+    """
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def code_of(self, value: str) -> int | None:
+        return self._codes.get(value)
+
+
+class TicketBatch:
+    """
+    Columnar (array-backed) container of ticket sales for analytics.
+
+    Instead of one Ticket object per row it keeps one typed array per column:
+      - price          : array('d')
+      - is_used        : array('b')
+      - purchase date  : array('i') of date ordinals
+      - event_id / participant_id / ticket_type : dictionary-encoded array('i')
+
+    Arrays support the buffer protocol, so numpy.frombuffer(batch.prices)
+    gives a zero-copy NumPy view where NumPy is available.
+    Ticket ids are not kept – this is an aggregate-only structure.
+    """
+
+    GROUP_KEYS = ("event_id", "participant_id", "ticket_type")
+
+    def __init__(self):
+        self.prices = array("d")
+        self.is_used = array("b")
+        self.date_ordinals = array("i")
+        self.event_codes = array("i")
+        self.participant_codes = array("i")
+        self.type_codes = array("i")
+
+        self._events = _Dictionary()
+        self._participants = _Dictionary()
+        self._types = _Dictionary()
+        self._ordinal_cache: Dict[str, int] = {}
+
+    # ---------- Build ---------- #
+
+    @classmethod
+    def from_cursor(cls, cursor, fetch_size: int = DEFAULT_FETCH_SIZE) -> "TicketBatch":
+        """
+        Fills a batch straight from an executed cursor whose rows are
+        (event_id, participant_id, price, ticket_type, purchase_date, is_used).
+        No Ticket objects are created.
+        """
+        batch = cls()
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            batch.extend(rows)
+        return batch
+
+    def extend(self, rows: Sequence[tuple]) -> None:
+        encode_event = self._events.encode
+        encode_participant = self._participants.encode
+        encode_type = self._types.encode
+        ordinal = self._ordinal
+
+        self.event_codes.extend(encode_event(r[0]) for r in rows)
+        self.participant_codes.extend(encode_participant(r[1]) for r in rows)
+        self.prices.extend(r[2] for r in rows)
+        self.type_codes.extend(encode_type(r[3]) for r in rows)
+        self.date_ordinals.extend(ordinal(r[4]) for r in rows)
+        self.is_used.extend(1 if r[5] else 0 for r in rows)
+
+    def _ordinal(self, value: str) -> int:
+        # purchase dates repeat a lot – parse each distinct string once
+        ordinal = self._ordinal_cache.get(value)
+        if ordinal is None:
+            ordinal = date.fromisoformat(value).toordinal()
+            self._ordinal_cache[value] = ordinal
+        return ordinal
+
+    # ---------- Aggregations ---------- #
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def count(self) -> int:
+        return len(self.prices)
+
+    def total_revenue(self) -> float:
+        return sum(self.prices)
+
+    def used_count(self) -> int:
+        return sum(self.is_used)
+
+    def group_by(self, key: str, measure: str = "revenue") -> Dict[str, float]:
+        """
+        Groups by event_id / participant_id / ticket_type.
+        measure: "revenue" (sum of price), "count" or "used" (checked-in count).
+        """
+        codes, dictionary = self._key_column(key)
+        size = len(dictionary.values)
+
+        if measure == "revenue":
+            totals = [0.0] * size
+            for code, price in zip(codes, self.prices):
+                totals[code] += price
+        elif measure == "count":
+            totals = [0] * size
+            for code in codes:
+                totals[code] += 1
+        elif measure == "used":
+            totals = [0] * size
+            for code, used in zip(codes, self.is_used):
+                totals[code] += used
+        else:
+            raise ValueError("Measure must be 'revenue', 'count' or 'used'.")
+
+        return dict(zip(dictionary.values, totals))
+
+    def revenue_by_event(self) -> Dict[str, float]:
+        return self.group_by("event_id", "revenue")
+
+    def count_by_event(self) -> Dict[str, int]:
+        return self.group_by("event_id", "count")
+
+    def revenue_by_type(self) -> Dict[str, float]:
+        return self.group_by("ticket_type", "revenue")
+
+    def count_by_type(self) -> Dict[str, int]:
+        return self.group_by("ticket_type", "count")
+
+    def revenue_by_date(self) -> Dict[date, float]:
+        totals: Dict[int, float] = {}
+        for ordinal, price in zip(self.date_ordinals, self.prices):
+            totals[ordinal] = totals.get(ordinal, 0.0) + price
+        return {date.fromordinal(o): v for o, v in sorted(totals.items())}
+
+    def _key_column(self, key: str):
+        if key == "event_id":
+            return self.event_codes, self._events
+        if key == "participant_id":
+            return self.participant_codes, self._participants
+        if key == "ticket_type":
+            return self.type_codes, self._types
+        raise ValueError(f"Group key must be one of: {', '.join(self.GROUP_KEYS)}.")
@@ -0,0 +1,234 @@
+# src/controllers/batch_controller.py
+import time
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from ..utils.signatures import check_call_fields
+from ..utils.validators import validate_record
+from ..transfer.readers import is_csv, read_records
+from ..logging_config import get_logger
+
+from ..database.unit_of_work import UnitOfWork
+
+from ..repositories.venue_repository import VenueRepository
+from ..repositories.event_repository import EventRepository
+from ..repositories.participant_repository import ParticipantRepository
+from ..repositories.ticket_repository import TicketRepository
+
+from ..services.venue_service import VenueService
+from ..services.event_service import EventService
+from ..services.participant_service import ParticipantService
+from ..services.ticket_service import TicketService
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+
+# command -> (record kind, action, service method)
+COMMANDS: Dict[str, Tuple[str, str, str]] = {
+    "create_venue": ("venue", "create", "create_venue"),
+    "update_venue": ("venue", "update", "update_venue"),
+    "delete_venue": ("venue", "delete", "delete_venue"),
+    "create_event": ("event", "create", "create_event"),
+    "update_event": ("event", "update", "update_event"),
+    "delete_event": ("event", "delete", "delete_event"),
+    "create_participant": ("participant", "create", "create_participant"),
+    "update_participant": ("participant", "update", "update_participant"),
+    "delete_participant": ("participant", "delete", "delete_participant"),
+    # atomic DB-side capacity/seat check, same as the interactive sale
+    "sell_ticket": ("ticket", "create", "reserve_ticket"),
+    "update_ticket": ("ticket", "update", "update_ticket"),
+    "delete_ticket": ("ticket", "delete", "delete_ticket"),
+}
+
+
+class BatchError:
+    """
+    One failed command of a script.
+    """
+
+    __slots__ = ("line", "command", "message")
+
+    def __init__(self, line: int, command: str, message: str):
+        self.line = line
+        self.command = command
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"line {self.line} ({self.command or '?'}): {self.message}"
+
+
+class BatchReport:
+    """
+    Result of a batch run: counts, throughput and per-command errors.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.succeeded = 0
+        self.errors: List[BatchError] = []
+        self.elapsed = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def commands_per_sec(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"Commands : {self.total}",
+            f"Succeeded: {self.succeeded}",
+            f"Failed   : {self.failed}",
+            f"Elapsed  : {self.elapsed:.2f}s ({self.commands_per_sec:.0f} commands/sec)",
+        ]
+        if self.errors:
+            lines.append("Errors:")
+            lines.extend(f"  {error}" for error in self.errors)
+        return "\n".join(lines)
+
+
+def read_commands(path: str) -> Iterator[Tuple[int, object]]:
+    """
+    Streams (line number, command) from a .csv or JSONL script.
+    Unparsable lines come through as (line number, ValueError) and
+    are reported like any other failed command.
+
+    CSV: header row with a `command` column plus field columns;
+    empty cells are treated as "not given".
+    """
+    csv_script = is_csv(path)
+    for line_no, command in read_records(path):
+        if csv_script and isinstance(command, dict):
+            command = {k: v for k, v in command.items() if k and v not in ("", None)}
+        yield line_no, command
+
+
+class BatchController:
+    """
+    Non-interactive counterpart of CLIController: executes a command
+    script through the same services.
+
+    Every command is one JSON object / CSV row:
+
+        {"command": "create_venue", "ref": "hall", "name": "Hall", ...}
+        {"command": "create_event", "venue_id": "$hall", ...}
+        {"command": "update_event", "id": "<event id>", "is_active": false}
+        {"command": "delete_ticket", "id": "<ticket id>"}
+
+    - records are addressed by id, never by menu index
+    - "ref" names the created record; "$<ref>" values use its id
+    - updates only need the changed fields
+    - fields are validated with the same rules as the CLI prompts
+
+    Commands run in transactions of chunk_size commands (one commit
+    per chunk); each command has its own SAVEPOINT, so a failing
+    command is reported and skipped without undoing its neighbours.
+    """
+
+    def __init__(self, connection, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+        self._conn = connection
+        self._chunk_size = chunk_size
+        self._services = {
+            "venue": VenueService(VenueRepository(connection)),
+            "event": EventService(EventRepository(connection)),
+            "participant": ParticipantService(ParticipantRepository(connection)),
+            "ticket": TicketService(TicketRepository(connection)),
+        }
+        self._refs: Dict[str, str] = {}
+
+    # ===================== RUN ===================== #
+
+    def run(self, path: str) -> BatchReport:
+        logger.info("Batch script started: %s", path)
+        report = self.execute(read_commands(path))
+        logger.info(
+            "Batch script finished: %s, total=%d, failed=%d, elapsed=%.2fs",
+            path, report.total, report.failed, report.elapsed
+        )
+        return report
+
+    def execute(self, commands: Iterable[Tuple[int, object]]) -> BatchReport:
+        report = BatchReport()
+        started = time.perf_counter()
+
+        chunk = []
+        for item in commands:
+            chunk.append(item)
+            if len(chunk) >= self._chunk_size:
+                self._execute_chunk(chunk, report)
+                chunk = []
+        if chunk:
+            self._execute_chunk(chunk, report)
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _execute_chunk(self, chunk, report: BatchReport) -> None:
+        with UnitOfWork(self._conn):
+            for line_no, command in chunk:
+                report.total += 1
+                name = command.get("command", "") if isinstance(command, dict) else ""
+                self._conn.execute("SAVEPOINT batch_command")
+                try:
+                    if isinstance(command, Exception):
+                        raise command
+                    self._execute_one(command)
+                    self._conn.execute("RELEASE SAVEPOINT batch_command")
+                    report.succeeded += 1
+                except Exception as exc:
+                    self._conn.execute("ROLLBACK TO SAVEPOINT batch_command")
+                    self._conn.execute("RELEASE SAVEPOINT batch_command")
+                    # business errors as-is; others (e.g. sqlite3 UNIQUE) with their type
+                    message = str(exc) if isinstance(exc, ValueError) else f"{type(exc).__name__}: {exc}"
+                    report.errors.append(BatchError(line_no, name, message))
+
+    # ===================== COMMANDS ===================== #
+
+    def _execute_one(self, command: dict) -> None:
+        fields = dict(command)
+        name = fields.pop("command", None)
+        if name not in COMMANDS:
+            raise ValueError(f"Unknown command '{name}'.")
+
+        kind, action, method_name = COMMANDS[name]
+        service = self._services[kind]
+        method = getattr(service, method_name)
+        ref = fields.pop("ref", None)
+        record_id = self._resolve(fields.pop("id", None))
+
+        if action == "delete":
+            if not record_id:
+                raise ValueError("'id' is required.")
+            method(record_id)
+            return
+
+        fields = validate_record(kind, {k: self._resolve(v) for k, v in fields.items()})
+
+        if action == "update":
+            if not record_id:
+                raise ValueError("'id' is required.")
+            current = service.repository.get_by_id(record_id)
+            if current is None:
+                raise ValueError(f"{kind.capitalize()} not found.")
+            merged = current.to_dict()
+            del merged["id"]
+            merged.update(fields)
+            fields = dict(merged, **{f"{kind}_id": record_id})
+
+        check_call_fields(method, fields)
+        record = method(**fields)
+
+        if ref:
+            self._refs[ref] = record.id
+
+    def _resolve(self, value):
+        if isinstance(value, str) and value.startswith("$"):
+            ref = value[1:]
+            if ref not in self._refs:
+                raise ValueError(f"Unknown reference '{value}'.")
+            return self._refs[ref]
+        return value
@@ -15,6 +15,7 @@ from ..utils.validators import (
 
 from ..logging_config import get_logger
 
+from ..repositories.cached_repository import cached
 from ..repositories.venue_repository import VenueRepository
 from ..repositories.event_repository import EventRepository
 from ..repositories.participant_repository import ParticipantRepository
@@ -24,6 +25,7 @@ from ..services.venue_service import VenueService
 from ..services.event_service import EventService
 from ..services.participant_service import ParticipantService
 from ..services.ticket_service import TicketService
+from ..services.inventory.seat_inventory import SeatInventory
 
 logger = get_logger(__name__)
 
@@ -37,17 +39,18 @@ class CLIController:
     """
 
     def __init__(self, connection):
-        # Repositories
-        venue_repo = VenueRepository(connection)
-        event_repo = EventRepository(connection)
-        participant_repo = ParticipantRepository(connection)
-        ticket_repo = TicketRepository(connection)
-
-        # Services
-        self._venue_service = VenueService(venue_repo)
-        self._event_service = EventService(event_repo)
+        # Repositories (get_by_id cache-dən – update/delete onu özü təmizləyir)
+        venue_repo = cached(VenueRepository(connection))
+        event_repo = cached(EventRepository(connection))
+        participant_repo = cached(ParticipantRepository(connection))
+        ticket_repo = cached(TicketRepository(connection))
+
+        # Services (venue/event changes drop the affected seat maps)
+        inventory = SeatInventory(ticket_repo, event_repo, venue_repo)
+        self._venue_service = VenueService(venue_repo, inventory=inventory)
+        self._event_service = EventService(event_repo, inventory=inventory)
         self._participant_service = ParticipantService(participant_repo)
-        self._ticket_service = TicketService(ticket_repo)
+        self._ticket_service = TicketService(ticket_repo, inventory=inventory)
 
     # ===================== MAIN LOOP ===================== #
 
@@ -117,6 +120,100 @@ class CLIController:
             else:
                 print("Invalid choice. Please try again.")
 
+    # ===================== PAGED SELECTION ===================== #
+
+    PAGE_SIZE = 10
+
+    def _choose_paged(self, fetch_page, describe, prompt, jump_hint, allow_keep=False):
+        """
+        Paged selection screen (keyset pagination) – only one page
+        is read from the database at a time.
+
+        n = next page, p = previous page, j <text> = jump to <text>,
+        number = choose item on the current page,
+        Enter = keep current value (only when allow_keep=True).
+
+        Returns the chosen item, or None if there is nothing to choose
+        (or the user kept the current value).
+        """
+        page = fetch_page(page_size=self.PAGE_SIZE)
+        if not page.items:
+            return None
+
+        while True:
+            for idx, item in enumerate(page.items, start=1):
+                print(f"{idx}. {describe(item)}")
+
+            hints = []
+            if page.has_prev:
+                hints.append("p = previous")
+            if page.has_next:
+                hints.append("n = next")
+            hints.append(f"j <{jump_hint}> = jump")
+            if allow_keep:
+                hints.append("Enter = keep current")
+            print(f"[{' | '.join(hints)}]")
+
+            raw = input(prompt).strip()
+
+            if raw == "" and allow_keep:
+                return None
+
+            new_page = None
+            if raw.lower() == "n" and page.has_next:
+                new_page = fetch_page(page_size=self.PAGE_SIZE, cursor=page.next_cursor)
+            elif raw.lower() == "p" and page.has_prev:
+                new_page = fetch_page(page_size=self.PAGE_SIZE, cursor=page.prev_cursor)
+            elif raw.lower().startswith("j "):
+                new_page = fetch_page(page_size=self.PAGE_SIZE, start_at=raw[2:].strip())
+            elif raw.isdigit():
+                index = int(raw) - 1
+                if 0 <= index < len(page.items):
+                    return page.items[index]
+                print("Error: Index out of range.")
+                continue
+            else:
+                print("Error: Invalid selection.")
+                continue
+
+            if new_page.items:
+                page = new_page
+            else:
+                print("No more records in that direction.")
+
+    def _choose_venue(self, prompt, allow_keep=False):
+        return self._choose_paged(
+            self._venue_service.list_venues_page,
+            lambda v: f"{v.name} (ID={v.id})",
+            prompt,
+            "name",
+            allow_keep
+        )
+
+    def _choose_event(self, prompt):
+        return self._choose_paged(
+            self._event_service.list_events_page,
+            lambda e: f"{e.name} on {e.date} (ID={e.id})",
+            prompt,
+            "YYYY-MM-DD"
+        )
+
+    def _choose_participant(self, prompt):
+        return self._choose_paged(
+            self._participant_service.list_participants_page,
+            lambda p: f"{p.full_name} (ID={p.id})",
+            prompt,
+            "name"
+        )
+
+    def _choose_ticket(self, prompt):
+        return self._choose_paged(
+            self._ticket_service.list_tickets_page,
+            lambda t: f"Ticket ID={t.id} | Event={t.event_id} | Participant={t.participant_id}",
+            prompt,
+            "purchase date"
+        )
+
     # ===================== VENUE ===================== #
 
     def create_venue(self):
@@ -183,35 +280,23 @@ class CLIController:
 
     def list_venues(self):
         print("\n--- List of Venues ---")
-        venues = self._venue_service.list_venues()
-        if not venues:
-            print("No venues found.")
-            return
-
-        for v in venues:
+        found = False
+        for v in self._venue_service.iter_venues():
+            found = True
             print("-" * 40)
             print(v.display_info())
 
+        if not found:
+            print("No venues found.")
+
     def update_venue(self):
         try:
             print("\n--- Update Venue ---")
-            venues = self._venue_service.list_venues()
-            if not venues:
+            selected = self._choose_venue("Choose venue to update (number): ")
+            if selected is None:
                 print("No venues found.")
                 return
 
-            for idx, v in enumerate(venues, start=1):
-                print(f"{idx}. {v.name} (ID={v.id})")
-
-            choice_str = input("Choose venue to update (number): ").strip()
-            if not choice_str.isdigit():
-                raise ValueError("Invalid selection.")
-            index = int(choice_str) - 1
-            if index < 0 or index >= len(venues):
-                raise ValueError("Index out of range.")
-
-            selected = venues[index]
-
             print("\nLeave field empty to keep current value.")
 
             name = input(f"Name [{selected.name}]: ").strip() or selected.name
@@ -254,23 +339,11 @@ class CLIController:
     def delete_venue(self):
         try:
             print("\n--- Delete Venue ---")
-            venues = self._venue_service.list_venues()
-            if not venues:
+            selected = self._choose_venue("Choose venue to delete (number): ")
+            if selected is None:
                 print("No venues found.")
                 return
 
-            for idx, v in enumerate(venues, start=1):
-                print(f"{idx}. {v.name} (ID={v.id})")
-
-            choice_str = input("Choose venue to delete (number): ").strip()
-            if not choice_str.isdigit():
-                raise ValueError("Invalid selection.")
-            index = int(choice_str) - 1
-            if index < 0 or index >= len(venues):
-                raise ValueError("Index out of range.")
-
-            selected = venues[index]
-
             confirm = input(
                 f"Are you sure you want to delete '{selected.name}'? (y/n): "
             ).strip().lower()
@@ -326,27 +399,12 @@ class CLIController:
                     print(f"Error: {e}")
 
             # mövcud venue-ları göstər
-            venues = self._venue_service.list_venues()
-            if not venues:
+            print("\nAvailable venues:")
+            selected_venue = self._choose_venue("Choose venue (number): ")
+            if selected_venue is None:
                 print("No venues found. Please create a venue first.")
                 return
 
-            print("\nAvailable venues:")
-            for idx, v in enumerate(venues, start=1):
-                print(f"{idx}. {v.name} (ID={v.id})")
-
-            while True:
-                venue_choice_str = input("Choose venue (number): ").strip()
-                if not venue_choice_str.isdigit():
-                    print("Error: Invalid venue selection.")
-                    continue
-                venue_index = int(venue_choice_str) - 1
-                if venue_index < 0 or venue_index >= len(venues):
-                    print("Error: Venue index out of range.")
-                    continue
-                selected_venue = venues[venue_index]
-                break
-
             event = self._event_service.create_event(
                 name=name,
                 date=date,
@@ -368,38 +426,23 @@ class CLIController:
 
     def list_events(self):
         print("\n--- List of Events ---")
-        events = self._event_service.list_events()
-        if not events:
-            print("No events found.")
-            return
-
-        for e in events:
+        found = False
+        for e in self._event_service.iter_events():
+            found = True
             print("-" * 40)
             print(e.display_info())
 
+        if not found:
+            print("No events found.")
+
     def update_event(self):
         try:
             print("\n--- Update Event ---")
-            events = self._event_service.list_events()
-            if not events:
+            selected = self._choose_event("Choose event to update (number): ")
+            if selected is None:
                 print("No events found.")
                 return
 
-            for idx, e in enumerate(events, start=1):
-                print(f"{idx}. {e.name} on {e.date} (ID={e.id})")
-
-            while True:
-                choice_str = input("Choose event to update (number): ").strip()
-                if not choice_str.isdigit():
-                    print("❌ Invalid selection.")
-                    continue
-                index = int(choice_str) - 1
-                if 0 <= index < len(events):
-                    selected = events[index]
-                    break
-                else:
-                    print("❌ Index out of range.")
-
             print("\nPress Enter to keep current value.\n")
 
             # NAME
@@ -451,25 +494,11 @@ class CLIController:
                     print(f"❌ {e}")
 
             # VENUE
-            venues = self._venue_service.list_venues()
             print("\nAvailable venues:")
-            for idx, v in enumerate(venues, start=1):
-                print(f"{idx}. {v.name}")
-
-            while True:
-                raw = input("Choose venue (Enter = keep current): ").strip()
-                if raw == "":
-                    venue_id = selected.venue_id
-                    break
-                if not raw.isdigit():
-                    print("❌ Invalid venue selection.")
-                    continue
-                venue_index = int(raw) - 1
-                if 0 <= venue_index < len(venues):
-                    venue_id = venues[venue_index].id
-                    break
-                else:
-                    print("❌ Venue index out of range.")
+            venue = self._choose_venue(
+                "Choose venue (Enter = keep current): ", allow_keep=True
+            )
+            venue_id = venue.id if venue is not None else selected.venue_id
 
             # IS ACTIVE
             while True:
@@ -508,23 +537,11 @@ class CLIController:
     def delete_event(self):
         try:
             print("\n--- Delete Event ---")
-            events = self._event_service.list_events()
-            if not events:
+            selected = self._choose_event("Choose event to delete (number): ")
+            if selected is None:
                 print("No events found.")
                 return
 
-            for idx, e in enumerate(events, start=1):
-                print(f"{idx}. {e.name} on {e.date} (ID={e.id})")
-
-            choice_str = input("Choose event to delete (number): ").strip()
-            if not choice_str.isdigit():
-                raise ValueError("Invalid selection.")
-            index = int(choice_str) - 1
-            if index < 0 or index >= len(events):
-                raise ValueError("Index out of range.")
-
-            selected = events[index]
-
             confirm = input(
                 f"Are you sure you want to delete '{selected.name}'? (y/n): "
             ).strip().lower()
@@ -627,39 +644,24 @@ class CLIController:
 
     def list_participants(self):
         print("\n--- List of Participants ---")
-        participants = self._participant_service.list_participants()
-        if not participants:
-            print("No participants found.")
-            return
-
-        for p in participants:
+        found = False
+        for p in self._participant_service.iter_participants():
+            found = True
             print("-" * 40)
             print(p.display_info())
 
+        if not found:
+            print("No participants found.")
+
 
     def update_participant(self):
         try:
             print("\n--- Update Participant ---")
-            participants = self._participant_service.list_participants()
-            if not participants:
+            selected = self._choose_participant("Choose participant to update (number): ")
+            if selected is None:
                 print("No participants found.")
                 return
 
-            for idx, p in enumerate(participants, start=1):
-                print(f"{idx}. {p.full_name} (ID={p.id})")
-
-            while True:
-                choice_str = input("Choose participant to update (number): ").strip()
-                if not choice_str.isdigit():
-                    print("❌ Invalid selection.")
-                    continue
-                index = int(choice_str) - 1
-                if 0 <= index < len(participants):
-                    selected = participants[index]
-                    break
-                else:
-                    print("❌ Index out of range.")
-
             print("\nPress Enter to keep current value.\n")
 
             # FULL NAME
@@ -770,23 +772,11 @@ class CLIController:
     def delete_participant(self):
         try:
             print("\n--- Delete Participant ---")
-            participants = self._participant_service.list_participants()
-            if not participants:
+            selected = self._choose_participant("Choose participant to delete (number): ")
+            if selected is None:
                 print("No participants found.")
                 return
 
-            for idx, p in enumerate(participants, start=1):
-                print(f"{idx}. {p.full_name} (ID={p.id})")
-
-            choice_str = input("Choose participant to delete (number): ").strip()
-            if not choice_str.isdigit():
-                raise ValueError("Invalid selection.")
-            index = int(choice_str) - 1
-            if index < 0 or index >= len(participants):
-                raise ValueError("Index out of range.")
-
-            selected = participants[index]
-
             confirm = input(
                 f"Are you sure you want to delete '{selected.full_name}'? (y/n): "
             ).strip().lower()
@@ -807,49 +797,26 @@ class CLIController:
         print("\n--- Sell Ticket ---")
         try:
             # 1) Event seç
-            events = self._event_service.list_events()
-            if not events:
+            print("\nAvailable events:")
+            selected_event = self._choose_event("Choose event (number): ")
+            if selected_event is None:
                 print("No events found. Please create an event first.")
                 return
 
-            print("\nAvailable events:")
-            for idx, e in enumerate(events, start=1):
-                print(f"{idx}. {e.name} on {e.date} (ID={e.id})")
-
-            while True:
-                event_choice_str = input("Choose event (number): ").strip()
-                if not event_choice_str.isdigit():
-                    print("Error: Invalid event selection.")
-                    continue
-                event_index = int(event_choice_str) - 1
-                if event_index < 0 or event_index >= len(events):
-                    print("Error: Event index out of range.")
-                    continue
-                selected_event = events[event_index]
-                break
+            inventory = self._ticket_service.inventory
+            sold, capacity = inventory.availability(selected_event.id)
+            print(f"Sold {sold} / {capacity} seats.")
+            if sold >= capacity:
+                print("Error: Event is sold out.")
+                return
 
             # 2) Participant seç
-            participants = self._participant_service.list_participants()
-            if not participants:
+            print("\nAvailable participants:")
+            selected_participant = self._choose_participant("Choose participant (number): ")
+            if selected_participant is None:
                 print("No participants found. Please create a participant first.")
                 return
 
-            print("\nAvailable participants:")
-            for idx, p in enumerate(participants, start=1):
-                print(f"{idx}. {p.full_name} (ID={p.id})")
-
-            while True:
-                participant_choice_str = input("Choose participant (number): ").strip()
-                if not participant_choice_str.isdigit():
-                    print("Error: Invalid participant selection.")
-                    continue
-                participant_index = int(participant_choice_str) - 1
-                if participant_index < 0 or participant_index >= len(participants):
-                    print("Error: Participant index out of range.")
-                    continue
-                selected_participant = participants[participant_index]
-                break
-
             # 3) Ticket məlumatları
             while True:
                 try:
@@ -859,11 +826,17 @@ class CLIController:
                 except ValueError as e:
                     print(f"Error: {e}")
 
+            best = inventory.best_available(selected_event.id)
+            suggestion = best[0] if best else ""
+
             while True:
-                seat_number = input("Seat number: ").strip()
-                if seat_number:
+                seat_number = input(f"Seat number [{suggestion}]: ").strip() or suggestion
+                if not seat_number:
+                    print("Error: Seat number is required.")
+                elif not inventory.is_available(selected_event.id, seat_number):
+                    print(f"Error: Seat {seat_number} is already sold.")
+                else:
                     break
-                print("Error: Seat number is required.")
 
             while True:
                 ticket_type = input("Ticket type (Standard/VIP/Student): ").strip()
@@ -879,14 +852,14 @@ class CLIController:
                 except ValueError as e:
                     print(f"Error: {e}")
 
-            ticket = self._ticket_service.sell_ticket(
+            # atomic in the DB – safe when several box offices share the file
+            ticket = self._ticket_service.reserve_ticket(
                 event_id=selected_event.id,
                 participant_id=selected_participant.id,
                 price=price,
                 seat_number=seat_number,
                 ticket_type=ticket_type,
-                purchase_date=purchase_date,
-                is_used=False
+                purchase_date=purchase_date
             )
 
             print("\nTicket successfully sold:")
@@ -899,40 +872,23 @@ class CLIController:
 
     def list_tickets(self):
         print("\n--- List of Tickets ---")
-        tickets = self._ticket_service.list_tickets()
-        if not tickets:
-            print("No tickets found.")
-            return
-
-        for t in tickets:
+        found = False
+        for t in self._ticket_service.iter_tickets():
+            found = True
             print("-" * 40)
             print(t.display_info())
 
+        if not found:
+            print("No tickets found.")
+
     def update_ticket(self):
         try:
             print("\n--- Update Ticket ---")
-            tickets = self._ticket_service.list_tickets()
-            if not tickets:
+            selected = self._choose_ticket("Choose ticket to update (number): ")
+            if selected is None:
                 print("No tickets found.")
                 return
 
-            for idx, t in enumerate(tickets, start=1):
-                print(
-                    f"{idx}. Ticket ID={t.id} | Event={t.event_id} | Participant={t.participant_id}"
-                )
-
-            while True:
-                choice_str = input("Choose ticket to update (number): ").strip()
-                if not choice_str.isdigit():
-                    print("❌ Invalid selection.")
-                    continue
-                index = int(choice_str) - 1
-                if 0 <= index < len(tickets):
-                    selected = tickets[index]
-                    break
-                else:
-                    print("❌ Index out of range.")
-
             print("\nPress Enter to keep current value.\n")
 
             # PRICE
@@ -1003,23 +959,11 @@ class CLIController:
     def delete_ticket(self):
         try:
             print("\n--- Delete Ticket ---")
-            tickets = self._ticket_service.list_tickets()
-            if not tickets:
+            selected = self._choose_ticket("Choose ticket to delete (number): ")
+            if selected is None:
                 print("No tickets found.")
                 return
 
-            for idx, t in enumerate(tickets, start=1):
-                print(f"{idx}. Ticket ID={t.id} | Event={t.event_id} | Participant={t.participant_id}")
-
-            choice_str = input("Choose ticket to delete (number): ").strip()
-            if not choice_str.isdigit():
-                raise ValueError("Invalid selection.")
-            index = int(choice_str) - 1
-            if index < 0 or index >= len(tickets):
-                raise ValueError("Index out of range.")
-
-            selected = tickets[index]
-
             confirm = input(
                 f"Are you sure you want to delete ticket '{selected.id}'? (y/n): "
             ).strip().lower()
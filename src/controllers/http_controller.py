@@ -0,0 +1,419 @@
+import json
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from ..database.pool import ConnectionPool
+from ..database.row_cache import cache_stats
+from ..instrumentation import REGISTRY, metrics_enabled
+from ..database.unit_of_work import UnitOfWork
+from ..repositories.cached_repository import cached
+from ..repositories.event_repository import EventRepository
+from ..repositories.pagination import DEFAULT_PAGE_SIZE, Page
+from ..repositories.participant_repository import ParticipantRepository
+from ..repositories.ticket_repository import TicketRepository
+from ..repositories.venue_repository import VenueRepository
+from ..services.checkin.check_in_service import CheckInService
+from ..services.checkin.hot_set import HotSet
+from ..services.event_service import EventService
+from ..services.participant_service import ParticipantService
+from ..services.ticket_service import TicketService
+from ..services.venue_service import VenueService
+from ..utils.histogram import LatencyHistogram
+from ..utils.signatures import check_call_fields
+from ..utils.validators import validate_record
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+MAX_BATCH_REQUESTS = 1000
+MAX_SCANS = 5000
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+
+class Resource:
+    """
+    Maps one URL collection (/venues, /events, ...) to its service.
+    `kind` selects the RECORD_VALIDATORS rules for request bodies;
+    `create`, `update`, `patch`, `delete` and `page` are service method names.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        service_factory: Callable[[sqlite3.Connection], object],
+        create: str,
+        update: str,
+        patch: str,
+        delete: str,
+        page: str
+    ):
+        self.kind = kind
+        self.service_factory = service_factory
+        self.create = create
+        self.update = update
+        self.patch = patch
+        self.delete = delete
+        self.page = page
+
+
+RESOURCES: Dict[str, Resource] = {
+    "venues": Resource(
+        "venue",
+        lambda conn: VenueService(cached(VenueRepository(conn))),
+        "create_venue", "update_venue", "patch_venue", "delete_venue", "list_venues_page"
+    ),
+    "events": Resource(
+        "event",
+        lambda conn: EventService(cached(EventRepository(conn))),
+        "create_event", "update_event", "patch_event", "delete_event", "list_events_page"
+    ),
+    "participants": Resource(
+        "participant",
+        lambda conn: ParticipantService(cached(ParticipantRepository(conn))),
+        "create_participant", "update_participant", "patch_participant",
+        "delete_participant",
+        "list_participants_page"
+    ),
+    # sales go through reserve_ticket – the database enforces capacity
+    # and seat uniqueness, so concurrent requests cannot oversell
+    "tickets": Resource(
+        "ticket",
+        lambda conn: TicketService(cached(TicketRepository(conn))),
+        "reserve_ticket", "update_ticket", "patch_ticket", "delete_ticket", "list_tickets_page"
+    ),
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _status_for(exc: Exception) -> int:
+    if isinstance(exc, HttpError):
+        return exc.status
+    if isinstance(exc, ValueError):
+        message = str(exc)
+        if "not found" in message:
+            return 404
+        if "sold out" in message or "already sold" in message:
+            return 409
+        return 400
+    if isinstance(exc, TypeError):
+        # a JSON value of the wrong type that slipped past validation
+        return 400
+    if isinstance(exc, sqlite3.IntegrityError):
+        return 409
+    if isinstance(exc, TimeoutError):
+        return 503
+    return 500
+
+
+def _call(method, kind: str, fields) -> object:
+    """
+    Calls a service method with JSON fields, validated and normalized
+    with the same rules as the CLI and the batch importer; unknown or
+    missing fields are a client error, not a 500.
+    """
+    if not isinstance(fields, dict):
+        raise HttpError(400, "Request body must be a JSON object.")
+    fields = validate_record(kind, fields)
+    check_call_fields(method, fields)
+    return method(**fields)
+
+
+class HttpController:
+    """
+    Transport-independent JSON API over the services.
+
+    handle(method, path, body) -> (status, payload). Reads run on a
+    pooled reader connection, writes on the pool's single writer.
+    Every request is timed into a per-route latency histogram
+    (GET /metrics).
+
+    Routes:
+        GET    /health, /metrics
+        GET    /<resource>?page_size=&cursor=&start_at=
+        GET    /<resource>/<id>
+        POST   /<resource>            create (tickets: atomic reserve)
+        PUT    /<resource>/<id>       update (all fields)
+        PATCH  /<resource>/<id>       update only the given fields
+        DELETE /<resource>/<id>
+        POST   /batch                 {"requests": [{"method", "path", "body"}]}
+        POST   /check-in              {"ticket_id" | "ticket_ids", "event_id"?}
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        self._pool = pool
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._status_counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        # check-in state of the events being scanned, shared by all gates
+        self._hot_set = HotSet()
+
+    # ---------- Entry point ---------- #
+
+    def handle(self, method: str, path: str, body: bytes = b"") -> Tuple[int, object]:
+        started = time.perf_counter()
+        route = f"{method} {path}"
+        try:
+            url = urlsplit(path)
+            parts = [part for part in url.path.split("/") if part]
+            route = self._route_name(method, parts)
+            payload = json.loads(body) if body else None
+
+            if parts == ["batch"]:
+                if method != "POST":
+                    raise HttpError(405, "Method not allowed.")
+                status, result = 200, self._batch(payload)
+            elif parts in (["health"], ["metrics"]):
+                status, result = self._dispatch(None, method, parts, {}, payload)
+            else:
+                with self._connection(method) as conn:
+                    status, result = self._dispatch(
+                        conn, method, parts, parse_qs(url.query), payload
+                    )
+        except json.JSONDecodeError:
+            status, result = 400, {"error": "Request body is not valid JSON."}
+        except Exception as exc:
+            status = _status_for(exc)
+            if status == 500:
+                logger.exception("Unhandled error for %s", route)
+                result = {"error": "Internal server error."}
+            else:
+                result = {"error": str(exc)}
+
+        self._record(route, status, time.perf_counter() - started)
+        return status, result
+
+    def _connection(self, method: str):
+        return self._pool.reader() if method == "GET" else self._pool.writer()
+
+    @staticmethod
+    def _route_name(method: str, parts: list) -> str:
+        # "GET /tickets/{id}" – ids are not part of the metric key
+        if parts[:1] and parts[0] not in RESOURCES and parts[0] not in ("batch", "health", "metrics", "check-in"):
+            return f"{method} (unknown)"
+        template = "/".join(parts[:1] + ["{id}"] * (len(parts) > 1))
+        return f"{method} /{template}"
+
+    # ---------- Routing ---------- #
+
+    def _dispatch(self, conn, method, parts, query, payload) -> Tuple[int, object]:
+        if parts == ["health"] and method == "GET":
+            return 200, {"status": "ok"}
+        if parts == ["metrics"] and method == "GET":
+            return 200, self.metrics()
+
+        if parts == ["check-in"] and method == "POST":
+            return 200, self._check_in(conn, payload)
+
+        if not parts or parts[0] not in RESOURCES or len(parts) > 2:
+            raise HttpError(404, "Not found.")
+
+        resource = RESOURCES[parts[0]]
+        service = resource.service_factory(conn)
+
+        if len(parts) == 1:
+            if method == "GET":
+                return 200, self._page(service, resource, query).to_dict()
+            if method == "POST":
+                return 201, _call(getattr(service, resource.create), resource.kind, payload).to_dict()
+        else:
+            item_id = parts[1]
+            if method == "GET":
+                item = service.repository.get_by_id(item_id)
+                if item is None:
+                    raise HttpError(404, "Not found.")
+                return 200, item.to_dict()
+            if method == "PUT":
+                fields = dict(payload or {}, **{f"{parts[0][:-1]}_id": item_id})
+                return 200, _call(getattr(service, resource.update), resource.kind, fields).to_dict()
+            if method == "PATCH":
+                if not isinstance(payload, dict):
+                    raise HttpError(400, "Request body must be a JSON object.")
+                fields = dict(payload, **{f"{parts[0][:-1]}_id": item_id})
+                count = _call(getattr(service, resource.patch), resource.kind, fields)
+                return 200, {"patched": item_id, "rowcount": count}
+            if method == "DELETE":
+                getattr(service, resource.delete)(item_id)
+                return 200, {"deleted": item_id}
+
+        raise HttpError(405, "Method not allowed.")
+
+    @staticmethod
+    def _page(service, resource: Resource, query: dict) -> Page:
+        def param(name):
+            values = query.get(name)
+            return values[0] if values else None
+
+        try:
+            page_size = int(param("page_size") or DEFAULT_PAGE_SIZE)
+        except ValueError:
+            raise HttpError(400, "page_size must be an integer.")
+        return getattr(service, resource.page)(
+            page_size, param("cursor"), param("start_at")
+        )
+
+    # ---------- Check-in ---------- #
+
+    def _check_in(self, conn, payload) -> dict:
+        """
+        One scan ({"ticket_id"}) or a gate's batch ({"ticket_ids"}),
+        optionally limited to one event ({"event_id"}).
+        """
+        if not isinstance(payload, dict):
+            raise HttpError(400, "Request body must be a JSON object.")
+        event_id = payload.get("event_id")
+        if event_id is not None and not isinstance(event_id, str):
+            raise HttpError(400, "event_id must be a string.")
+        service = CheckInService(cached(TicketRepository(conn)), self._hot_set)
+
+        if "ticket_ids" in payload:
+            ticket_ids = payload["ticket_ids"]
+            if not isinstance(ticket_ids, list) or not all(isinstance(i, str) for i in ticket_ids):
+                raise HttpError(400, "ticket_ids must be a list of strings.")
+            if len(ticket_ids) > MAX_SCANS:
+                raise HttpError(400, f"Cannot scan more than {MAX_SCANS} tickets at once.")
+            statuses = service.scan_many(ticket_ids, event_id)
+            return {"statuses": statuses, "counts": service.summarize(statuses)}
+
+        ticket_id = payload.get("ticket_id")
+        if not isinstance(ticket_id, str):
+            raise HttpError(400, "ticket_id or ticket_ids is required.")
+        return {"ticket_id": ticket_id, "status": service.scan(ticket_id, event_id)}
+
+    # ---------- Batch ---------- #
+
+    def _batch(self, payload) -> dict:
+        """
+        Runs many sub-requests in ONE writer transaction (one commit).
+        Each sub-request has its own SAVEPOINT, so a failing one
+        (e.g. a sold seat) only undoes itself.
+        """
+        requests = (payload or {}).get("requests") if isinstance(payload, dict) else None
+        if not isinstance(requests, list):
+            raise HttpError(400, "Batch body must be {\"requests\": [...]}.")
+        if len(requests) > MAX_BATCH_REQUESTS:
+            raise HttpError(400, f"Batch cannot exceed {MAX_BATCH_REQUESTS} requests.")
+
+        responses = []
+        with self._pool.writer() as conn, UnitOfWork(conn):
+            for sub in requests:
+                responses.append(self._batch_item(conn, sub))
+        return {"responses": responses}
+
+    def _batch_item(self, conn, sub) -> dict:
+        try:
+            if not isinstance(sub, dict):
+                raise HttpError(400, "Batch item must be a JSON object.")
+            method = str(sub.get("method", "GET")).upper()
+            url = urlsplit(str(sub.get("path", "")))
+            parts = [part for part in url.path.split("/") if part]
+            if parts[:1] == ["batch"]:
+                raise HttpError(400, "Batches cannot be nested.")
+
+            conn.execute("SAVEPOINT batch_item")
+            try:
+                status, body = self._dispatch(
+                    conn, method, parts, parse_qs(url.query), sub.get("body")
+                )
+                conn.execute("RELEASE SAVEPOINT batch_item")
+            except Exception:
+                conn.execute("ROLLBACK TO SAVEPOINT batch_item")
+                conn.execute("RELEASE SAVEPOINT batch_item")
+                raise
+        except Exception as exc:
+            status = _status_for(exc)
+            if status == 500:
+                # the item's savepoint is already undone – the rest of
+                # the batch still commits
+                logger.exception("Unhandled error in batch item")
+                body = {"error": "Internal server error."}
+            else:
+                body = {"error": str(exc)}
+        return {"status": status, "body": body}
+
+    # ---------- Metrics ---------- #
+
+    def _record(self, route: str, status: int, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(route)
+            if histogram is None:
+                histogram = self._histograms[route] = LatencyHistogram()
+            self._status_counts[status] = self._status_counts.get(status, 0) + 1
+        histogram.record(seconds)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            status_counts = sorted(self._status_counts.items())
+        result = {
+            "uptime_s": round(time.monotonic() - self._started, 3),
+            "status_counts": {str(status): count for status, count in status_counts},
+            "routes": {route: histogram.snapshot() for route, histogram in histograms},
+            "cache": cache_stats(),
+        }
+        if metrics_enabled():
+            # per service/repository method and per SQL statement
+            result.update(REGISTRY.snapshot())
+        return result
+
+
+class JsonRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP/1.1 adapter for HttpController. Responses always carry
+    Content-Length, so clients can keep the connection alive.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes – without TCP_NODELAY the
+    # body waits for the client's delayed ACK (~40 ms per request)
+    disable_nagle_algorithm = True
+    controller: HttpController = None   # set by create_server()
+
+    def _serve(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # the body cannot be skipped reliably – drop the connection
+            self._respond(400, {"error": "Invalid Content-Length header."})
+            self.close_connection = True
+            return
+        if length > MAX_BODY_BYTES:
+            self._respond(413, {"error": "Request body too large."})
+            self.close_connection = True
+            return
+        body = self.rfile.read(length) if length else b""
+        status, payload = self.controller.handle(self.command, self.path, body)
+        self._respond(status, payload)
+
+    def _respond(self, status: int, payload) -> None:
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def create_server(pool: ConnectionPool, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+    handler = type("BoundJsonRequestHandler", (JsonRequestHandler,), {
+        "controller": HttpController(pool),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -1,5 +1,63 @@
 import sqlite3
-from typing import Optional
+from typing import Dict, Optional
+
+from .row_cache import drop_caches
+from .unit_of_work import UnitOfWork
+from ..instrumentation import connection_factory
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PROFILE = "production"
+
+# PRAGMA dəstləri – bağlantı açılan kimi tətbiq olunur.
+# busy_timeout birinci gəlir ki, journal_mode dəyişəndə lock gözləsin.
+CONNECTION_PROFILES: Dict[str, Dict[str, object]] = {
+    # Normal iş rejimi: WAL (oxuyanlar yazanı bloklamır), az fsync.
+    "production": {
+        "busy_timeout": 5000,          # ms
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,          # 64 MiB (mənfi = KiB)
+        "mmap_size": 268435456,        # 256 MiB
+        "temp_store": "MEMORY",
+    },
+    # Böyük importlar üçün: sürət > dayanıqlıq (crash-də son tx itə bilər).
+    "bulk-load": {
+        "busy_timeout": 30000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,         # 256 MiB
+        "mmap_size": 1073741824,       # 1 GiB
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 10000,   # pages
+    },
+}
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """
+    sqlite3.connect() for the application's connections; they time
+    their SQL while metrics are enabled (see instrumentation).
+    """
+    return sqlite3.connect(db_path, factory=connection_factory(), **kwargs)
+
+
+def apply_profile(conn: sqlite3.Connection, profile: str = DEFAULT_PROFILE) -> None:
+    """
+    Applies the PRAGMAs of a connection profile to an open connection.
+    """
+    if profile not in CONNECTION_PROFILES:
+        raise ValueError(
+            f"Unknown connection profile '{profile}'. "
+            f"Available: {', '.join(CONNECTION_PROFILES)}"
+        )
+
+    for pragma, value in CONNECTION_PROFILES[profile].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+    logger.info("Connection profile applied: %s", profile)
+
 
 class DatabaseConnection:
     """
@@ -7,18 +65,38 @@ class DatabaseConnection:
     """
     _instance: Optional["DatabaseConnection"] = None
 
-    def __new__(cls, db_path: str = "event_management.db"):
+    def __new__(
+        cls,
+        db_path: str = "event_management.db",
+        profile: str = DEFAULT_PROFILE
+    ):
         if cls._instance is None:
+            conn = connect(db_path)
+            try:
+                apply_profile(conn, profile)
+            except Exception:
+                conn.close()
+                raise
+
             cls._instance = super().__new__(cls)
             cls._instance._db_path = db_path
-            cls._instance._conn = sqlite3.connect(db_path)
+            cls._instance._profile = profile
+            cls._instance._conn = conn
         return cls._instance
 
     @property
     def connection(self) -> sqlite3.Connection:
         return self._conn
 
+    @property
+    def profile(self) -> str:
+        return self._profile
+
+    def unit_of_work(self) -> UnitOfWork:
+        return UnitOfWork(self._conn)
+
     def close(self):
         if self._conn:
+            drop_caches(self._conn)
             self._conn.close()
             DatabaseConnection._instance = None
@@ -0,0 +1,217 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from .connection import DEFAULT_PROFILE, apply_profile, connect
+from .row_cache import drop_caches
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool for one SQLite file: ONE writer + N readers.
+
+    - writer()  – the single write connection, serialized by a lock
+                  (SQLite allows one writer at a time anyway).
+    - reader()  – one of N read-only connections; with WAL, readers
+                  run in parallel with each other and with the writer.
+
+    Reader checkout has per-thread affinity: a thread gets back the
+    connection it used last (warm page cache) when it is free, and
+    nested reader() calls in the same thread share one connection.
+    Connections idle longer than health_check_interval are pinged with
+    SELECT 1 on checkout and replaced if broken.
+
+        pool = ConnectionPool("event_management.db", readers=4)
+        with pool.read_repository(TicketRepository) as repo:
+            repo.get_by_id(ticket_id)
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        readers: int = 4,
+        profile: str = DEFAULT_PROFILE,
+        checkout_timeout: float = 30.0,
+        health_check_interval: float = 30.0
+    ):
+        if db_path == ":memory:":
+            raise ValueError("ConnectionPool needs a database file, not :memory:.")
+        if readers <= 0:
+            raise ValueError("Reader count must be positive.")
+
+        self._db_path = db_path
+        self._profile = profile
+        self._size = readers
+        self._checkout_timeout = checkout_timeout
+        self._health_check_interval = health_check_interval
+
+        self._last_used: Dict[int, float] = {}
+        self._writer = self._open()
+        self._writer_lock = threading.RLock()
+
+        self._cond = threading.Condition()
+        self._idle: List[sqlite3.Connection] = []
+        self._opened = 0
+        self._local = threading.local()
+        self._closed = False
+
+    # ---------- Connections ---------- #
+
+    def _open(self, read_only: bool = False) -> sqlite3.Connection:
+        conn = connect(self._db_path, check_same_thread=False)
+        apply_profile(conn, self._profile)
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        self._last_used[id(conn)] = time.monotonic()
+        return conn
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        last_used = self._last_used.get(id(conn), 0.0)
+        if time.monotonic() - last_used < self._health_check_interval:
+            return True
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        self._last_used.pop(id(conn), None)
+        drop_caches(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _replace(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        logger.warning("Replacing unhealthy pooled connection.")
+        self._discard(conn)
+        try:
+            return self._open(read_only=True)
+        except Exception:
+            # the slot of the discarded connection is free again
+            with self._cond:
+                self._opened -= 1
+                self._cond.notify()
+            raise
+
+    # ---------- Checkout ---------- #
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        preferred = getattr(self._local, "last", None)
+        deadline = time.monotonic() + self._checkout_timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed.")
+                if preferred is not None and preferred in self._idle:
+                    self._idle.remove(preferred)
+                    conn = preferred
+                    break
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._opened < self._size:
+                    self._opened += 1
+                    conn = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No reader connection free after {self._checkout_timeout}s."
+                    )
+                self._cond.wait(remaining)
+
+        if conn is None:
+            try:
+                return self._open(read_only=True)
+            except Exception:
+                with self._cond:
+                    self._opened -= 1
+                    self._cond.notify()
+                raise
+        if not self._is_healthy(conn):
+            conn = self._replace(conn)
+        return conn
+
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        self._last_used[id(conn)] = time.monotonic()
+        self._local.last = conn
+        with self._cond:
+            if self._closed:
+                drop_caches(conn)
+                conn.close()
+                return
+            self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        held: Optional[sqlite3.Connection] = getattr(self._local, "held", None)
+        if held is not None:
+            # nested call in the same thread – reuse the connection
+            yield held
+            return
+
+        conn = self._acquire_reader()
+        self._local.held = conn
+        try:
+            yield conn
+        finally:
+            self._local.held = None
+            self._release_reader(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._writer_lock:
+            if not self._is_healthy(self._writer):
+                logger.warning("Reopening unhealthy writer connection.")
+                self._discard(self._writer)
+                self._writer = self._open()
+            try:
+                yield self._writer
+            except Exception:
+                # never hand a half-written transaction to the next thread
+                if self._writer.in_transaction:
+                    self._writer.rollback()
+                raise
+            finally:
+                self._last_used[id(self._writer)] = time.monotonic()
+
+    # ---------- Repositories ---------- #
+
+    @contextmanager
+    def read_repository(self, repository_cls):
+        with self.reader() as conn:
+            yield repository_cls(conn)
+
+    @contextmanager
+    def write_repository(self, repository_cls):
+        with self.writer() as conn:
+            yield repository_cls(conn)
+
+    # ---------- Lifecycle ---------- #
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            for conn in self._idle:
+                drop_caches(conn)
+                conn.close()
+            self._idle.clear()
+            self._cond.notify_all()
+        with self._writer_lock:
+            drop_caches(self._writer)
+            self._writer.close()
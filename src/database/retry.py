@@ -0,0 +1,47 @@
+import random
+import sqlite3
+import time
+from typing import Callable, TypeVar
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_ATTEMPTS = 8
+BASE_DELAY = 0.005   # seconds
+MAX_DELAY = 0.5
+
+
+def is_busy_error(exc: BaseException) -> bool:
+    """
+    SQLITE_BUSY / SQLITE_LOCKED – another connection holds the write lock.
+    """
+    if not isinstance(exc, sqlite3.OperationalError):
+        return False
+    message = str(exc).lower()
+    return "locked" in message or "busy" in message
+
+
+def run_with_busy_retry(
+    operation: Callable[[], T],
+    attempts: int = DEFAULT_ATTEMPTS,
+    base_delay: float = BASE_DELAY,
+    max_delay: float = MAX_DELAY
+) -> T:
+    """
+    Runs operation, retrying on SQLITE_BUSY with exponential backoff
+    and full jitter (so competing processes do not retry in lockstep).
+    Any other error, or the last busy error, is raised.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return operation()
+        except sqlite3.OperationalError as exc:
+            if not is_busy_error(exc) or attempt == attempts:
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            logger.warning("Database busy (attempt %d/%d), retrying.", attempt, attempts)
+            time.sleep(delay)
+    raise AssertionError("unreachable")
@@ -0,0 +1,165 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 60.0      # seconds
+
+
+class CacheStats:
+    __slots__ = ("hits", "misses", "evictions", "expirations", "invalidations")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0        # LRU – cache full
+        self.expirations = 0      # older than ttl
+        self.invalidations = 0    # cleared: another connection changed the file
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["hit_ratio"] = round(self.hit_ratio, 4)
+        return data
+
+
+class RowCache:
+    """
+    Bounded LRU cache of rows read on ONE connection, with a TTL.
+
+    Before every lookup the cache compares `PRAGMA data_version` with
+    the value seen when it was filled. SQLite changes that number when
+    another connection (another process, or another pooled connection)
+    commits to the file, so the cache is dropped instead of serving
+    stale rows. Writes made on the same connection do not change it –
+    those must go through put()/discard()/clear() (CachedRepository
+    does that).
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL
+    ):
+        if max_size <= 0:
+            raise ValueError("Cache size must be positive.")
+        self._conn = connection
+        self._max_size = max_size
+        self._ttl = ttl
+        self._rows: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._data_version: Optional[int] = None
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _check_version(self) -> None:
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            if self._rows:
+                self._rows.clear()
+                self.stats.invalidations += 1
+            self._data_version = version
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        The cached row, or None on a miss (or expired / invalidated entry).
+        """
+        with self._lock:
+            self._check_version()
+            entry = self._rows.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._rows[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._rows.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, row: Any) -> None:
+        with self._lock:
+            if self._data_version is None:
+                self._check_version()
+            self._rows[key] = (time.monotonic() + self._ttl, row)
+            self._rows.move_to_end(key)
+            if len(self._rows) > self._max_size:
+                self._rows.popitem(last=False)
+                self.stats.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._rows.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+
+
+# ---------- Shared caches (one per connection and table) ---------- #
+
+# id(connection) -> (connection, {name: RowCache}); the connection is
+# kept so its id cannot be reused while the entry exists – owners of
+# long-lived connections call drop_caches() when closing them.
+_shared: Dict[int, Tuple[sqlite3.Connection, Dict[str, RowCache]]] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_cache(connection: sqlite3.Connection, name: str, **options) -> RowCache:
+    """
+    The RowCache `name` of this connection, created on first use, so
+    repositories built per request still share one cache.
+    """
+    with _shared_lock:
+        entry = _shared.get(id(connection))
+        if entry is None or entry[0] is not connection:
+            entry = _shared[id(connection)] = (connection, {})
+        caches = entry[1]
+        if name not in caches:
+            caches[name] = RowCache(connection, **options)
+        return caches[name]
+
+
+def drop_caches(connection: sqlite3.Connection) -> None:
+    with _shared_lock:
+        _shared.pop(id(connection), None)
+
+
+def clear_caches(connection: sqlite3.Connection) -> None:
+    """
+    Empties every shared cache of this connection (writes that touch
+    more than one table, e.g. closing a venue deactivates its events).
+    """
+    with _shared_lock:
+        entry = _shared.get(id(connection))
+        caches = list(entry[1].values()) if entry is not None and entry[0] is connection else []
+    for cache in caches:
+        cache.clear()
+
+
+def cache_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Counters of all shared caches, summed per name (e.g. "venues").
+    """
+    with _shared_lock:
+        caches = [(name, cache) for _, named in _shared.values() for name, cache in named.items()]
+
+    totals: Dict[str, CacheStats] = {}
+    sizes: Dict[str, int] = {}
+    for name, cache in caches:
+        total = totals.setdefault(name, CacheStats())
+        for field in CacheStats.__slots__:
+            setattr(total, field, getattr(total, field) + getattr(cache.stats, field))
+        sizes[name] = sizes.get(name, 0) + len(cache)
+    return {name: dict(total.to_dict(), size=sizes[name]) for name, total in sorted(totals.items())}
@@ -1,12 +1,14 @@
 import sqlite3
+from typing import Callable, List, Optional, Tuple
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
-def initialize_database(conn: sqlite3.Connection):
-    
-    cursor = conn.cursor()
-
+def _migration_1_initial_tables(cursor: sqlite3.Cursor):
+    """
+    v1 – the original four tables (IF NOT EXISTS, so databases created
+    before versioning are adopted in place).
+    """
     # Venue
     cursor.execute(
         """
@@ -74,5 +76,119 @@ def initialize_database(conn: sqlite3.Connection):
         """
     )
 
-    conn.commit()
-    logger.info("Database schema initialized successfully.")
+
+def _migration_2_secondary_indexes(cursor: sqlite3.Cursor):
+    """
+    v2 – secondary indexes for the foreign keys and common lookups.
+    ux_tickets_event_seat also serves lookups by tickets.event_id
+    (leftmost column), so no separate event_id index is needed.
+    """
+    duplicates = cursor.execute(
+        """
+        SELECT COUNT(*) FROM (
+            SELECT 1 FROM tickets
+            GROUP BY event_id, seat_number
+            HAVING COUNT(*) > 1
+        )
+        """
+    ).fetchone()[0]
+    if duplicates:
+        raise sqlite3.IntegrityError(
+            f"Cannot create unique seat index: {duplicates} (event_id, seat_number) "
+            "pairs are sold more than once. Fix these tickets and restart."
+        )
+
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_tickets_event_seat "
+        "ON tickets (event_id, seat_number)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tickets_participant_id "
+        "ON tickets (participant_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_venue_id ON events (venue_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_date ON events (date)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_participants_email ON participants (email)"
+    )
+
+
+def _migration_3_pagination_indexes(cursor: sqlite3.Cursor):
+    """
+    v3 – composite indexes matching the keyset pagination sort keys,
+    so every page is a single index seek. idx_events_date is a prefix
+    of the new events index and is dropped.
+    """
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_venues_name_id ON venues (name, id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_date_time_id "
+        "ON events (date, time, id)"
+    )
+    cursor.execute("DROP INDEX IF EXISTS idx_events_date")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_participants_full_name_id "
+        "ON participants (full_name, id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tickets_purchase_date_id "
+        "ON tickets (purchase_date, id)"
+    )
+
+
+# (version, description, migration) – append only, never renumber.
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, "initial tables", _migration_1_initial_tables),
+    (2, "secondary indexes", _migration_2_secondary_indexes),
+    (3, "pagination indexes", _migration_3_pagination_indexes),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, target: Optional[int] = None) -> int:
+    """
+    Applies every pending migration up to `target` (default: latest).
+    Each migration runs in its own transaction together with the
+    PRAGMA user_version bump, so a failed step leaves the database
+    at the previous version. Returns the resulting schema version.
+    """
+    target = LATEST_VERSION if target is None else target
+    current = get_schema_version(conn)
+
+    if conn.in_transaction:
+        conn.commit()
+
+    for version, description, apply in MIGRATIONS:
+        if version <= current or version > target:
+            continue
+
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            apply(cursor)
+            cursor.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logger.error("Migration %d (%s) failed.", version, description)
+            raise
+
+        current = version
+        logger.info("Migration applied: v%d – %s", version, description)
+
+    return current
+
+
+def initialize_database(conn: sqlite3.Connection):
+    version = migrate(conn)
+    logger.info("Database schema initialized successfully (version %d).", version)
@@ -0,0 +1,81 @@
+import sqlite3
+from typing import Callable, Dict, List
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# id(connection) -> nesting depth of currently open units
+_active_units: Dict[int, int] = {}
+# id(connection) -> callbacks to run if the open unit rolls back
+_rollback_hooks: Dict[int, List[Callable[[], None]]] = {}
+
+
+def in_unit_of_work(connection: sqlite3.Connection) -> bool:
+    """
+    True if a UnitOfWork is currently open on this connection.
+    Repositories use it to skip their own commits.
+    """
+    return id(connection) in _active_units
+
+
+def on_rollback(connection: sqlite3.Connection, hook: Callable[[], None]) -> None:
+    """
+    Registers a callback that undoes in-memory side effects
+    (e.g. a claimed seat) if the open unit rolls back.
+    Outside a unit of work nothing is registered.
+    """
+    if in_unit_of_work(connection):
+        _rollback_hooks.setdefault(id(connection), []).append(hook)
+
+
+class UnitOfWork:
+    """
+    Unit of Work pattern – groups several repository/service calls
+    into one transaction.
+
+    While a unit is open, repositories do not commit; the whole unit
+    commits once on success or rolls back on any exception.
+    Units can be nested: only the outermost one commits.
+    immediate=True takes the write lock up front (BEGIN IMMEDIATE), so
+    a unit that reads before it writes cannot hit SQLITE_BUSY on the
+    upgrade.
+
+        with UnitOfWork(conn):
+            service.sell_ticket(...)
+            service.sell_ticket(...)
+    """
+
+    def __init__(self, connection: sqlite3.Connection, immediate: bool = False):
+        self._conn = connection
+        self._key = id(connection)
+        self._immediate = immediate
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __enter__(self) -> "UnitOfWork":
+        depth = _active_units.get(self._key, 0)
+        if depth == 0 and not self._conn.in_transaction:
+            self._conn.execute("BEGIN IMMEDIATE" if self._immediate else "BEGIN")
+        _active_units[self._key] = depth + 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        depth = _active_units[self._key] - 1
+        if depth > 0:
+            # inner unit – outer one decides commit/rollback
+            _active_units[self._key] = depth
+            return False
+
+        del _active_units[self._key]
+        hooks = _rollback_hooks.pop(self._key, [])
+        if exc_type is None:
+            self._conn.commit()
+        else:
+            self._conn.rollback()
+            for hook in reversed(hooks):
+                hook()
+            logger.warning("Unit of work rolled back: %s", exc)
+        return False
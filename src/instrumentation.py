@@ -0,0 +1,392 @@
+# src/instrumentation.py
+"""
+Per-operation latency metrics for services, repositories and SQL.
+
+    enable_metrics()                 # wraps service/repository methods
+    ...                              # connections opened from now on time SQL
+    print(format_metrics())          # text dump
+    write_prometheus("metrics.prom") # Prometheus text format
+
+Off by default. While disabled nothing is wrapped and connections are
+plain sqlite3.Connection objects, so the hot path pays nothing.
+"""
+import functools
+import inspect
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .utils.histogram import BUCKET_BOUNDS, LatencyHistogram
+
+# metric kinds
+OPERATION = "operation"
+SQL = "sql"
+
+# never timed: transaction helpers and cheap accessors
+_SKIPPED_METHODS = {"unit_of_work", "on_rollback", "column_names"}
+
+_SQL_KEY_LIMIT = 2048
+
+# every 4th histogram bound (10 µs ... ~95 s, ratio ~2.4): the same
+# `le` series for every metric on every scrape, so rate() and
+# histogram_quantile() can aggregate across series
+PROMETHEUS_BUCKETS = BUCKET_BOUNDS[::4]
+
+
+class OperationStats:
+    """
+    Count, error count and latency histogram of one operation.
+    """
+
+    __slots__ = ("errors", "histogram")
+
+    def __init__(self):
+        self.errors = 0
+        self.histogram = LatencyHistogram()
+
+    @property
+    def count(self) -> int:
+        return self.histogram.count
+
+    def snapshot(self) -> dict:
+        return dict(self.histogram.snapshot(), errors=self.errors)
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of OperationStats per (kind, name).
+    """
+
+    def __init__(self):
+        self._stats: Dict[tuple, OperationStats] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def stats(self, kind: str, name: str) -> OperationStats:
+        key = (kind, name)
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(key, OperationStats())
+        return stats
+
+    def record(self, kind: str, name: str, seconds: float, failed: bool = False) -> None:
+        stats = self.stats(kind, name)
+        stats.histogram.record(seconds)
+        if failed:
+            stats.errors += 1
+
+    def items(self, kind: Optional[str] = None) -> List[tuple]:
+        with self._lock:
+            items = sorted(self._stats.items())
+        return [(k, name, stats) for (k, name), stats in items if kind in (None, k)]
+
+    def snapshot(self) -> dict:
+        result = {"operations": {}, "sql": {}}
+        for kind, name, stats in self.items():
+            result["operations" if kind == OPERATION else "sql"][name] = stats.snapshot()
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+        self.started = time.time()
+
+
+REGISTRY = MetricsRegistry()
+
+_enabled = False
+_wrapped: Dict[tuple, object] = {}   # (class, name) -> original in cls.__dict__ (or None)
+
+
+def metrics_enabled() -> bool:
+    return _enabled
+
+
+# ---------- SQL timing ---------- #
+
+_PLACEHOLDER_LIST = re.compile(r"\?(\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=_SQL_KEY_LIMIT)
+def statement_key(sql: str) -> str:
+    """
+    Metric name of a statement: whitespace collapsed and variable
+    placeholder lists ("IN (?, ?, ?)") folded, so one statement shape
+    is one metric.
+    """
+    return _PLACEHOLDER_LIST.sub("?, ...", _WHITESPACE.sub(" ", sql).strip())
+
+
+class TimedCursor(sqlite3.Cursor):
+    """
+    Cursor that records execute()/executemany() time per statement.
+    For SELECTs that is the time to the first row.
+    """
+
+    def execute(self, sql, parameters=()):
+        if not _enabled:
+            return super().execute(sql, parameters)
+        started = time.perf_counter()
+        try:
+            result = super().execute(sql, parameters)
+        except BaseException:
+            REGISTRY.record(SQL, statement_key(sql), time.perf_counter() - started, True)
+            raise
+        REGISTRY.record(SQL, statement_key(sql), time.perf_counter() - started)
+        return result
+
+    def executemany(self, sql, seq_of_parameters):
+        if not _enabled:
+            return super().executemany(sql, seq_of_parameters)
+        started = time.perf_counter()
+        try:
+            result = super().executemany(sql, seq_of_parameters)
+        except BaseException:
+            REGISTRY.record(SQL, statement_key(sql), time.perf_counter() - started, True)
+            raise
+        REGISTRY.record(SQL, statement_key(sql), time.perf_counter() - started)
+        return result
+
+
+class TimedConnection(sqlite3.Connection):
+    """
+    Connection whose cursors (including the ones behind
+    Connection.execute) are TimedCursors.
+    """
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connection_factory() -> type:
+    """
+    sqlite3.connect(factory=...) for new connections: timed only
+    while metrics are enabled.
+    """
+    return TimedConnection if _enabled else sqlite3.Connection
+
+
+# ---------- Method wrapping ---------- #
+
+def _timed(function, name: str):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException:
+            REGISTRY.record(OPERATION, name, time.perf_counter() - started, True)
+            raise
+        REGISTRY.record(OPERATION, name, time.perf_counter() - started)
+        return result
+
+    return wrapper
+
+
+def _timed_generator(function, name: str):
+    """
+    Streaming methods (iter_all, iter_rows_since, ...): times only the
+    work done inside the generator – not the consumer's time between
+    items – and records once it is exhausted, fails or is closed.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        generator = function(*args, **kwargs)
+        elapsed = 0.0
+        failed = False
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = next(generator)
+                except StopIteration as stop:
+                    return stop.value
+                except BaseException:
+                    failed = True
+                    raise
+                finally:
+                    elapsed += time.perf_counter() - started
+                yield item
+        finally:
+            generator.close()
+            REGISTRY.record(OPERATION, name, elapsed, failed)
+
+    return wrapper
+
+
+def instrument(classes: Iterable[type]) -> None:
+    """
+    Replaces the public methods of each class (inherited ones
+    included) with timed wrappers named "<Class>.<method>".
+    Generator methods get _timed_generator; properties and
+    static/class methods are left alone.
+    """
+    for cls in classes:
+        for name in dir(cls):
+            if name.startswith("_") or name in _SKIPPED_METHODS or (cls, name) in _wrapped:
+                continue
+            function = inspect.getattr_static(cls, name)
+            if not inspect.isfunction(function):
+                continue
+            timed = _timed_generator if inspect.isgeneratorfunction(function) else _timed
+            _wrapped[(cls, name)] = cls.__dict__.get(name)
+            setattr(cls, name, timed(function, f"{cls.__name__}.{name}"))
+
+
+def uninstrument() -> None:
+    """
+    Puts every original method back.
+    """
+    for (cls, name), original in _wrapped.items():
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+    _wrapped.clear()
+
+
+def default_classes() -> List[type]:
+    # imported here: services/repositories import the database layer,
+    # which imports this module
+    from .repositories.event_repository import EventRepository
+    from .repositories.participant_repository import ParticipantRepository
+    from .repositories.ticket_repository import TicketRepository
+    from .repositories.venue_repository import VenueRepository
+    from .services.checkin.check_in_service import CheckInService
+    from .services.event_service import EventService
+    from .services.inventory.seat_inventory import SeatInventory
+    from .services.participant_service import ParticipantService
+    from .services.ticket_service import TicketService
+    from .services.venue_service import VenueService
+
+    return [
+        VenueRepository, EventRepository, ParticipantRepository, TicketRepository,
+        VenueService, EventService, ParticipantService, TicketService,
+        SeatInventory, CheckInService,
+    ]
+
+
+def enable_metrics(classes: Optional[Iterable[type]] = None) -> None:
+    """
+    Starts collecting: wraps the service/repository methods and makes
+    connections opened from now on time their SQL.
+    """
+    global _enabled
+    if _enabled:
+        return
+    instrument(default_classes() if classes is None else classes)
+    _enabled = True
+
+
+def disable_metrics() -> None:
+    """
+    Stops collecting and removes every wrapper (collected data is kept).
+    """
+    global _enabled
+    _enabled = False
+    uninstrument()
+
+
+# ---------- Output ---------- #
+
+def format_metrics(registry: MetricsRegistry = REGISTRY) -> str:
+    """
+    Human-readable dump, slowest total time first.
+    """
+    lines = []
+    for kind, title in ((OPERATION, "Operations"), (SQL, "SQL statements")):
+        items = registry.items(kind)
+        if not items:
+            continue
+        items.sort(key=lambda item: item[2].histogram.total, reverse=True)
+        lines.append(
+            f"{title:<60} {'count':>8} {'errors':>6} {'total ms':>10} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for _, name, stats in items:
+            snapshot = stats.snapshot()
+            label = name if len(name) <= 60 else name[:57] + "..."
+            lines.append(
+                f"{label:<60} {snapshot['count']:>8} {snapshot['errors']:>6} "
+                f"{stats.histogram.total * 1000:>10.1f} {snapshot['p50_ms']:>8.3f} "
+                f"{snapshot['p95_ms']:>8.3f} {snapshot['p99_ms']:>8.3f}"
+            )
+        lines.append("")
+    return "\n".join(lines) if lines else "No metrics recorded."
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", " ").replace('"', '\\"')
+
+
+def prometheus_text(registry: MetricsRegistry = REGISTRY) -> str:
+    """
+    Prometheus text exposition format (histograms in seconds plus an
+    error counter per operation / statement).
+    """
+    lines = []
+    for kind, metric in ((OPERATION, "event_mgmt_operation"), (SQL, "event_mgmt_sql")):
+        label = "operation" if kind == OPERATION else "statement"
+        items = registry.items(kind)
+        lines.append(f"# HELP {metric}_duration_seconds Latency of each {label}.")
+        lines.append(f"# TYPE {metric}_duration_seconds histogram")
+        for _, name, stats in items:
+            key = f'{label}="{_label(name)}"'
+            for bound, cumulative in stats.histogram.cumulative_buckets(PROMETHEUS_BUCKETS):
+                lines.append(f'{metric}_duration_seconds_bucket{{{key},le="{bound:.6g}"}} {cumulative}')
+            lines.append(f'{metric}_duration_seconds_bucket{{{key},le="+Inf"}} {stats.count}')
+            lines.append(f"{metric}_duration_seconds_sum{{{key}}} {stats.histogram.total:.9f}")
+            lines.append(f"{metric}_duration_seconds_count{{{key}}} {stats.count}")
+        lines.append(f"# HELP {metric}_errors_total Failed calls of each {label}.")
+        lines.append(f"# TYPE {metric}_errors_total counter")
+        for _, name, stats in items:
+            lines.append(f'{metric}_errors_total{{{label}="{_label(name)}"}} {stats.errors}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str, registry: MetricsRegistry = REGISTRY) -> None:
+    """
+    Writes the metrics atomically (temp file + rename), e.g. for the
+    node_exporter textfile collector.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(prometheus_text(registry))
+    os.replace(tmp_path, path)
+
+
+class PrometheusFileWriter:
+    """
+    Rewrites a Prometheus text file every `interval` seconds from a
+    background thread (and once more on stop).
+    """
+
+    def __init__(self, path: str, interval: float = 15.0, registry: MetricsRegistry = REGISTRY):
+        self.path = path
+        self._interval = interval
+        self._registry = registry
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            write_prometheus(self.path, self._registry)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        write_prometheus(self.path, self._registry)
@@ -1,28 +1,272 @@
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
+from typing import Dict, Optional
 
 LOG_FILE = Path("logs/app.log")
 LOG_FILE.parent.mkdir(exist_ok=True)
 
-def setup_logging():
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024     # 10 MiB, sonra app.log.1, app.log.2 ...
+DEFAULT_BACKUP_COUNT = 5
+DEFAULT_QUEUE_SIZE = 10000
+
+# Hər satış / siyahı üçün yazılan yüksək həcmli mesajlar (sampling üçün).
+HIGH_VOLUME_MESSAGES = (
+    "Ticket sold:",
+    "Ticket reserved:",
+    "Retrieved ",
+    "Streamed ",
+)
+
+_writer: Optional["BackgroundLogWriter"] = None
+
+# LogRecord-un standart atributları – qalanları `extra=` ilə gəlib.
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_TRACEBACKS = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: ts, level, logger, message, plus any
+    `extra=` fields and the exception text.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                data[key] = value
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc_info"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps 1 of every N records whose message template starts with a
+    configured prefix, e.g. {"Ticket sold:": 100}. WARNING and above
+    are never sampled out.
+    """
+
+    def __init__(self, rates: Dict[str, int]):
+        super().__init__()
+        self._rates = {prefix: rate for prefix, rate in rates.items() if rate > 1}
+        self._counters = dict.fromkeys(self._rates, 0)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not isinstance(record.msg, str):
+            return True
+        for prefix, rate in self._rates.items():
+            if record.msg.startswith(prefix):
+                count = self._counters[prefix]
+                self._counters[prefix] = count + 1
+                return count % rate == 0
+        return True
+
+
+class SizeRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size in memory instead of
+    seek()/tell() + formatting every record twice (stdlib behaviour).
+    With autoflush=False the caller decides when to flush (the
+    background writer flushes once per drained batch).
+    """
+
+    def __init__(self, filename, max_bytes: int, backup_count: int, autoflush: bool = True):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self._autoflush = autoflush
+        self._size = os.path.getsize(filename) if os.path.exists(filename) else 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            # bytes, not characters – Azerbaijani text is multi-byte in UTF-8
+            size = len(msg.encode(self.encoding or "utf-8"))
+            if self.maxBytes and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                self._size = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if self._autoflush:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Never blocks the caller: when the queue is full the record is
+    dropped and counted instead. Message formatting is left to the
+    writer thread (log args here are ids/numbers, not mutable objects).
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            # tracebacks hold frames – render them now, in the caller
+            record = copy.copy(record)
+            record.exc_text = _TRACEBACKS.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BackgroundLogWriter:
+    """
+    Background thread that writes queued records into one handler.
+    Every `interval` seconds it drains the whole queue and flushes
+    once, so under load the callers' put() does not wake the thread
+    for every record.
+    """
+
+    _STOP = object()
+
+    def __init__(self, log_queue: queue.Queue, handler: logging.Handler, interval: float = 0.05):
+        self._queue = log_queue
+        self.handler = handler
+        self._interval = interval
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            stop = self._drain()
+            self.handler.flush()
+            if stop:
+                return
+            self._stopping.wait(self._interval)
+
+    def _drain(self) -> bool:
+        """
+        Writes everything queued so far; True once the stop marker is seen.
+        """
+        record = self._queue.get()
+        while record is not self._STOP:
+            if record.levelno >= self.handler.level:
+                self.handler.handle(record)
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                return False
+        return True
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self.handler.close()
+
+
+def setup_logging(
+    use_queue: bool = False,
+    json_format: bool = False,
+    sample_rate: int = 1,
+    sampling: Optional[Dict[str, int]] = None,
+    log_file: Path = LOG_FILE,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    lean_records: bool = False
+):
+    """
+    - use_queue    : loggers only put records on a bounded queue; a
+                     background thread formats and writes them in batches
+    - json_format  : structured JSON lines instead of plain text
+    - sample_rate  : keep 1 of N HIGH_VOLUME_MESSAGES (1 = keep all);
+                     `sampling` sets per-prefix rates explicitly
+    - lean_records : skip the caller / thread / process lookups for
+                     every LogRecord. Process-wide: %(funcName)s,
+                     %(lineno)d, %(threadName)s ... become empty for
+                     every library, so only for processes whose
+                     handlers are all configured here.
+    The file rotates at max_bytes (backup_count old files are kept).
+    """
+    if lean_records:
+        # Formatlar fayl/sətir/thread/proses məlumatından istifadə etmir –
+        # hər LogRecord üçün stack-i gəzməyə ehtiyac yoxdur (logging HOWTO, "Optimization").
+        logging._srcfile = None
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
     # Root logger-i götür
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
 
-    # Köhnə handler-ləri tam sil
+    # Köhnə handler-ləri tam sil (və köhnə writer thread-i dayandır)
+    shutdown_logging()
     if logger.handlers:
         logger.handlers.clear()
 
-    # Yalnız FILE handler
-    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    # Yalnız FILE handler (ölçüyə görə rotasiya)
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    file_handler = SizeRotatingFileHandler(
+        log_file, max_bytes, backup_count, autoflush=not use_queue
+    )
     file_handler.setLevel(logging.INFO)
 
-    formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
-    )
+    if json_format:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+        )
     file_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
+    if sampling is None:
+        sampling = dict.fromkeys(HIGH_VOLUME_MESSAGES, sample_rate)
+
+    if use_queue:
+        global _writer
+        handler = DroppingQueueHandler(queue.Queue(queue_size))
+        _writer = BackgroundLogWriter(handler.queue, file_handler)
+        _writer.start()
+    else:
+        handler = file_handler
+
+    # sampling on the caller side – dropped records are never queued/written
+    handler.addFilter(SamplingFilter(sampling))
+    logger.addHandler(handler)
+
+def shutdown_logging():
+    """
+    Writes out queued records and stops the background writer.
+    Safe to call more than once; registered with atexit.
+    """
+    global _writer
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
+atexit.register(shutdown_logging)
 
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
@@ -1,24 +1,81 @@
+import argparse
+
 from .logging_config import setup_logging, get_logger
-from .database.connection import DatabaseConnection
+from .instrumentation import enable_metrics, format_metrics, write_prometheus
+from .database.connection import DatabaseConnection, CONNECTION_PROFILES, DEFAULT_PROFILE
 from .database.schema import initialize_database
 from .controllers.cli_controller import CLIController
+from .controllers.batch_controller import BatchController, DEFAULT_CHUNK_SIZE
 
 logger = get_logger(__name__)
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Event Management System")
+    parser.add_argument(
+        "--db",
+        default="event_management.db",
+        help="SQLite database file (default: event_management.db)"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(CONNECTION_PROFILES),
+        default=DEFAULT_PROFILE,
+        help=f"Connection PRAGMA profile (default: {DEFAULT_PROFILE})"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run a JSONL/CSV command script instead of the interactive menu"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Commands per transaction in batch mode (default: {DEFAULT_CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Time every service/repository call and SQL statement; print the table on exit"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="FILE",
+        help="Also write the metrics in Prometheus text format to FILE on exit"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
     setup_logging()
     logger.info("Starting Event Management System...")
 
-    db = DatabaseConnection()
+    if args.metrics or args.metrics_file:
+        enable_metrics()
+
+    db = DatabaseConnection(args.db, profile=args.profile)
     conn = db.connection
 
     initialize_database(conn)
 
-    controller = CLIController(conn)
-    controller.run()
+    if args.batch:
+        report = BatchController(conn, args.chunk_size).run(args.batch)
+        print(report.summary())
+    else:
+        controller = CLIController(conn)
+        controller.run()
 
     db.close()
     logger.info("Application stopped.")
 
+    if args.metrics:
+        print(format_metrics())
+    if args.metrics_file:
+        write_prometheus(args.metrics_file)
+
+    if args.batch and report.failed:
+        raise SystemExit(1)
+
 if __name__ == "__main__":
     main()
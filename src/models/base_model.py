@@ -4,7 +4,12 @@ import uuid
 class BaseModel(ABC):
     """
     Abstraction + Encapsulation
+
+    Models use __slots__ (no per-instance __dict__) so that large
+    numbers of hydrated rows stay compact in memory.
     """
+    __slots__ = ("_id",)
+
     def __init__(self, id: str | None = None):
         self._id = id or str(uuid.uuid4())
 
@@ -1,6 +1,17 @@
 from .base_model import BaseModel
 
 class Event(BaseModel):
+    __slots__ = (
+        "_name",
+        "_date",
+        "_time",
+        "_category",
+        "_description",
+        "_duration_minutes",
+        "_venue_id",
+        "_is_active",
+    )
+
     def __init__(
         self,
         name: str,
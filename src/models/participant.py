@@ -1,6 +1,16 @@
 from .base_model import BaseModel
 
 class Participant(BaseModel):
+    __slots__ = (
+        "_full_name",
+        "_email",
+        "_phone",
+        "_age",
+        "_gender",
+        "_registration_date",
+        "_is_vip",
+    )
+
     def __init__(
         self,
         full_name: str,
@@ -1,6 +1,16 @@
 from .base_model import BaseModel
 
 class Ticket(BaseModel):
+    __slots__ = (
+        "_event_id",
+        "_participant_id",
+        "_price",
+        "_seat_number",
+        "_ticket_type",
+        "_purchase_date",
+        "_is_used",
+    )
+
     def __init__(
         self,
         event_id: str,
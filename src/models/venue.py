@@ -1,6 +1,15 @@
 from .base_model import BaseModel
 
 class Venue(BaseModel):
+    __slots__ = (
+        "_name",
+        "_address",
+        "_capacity",
+        "_manager_name",
+        "_phone",
+        "_is_open",
+    )
+
     def __init__(
         self,
         name: str,
@@ -1,8 +1,267 @@
 import sqlite3
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+from ..database.unit_of_work import UnitOfWork, in_unit_of_work, on_rollback
+from .pagination import (
+    DEFAULT_PAGE_SIZE,
+    NEXT,
+    PREV,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    validate_page_size,
+)
 from ..logging_config import get_logger
+from ..utils.validators import validate_record
 
 logger = get_logger(__name__)
 
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_BATCH_SIZE = 500
+
+
 class BaseRepository:
+    # Subclasses define these:
+    #   _SELECT_SQL – "SELECT <all columns> FROM <table>"
+    #   _PAGE_ORDER – unique sort key for keyset pagination (ends with id)
+    #   _from_row   – row tuple -> model
+    #   _WATERMARKS – columns usable for incremental export (indexed)
+    #   _TABLE      – table name, _PATCHABLE – columns patch() may set
+    #   _KIND       – RECORD_VALIDATORS key used to check patched values
+    _SELECT_SQL: str = ""
+    _TABLE: str = ""
+    _KIND: str = ""
+    _PATCHABLE: Tuple[str, ...] = ()
+    _PAGE_ORDER: Tuple[str, ...] = ("id",)
+    _WATERMARKS: Tuple[str, ...] = ("rowid",)
+
     def __init__(self, connection: sqlite3.Connection):
         self._conn = connection
+
+    def unit_of_work(self) -> UnitOfWork:
+        """
+        Opens a transaction shared by every repository on this connection.
+        """
+        return UnitOfWork(self._conn)
+
+    def on_rollback(self, hook) -> None:
+        """
+        Runs hook if the currently open unit of work rolls back.
+        """
+        on_rollback(self._conn, hook)
+
+    def _commit(self) -> None:
+        # Inside a unit of work the unit commits once at the end.
+        if not in_unit_of_work(self._conn):
+            self._conn.commit()
+
+    def _executemany_chunked(
+        self,
+        sql: str,
+        rows: Iterable[Sequence],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Streams rows through executemany in chunks of chunk_size,
+        all inside ONE transaction (one commit at the end).
+        Rolls back everything if any chunk fails; inside an open
+        unit of work the unit itself commits / rolls back.
+        Returns the number of inserted rows.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+
+        cursor = self._conn.cursor()
+        iterator = iter(rows)
+        total = 0
+        try:
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                cursor.executemany(sql, chunk)
+                total += len(chunk)
+            self._commit()
+        except Exception:
+            if not in_unit_of_work(self._conn):
+                self._conn.rollback()
+            raise
+        return total
+
+    def _iter_rows(
+        self,
+        sql: str,
+        params: Sequence = (),
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[tuple]:
+        """
+        Yields rows of a SELECT using fetchmany(batch_size),
+        never holding more than one batch in memory.
+        """
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive.")
+
+        cursor = self._conn.cursor()
+        cursor.execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    # ---------- Partial updates ---------- #
+
+    def patch(self, model_id: str, **fields: Any) -> int:
+        """
+        Sets only the given columns of one row with a single
+        UPDATE ... WHERE id = ? (no SELECT first), e.g.
+        patch(ticket_id, is_used=True). Returns the rowcount –
+        0 means the id does not exist.
+        """
+        return self._patch_where(fields, "id = ?", (model_id,))
+
+    def _patch_where(
+        self,
+        fields: Mapping[str, Any],
+        where: str,
+        params: Sequence = ()
+    ) -> int:
+        """
+        Set-based patch: one UPDATE for every row matching `where`.
+        Column names are checked against _PATCHABLE, values are
+        validated / normalized with RECORD_VALIDATORS and bound.
+        """
+        if not fields:
+            raise ValueError("No fields to update.")
+        unknown = [column for column in fields if column not in self._PATCHABLE]
+        if unknown:
+            raise ValueError(
+                f"Cannot update field(s): {', '.join(unknown)}. "
+                f"Allowed: {', '.join(self._PATCHABLE)}"
+            )
+        if self._KIND:
+            fields = validate_record(self._KIND, fields)
+
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        values = [int(value) if isinstance(value, bool) else value for value in fields.values()]
+        cursor = self._conn.cursor()
+        cursor.execute(
+            f"UPDATE {self._TABLE} SET {assignments} WHERE {where}",
+            (*values, *params)
+        )
+        self._commit()
+        return cursor.rowcount
+
+    # ---------- Raw export ---------- #
+
+    def column_names(self) -> list:
+        cursor = self._conn.execute(f"{self._SELECT_SQL} LIMIT 0")
+        return [column[0] for column in cursor.description]
+
+    def iter_rows_since(
+        self,
+        watermark: str = "rowid",
+        since: Optional[Any] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        inclusive: bool = False
+    ) -> Iterator[tuple]:
+        """
+        Raw row tuples for exports (no model objects): the watermark
+        value first, then the columns of _SELECT_SQL, ordered by the
+        watermark and limited to watermark > since (>= if inclusive).
+
+        Note: rowid is exact but may be renumbered by VACUUM; date
+        watermarks are stable but day-granular – rows added later on
+        the `since` day need inclusive=True (the caller skips the ids
+        it already has).
+        """
+        if watermark not in self._WATERMARKS:
+            raise ValueError(
+                f"Unsupported watermark '{watermark}'. "
+                f"Available: {', '.join(self._WATERMARKS)}"
+            )
+
+        select = self._SELECT_SQL.replace("SELECT", f"SELECT {watermark},", 1)
+        op = ">=" if inclusive else ">"
+        where, params = ("", ()) if since is None else (f" WHERE {watermark} {op} ?", (since,))
+        order_by = watermark if watermark == "rowid" else f"{watermark}, id"
+        yield from self._iter_rows(
+            f"{select}{where} ORDER BY {order_by}", params, batch_size
+        )
+
+    # ---------- Keyset pagination ---------- #
+
+    def get_page(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        start_at: Optional[Any] = None
+    ) -> Page:
+        """
+        Seek-based pagination ordered by _PAGE_ORDER.
+
+        - cursor   : token from a previous Page (next_cursor / prev_cursor)
+        - start_at : jump to the first row whose leading sort column
+                     is >= start_at (e.g. a name prefix)
+
+        Every page is one index seek + LIMIT, so the cost does not
+        grow with the page number.
+        """
+        validate_page_size(page_size)
+        order = self._PAGE_ORDER
+        columns = ", ".join(order)
+        placeholders = ", ".join("?" for _ in order)
+
+        direction = NEXT
+        if cursor is not None:
+            direction, key = decode_cursor(cursor, len(order))
+            op = ">" if direction == NEXT else "<"
+            where = f" WHERE ({columns}) {op} ({placeholders})"
+            params: Sequence = key
+        elif start_at is not None:
+            where = f" WHERE {order[0]} >= ?"
+            params = (start_at,)
+        else:
+            where = ""
+            params = ()
+
+        sort = "ASC" if direction == NEXT else "DESC"
+        order_by = ", ".join(f"{col} {sort}" for col in order)
+        sql = f"{self._SELECT_SQL}{where} ORDER BY {order_by} LIMIT ?"
+
+        rows = self._conn.execute(sql, (*params, page_size + 1)).fetchall()
+        has_more = len(rows) > page_size
+        items = [self._from_row(row) for row in rows[:page_size]]
+
+        if direction == PREV:
+            items.reverse()
+            has_next, has_prev = True, has_more
+        elif cursor is not None:
+            has_next, has_prev = has_more, True
+        elif start_at is not None:
+            has_next = has_more
+            has_prev = bool(items) and self._exists_before(items[0])
+        else:
+            has_next, has_prev = has_more, False
+
+        if not items:
+            return Page([])
+
+        return Page(
+            items,
+            next_cursor=encode_cursor(NEXT, self._page_key(items[-1])) if has_next else None,
+            prev_cursor=encode_cursor(PREV, self._page_key(items[0])) if has_prev else None,
+        )
+
+    def _page_key(self, model) -> list:
+        return [getattr(model, col) for col in self._PAGE_ORDER]
+
+    def _exists_before(self, model) -> bool:
+        order = self._PAGE_ORDER
+        columns = ", ".join(order)
+        placeholders = ", ".join("?" for _ in order)
+        sql = f"{self._SELECT_SQL} WHERE ({columns}) < ({placeholders}) LIMIT 1"
+        return self._conn.execute(sql, self._page_key(model)).fetchone() is not None
@@ -0,0 +1,151 @@
+from typing import Any, Optional
+
+from ..database.row_cache import DEFAULT_MAX_SIZE, DEFAULT_TTL, RowCache, clear_caches, shared_cache
+from .base_repository import BaseRepository
+
+# delegated methods that change many rows (possibly of other tables) –
+# every cache of the connection is dropped
+_BULK_WRITES = {"add_many", "update_prices", "mark_event_used", "close"}
+
+
+class CachedRepository:
+    """
+    Read-through cache in front of a repository (Decorator pattern):
+    same interface, but get_by_id is answered from a RowCache.
+
+    - update / patch / delete_by_id / add / reserve / use_ticket(s)
+      evict the affected ids
+      (write-through invalidation); bulk writes clear the cache
+    - inside a unit of work a rollback clears the cache as well
+    - changes committed by other connections/processes are detected
+      with PRAGMA data_version (see RowCache)
+
+    Rows are cached, not model objects: every get_by_id returns a new
+    model, so a caller that edits a model and then fails validation
+    cannot leave a modified object in the cache.
+
+        venues = CachedRepository(VenueRepository(conn))
+        service = VenueService(venues)
+    """
+
+    def __init__(
+        self,
+        repository: BaseRepository,
+        cache: Optional[RowCache] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL
+    ):
+        self._repository = repository
+        self._cache = cache if cache is not None else RowCache(repository._conn, max_size, ttl)
+
+    @property
+    def repository(self) -> BaseRepository:
+        return self._repository
+
+    @property
+    def cache(self) -> RowCache:
+        return self._cache
+
+    @property
+    def stats(self):
+        return self._cache.stats
+
+    # ---------- Reads ---------- #
+
+    def get_by_id(self, model_id: str):
+        row = self._cache.get(model_id)
+        if row is not None:
+            return self._repository._from_row(row)
+
+        model = self._repository.get_by_id(model_id)
+        if model is not None:
+            self._cache.put(model_id, self._repository._to_row(model))
+        return model
+
+    # ---------- Writes (write-through invalidation) ---------- #
+
+    def _written(self, model_id: str) -> None:
+        self._cache.discard(model_id)
+        # a rolled-back unit may have cached its own uncommitted rows
+        self._repository.on_rollback(self._cache.clear)
+
+    def add(self, model) -> None:
+        try:
+            self._repository.add(model)
+        finally:
+            self._written(model.id)
+
+    def reserve(self, model) -> None:
+        try:
+            self._repository.reserve(model)
+        finally:
+            self._written(model.id)
+
+    def update(self, model) -> None:
+        try:
+            self._repository.update(model)
+        finally:
+            self._written(model.id)
+
+    def patch(self, model_id: str, **fields) -> int:
+        try:
+            return self._repository.patch(model_id, **fields)
+        finally:
+            self._written(model_id)
+
+    def use_ticket(self, ticket_id: str, event_id: Optional[str] = None) -> bool:
+        try:
+            return self._repository.use_ticket(ticket_id, event_id)
+        finally:
+            self._written(ticket_id)
+
+    def use_tickets(self, ticket_ids, event_id: Optional[str] = None) -> dict:
+        ids = list(ticket_ids)
+        try:
+            return self._repository.use_tickets(ids, event_id)
+        finally:
+            for ticket_id in ids:
+                self._cache.discard(ticket_id)
+            self._repository.on_rollback(self._cache.clear)
+
+    def delete_by_id(self, model_id: str) -> bool:
+        try:
+            return self._repository.delete_by_id(model_id)
+        finally:
+            self._written(model_id)
+
+    def invalidate(self, model_id: Optional[str] = None) -> None:
+        """
+        For writes that bypass this wrapper (raw SQL on the same connection).
+        """
+        if model_id is None:
+            self._cache.clear()
+        else:
+            self._cache.discard(model_id)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if name not in _BULK_WRITES:
+            return attribute
+
+        def clear():
+            self._cache.clear()
+            clear_caches(self._repository._conn)
+
+        def bulk_write(*args, **kwargs):
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                clear()
+                self._repository.on_rollback(clear)
+
+        return bulk_write
+
+
+def cached(repository: BaseRepository, **options) -> CachedRepository:
+    """
+    CachedRepository sharing one cache per connection and table, so
+    repositories created per request (HTTP) still hit a warm cache.
+    """
+    name = type(repository).__name__
+    return CachedRepository(repository, shared_cache(repository._conn, name, **options))
@@ -1,92 +1,109 @@
 import sqlite3
-from typing import List
-from .base_repository import BaseRepository
+from typing import Iterable, Iterator, List
+from .base_repository import BaseRepository, DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE
 from ..models.event import Event
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
 class EventRepository(BaseRepository):
+    _INSERT_SQL = """
+        INSERT INTO events
+        (id, name, date, time, category, description, duration_minutes, venue_id, is_active)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+    _SELECT_SQL = """
+        SELECT id, name, date, time, category,
+               description, duration_minutes, venue_id, is_active
+        FROM events
+        """
+
+    _PAGE_ORDER = ("date", "time", "id")
+    _WATERMARKS = ("rowid", "date")
+    _TABLE = "events"
+    _KIND = "event"
+    _PATCHABLE = (
+        "name", "date", "time", "category", "description",
+        "duration_minutes", "venue_id", "is_active",
+    )
+
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection)
 
+    @staticmethod
+    def _to_row(event: Event) -> tuple:
+        return (
+            event.id,
+            event.name,
+            event.date,
+            event.time,
+            event.category,
+            event.description,
+            event.duration_minutes,
+            event.venue_id,
+            1 if event.is_active else 0
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Event:
+        return Event(
+            id=row[0],
+            name=row[1],
+            date=row[2],
+            time=row[3],
+            category=row[4],
+            description=row[5],
+            duration_minutes=row[6],
+            venue_id=row[7],
+            is_active=bool(row[8])
+        )
+
     def add(self, event: Event) -> None:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO events
-            (id, name, date, time, category, description, duration_minutes, venue_id, is_active)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event.id,
-                event.name,
-                event.date,
-                event.time,
-                event.category,
-                event.description,
-                event.duration_minutes,
-                event.venue_id,
-                1 if event.is_active else 0
-            )
-        )
-        self._conn.commit()
+        cursor.execute(self._INSERT_SQL, self._to_row(event))
+        self._commit()
         #logger.info("Event created: %s", event.display_info())
 
+    def add_many(
+        self,
+        events: Iterable[Event],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Bulk insert: executemany in chunks, single transaction.
+        """
+        count = self._executemany_chunked(
+            self._INSERT_SQL,
+            (self._to_row(event) for event in events),
+            chunk_size
+        )
+        logger.info("Bulk inserted %d events.", count)
+        return count
+
     def get_all(self) -> List[Event]:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, name, date, time, category, description,
-                   duration_minutes, venue_id, is_active
-            FROM events
-            """
-        )
-        rows = cursor.fetchall()
-        events: List[Event] = []
-        for row in rows:
-            events.append(
-                Event(
-                    id=row[0],
-                    name=row[1],
-                    date=row[2],
-                    time=row[3],
-                    category=row[4],
-                    description=row[5],
-                    duration_minutes=row[6],
-                    venue_id=row[7],
-                    is_active=bool(row[8])
-                )
-            )
+        cursor.execute(self._SELECT_SQL)
+        events: List[Event] = [self._from_row(row) for row in cursor.fetchall()]
         #logger.info("Fetched %d events from database.", len(events))
         return events
+
+    def iter_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Event]:
+        """
+        Lazy variant of get_all: reads batch_size rows at a time
+        with fetchmany, so memory stays flat for large tables.
+        """
+        for row in self._iter_rows(self._SELECT_SQL, batch_size=batch_size):
+            yield self._from_row(row)
     
     def get_by_id(self, event_id: str) -> Event | None:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, name, date, time, category, description,
-                   duration_minutes, venue_id, is_active
-            FROM events
-            WHERE id = ?
-            """,
-            (event_id,)
-        )
+        cursor.execute(self._SELECT_SQL + " WHERE id = ?", (event_id,))
         row = cursor.fetchone()
         if row is None:
             return None
 
-        return Event(
-            id=row[0],
-            name=row[1],
-            date=row[2],
-            time=row[3],
-            category=row[4],
-            description=row[5],
-            duration_minutes=row[6],
-            venue_id=row[7],
-            is_active=bool(row[8]),
-        )
+        return self._from_row(row)
     
     def update(self, event: Event) -> None:
         cursor = self._conn.cursor()
@@ -109,13 +126,13 @@ class EventRepository(BaseRepository):
                 event.id,
             )
         )
-        self._conn.commit()
+        self._commit()
         #logger.info("Event updated: %s", event.display_info())
 
     def delete_by_id(self, event_id: str) -> bool:
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
-        self._conn.commit()
+        self._commit()
         deleted = cursor.rowcount > 0
         if deleted:
             logger.info("Event deleted: id=%s", event_id)
@@ -0,0 +1,87 @@
+import base64
+import json
+from typing import Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 1000
+
+NEXT = "next"
+PREV = "prev"
+
+
+class Page(Generic[T]):
+    """
+    One page of a keyset (seek-based) pagination.
+
+    Cursors are opaque tokens: pass next_cursor / prev_cursor back to
+    get_page() to move forward / backward. None means there is no page
+    in that direction.
+    """
+
+    def __init__(
+        self,
+        items: List[T],
+        next_cursor: Optional[str] = None,
+        prev_cursor: Optional[str] = None
+    ):
+        self._items = items
+        self._next_cursor = next_cursor
+        self._prev_cursor = prev_cursor
+
+    @property
+    def items(self) -> List[T]:
+        return self._items
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        return self._next_cursor
+
+    @property
+    def prev_cursor(self) -> Optional[str]:
+        return self._prev_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self._next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self._prev_cursor is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "items": [item.to_dict() for item in self._items],
+            "next_cursor": self._next_cursor,
+            "prev_cursor": self._prev_cursor,
+        }
+
+
+def encode_cursor(direction: str, key: Sequence) -> str:
+    """
+    Packs a seek position (direction + sort key of the boundary row)
+    into a URL-safe token.
+    """
+    raw = json.dumps({"d": direction, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(token: str, key_length: int) -> tuple[str, list]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        direction, key = data["d"], data["k"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid page cursor.")
+
+    if direction not in (NEXT, PREV) or not isinstance(key, list) or len(key) != key_length:
+        raise ValueError("Invalid page cursor.")
+    return direction, key
+
+
+def validate_page_size(page_size: int) -> int:
+    if page_size <= 0:
+        raise ValueError("Page size must be positive.")
+    if page_size > MAX_PAGE_SIZE:
+        raise ValueError(f"Page size cannot exceed {MAX_PAGE_SIZE}.")
+    return page_size
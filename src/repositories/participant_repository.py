@@ -1,88 +1,105 @@
 import sqlite3
-from typing import List
-from .base_repository import BaseRepository
+from typing import Iterable, Iterator, List
+from .base_repository import BaseRepository, DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE
 from ..models.participant import Participant
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
 class ParticipantRepository(BaseRepository):
+    _INSERT_SQL = """
+        INSERT INTO participants
+        (id, full_name, email, phone, age, gender, registration_date, is_vip)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+    _SELECT_SQL = """
+        SELECT id, full_name, email, phone,
+               age, gender, registration_date, is_vip
+        FROM participants
+        """
+
+    _PAGE_ORDER = ("full_name", "id")
+    _TABLE = "participants"
+    _KIND = "participant"
+    _PATCHABLE = (
+        "full_name", "email", "phone", "age", "gender", "registration_date", "is_vip",
+    )
+
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection)
 
+    @staticmethod
+    def _to_row(participant: Participant) -> tuple:
+        return (
+            participant.id,
+            participant.full_name,
+            participant.email,
+            participant.phone,
+            participant.age,
+            participant.gender,
+            participant.registration_date,
+            1 if participant.is_vip else 0
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Participant:
+        return Participant(
+            id=row[0],
+            full_name=row[1],
+            email=row[2],
+            phone=row[3],
+            age=row[4],
+            gender=row[5],
+            registration_date=row[6],
+            is_vip=bool(row[7])
+        )
+
     def add(self, participant: Participant) -> None:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO participants
-            (id, full_name, email, phone, age, gender, registration_date, is_vip)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                participant.id,
-                participant.full_name,
-                participant.email,
-                participant.phone,
-                participant.age,
-                participant.gender,
-                participant.registration_date,
-                1 if participant.is_vip else 0
-            )
-        )
-        self._conn.commit()
+        cursor.execute(self._INSERT_SQL, self._to_row(participant))
+        self._commit()
         #logger.info("Participant created: %s", participant.display_info())
 
+    def add_many(
+        self,
+        participants: Iterable[Participant],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Bulk insert: executemany in chunks, single transaction.
+        """
+        count = self._executemany_chunked(
+            self._INSERT_SQL,
+            (self._to_row(participant) for participant in participants),
+            chunk_size
+        )
+        logger.info("Bulk inserted %d participants.", count)
+        return count
+
     def get_all(self) -> List[Participant]:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, full_name, email, phone, age, gender, registration_date, is_vip
-            FROM participants
-            """
-        )
-        rows = cursor.fetchall()
-        participants: List[Participant] = []
-        for row in rows:
-            participants.append(
-                Participant(
-                    id=row[0],
-                    full_name=row[1],
-                    email=row[2],
-                    phone=row[3],
-                    age=row[4],
-                    gender=row[5],
-                    registration_date=row[6],
-                    is_vip=bool(row[7])
-                )
-            )
+        cursor.execute(self._SELECT_SQL)
+        participants: List[Participant] = [self._from_row(row) for row in cursor.fetchall()]
         #logger.info("Fetched %d participants from database.", len(participants))
         return participants
+
+    def iter_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Participant]:
+        """
+        Lazy variant of get_all: reads batch_size rows at a time
+        with fetchmany, so memory stays flat for large tables.
+        """
+        for row in self._iter_rows(self._SELECT_SQL, batch_size=batch_size):
+            yield self._from_row(row)
     
     def get_by_id(self, participant_id: str) -> Participant | None:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, full_name, email, phone, age, gender,
-                   registration_date, is_vip
-            FROM participants
-            WHERE id = ?
-            """,
-            (participant_id,)
-        )
+        cursor.execute(self._SELECT_SQL + " WHERE id = ?", (participant_id,))
         row = cursor.fetchone()
         if row is None:
             return None
 
-        return Participant(
-            id=row[0],
-            full_name=row[1],
-            email=row[2],
-            phone=row[3],
-            age=row[4],
-            gender=row[5],
-            registration_date=row[6],
-            is_vip=bool(row[7]),
-        )
+        return self._from_row(row)
     
     def update(self, participant: Participant) -> None:
         cursor = self._conn.cursor()
@@ -104,13 +121,13 @@ class ParticipantRepository(BaseRepository):
                 participant.id,
             )
         )
-        self._conn.commit()
+        self._commit()
         #logger.info("Participant updated: %s", participant.display_info())
 
     def delete_by_id(self, participant_id: str) -> bool:
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM participants WHERE id = ?", (participant_id,))
-        self._conn.commit()
+        self._commit()
         deleted = cursor.rowcount > 0
         if deleted:
             logger.info("Participant deleted: id=%s", participant_id)
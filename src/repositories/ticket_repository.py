@@ -1,90 +1,127 @@
 import sqlite3
-from typing import List
-from .base_repository import BaseRepository
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from .base_repository import BaseRepository, DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE
 from ..models.ticket import Ticket
+from ..analytics.ticket_batch import BATCH_COLUMNS, DEFAULT_FETCH_SIZE, TicketBatch
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
 class TicketRepository(BaseRepository):
+    _INSERT_SQL = """
+        INSERT INTO tickets
+        (id, event_id, participant_id, price, seat_number,
+         ticket_type, purchase_date, is_used)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+    _SELECT_SQL = """
+        SELECT id, event_id, participant_id, price,
+               seat_number, ticket_type, purchase_date, is_used
+        FROM tickets
+        """
+
+    _PAGE_ORDER = ("purchase_date", "id")
+    _WATERMARKS = ("rowid", "purchase_date")
+    _TABLE = "tickets"
+    _KIND = "ticket"
+    # event_id / seat_number are left out: moving a seat must go through
+    # update_ticket, which keeps the seat inventory in sync
+    _PATCHABLE = ("participant_id", "price", "ticket_type", "purchase_date", "is_used")
+
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection)
 
+    @staticmethod
+    def _to_row(ticket: Ticket) -> tuple:
+        return (
+            ticket.id,
+            ticket.event_id,
+            ticket.participant_id,
+            ticket.price,
+            ticket.seat_number,
+            ticket.ticket_type,
+            ticket.purchase_date,
+            1 if ticket.is_used else 0
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Ticket:
+        return Ticket(
+            id=row[0],
+            event_id=row[1],
+            participant_id=row[2],
+            price=row[3],
+            seat_number=row[4],
+            ticket_type=row[5],
+            purchase_date=row[6],
+            is_used=bool(row[7])
+        )
+
     def add(self, ticket: Ticket) -> None:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO tickets
-            (id, event_id, participant_id, price, seat_number,
-             ticket_type, purchase_date, is_used)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                ticket.id,
-                ticket.event_id,
-                ticket.participant_id,
-                ticket.price,
-                ticket.seat_number,
-                ticket.ticket_type,
-                ticket.purchase_date,
-                1 if ticket.is_used else 0
-            )
-        )
-        self._conn.commit()
+        cursor.execute(self._INSERT_SQL, self._to_row(ticket))
+        self._commit()
         #logger.info("Ticket created: %s", ticket.display_info())
 
+    def add_many(
+        self,
+        tickets: Iterable[Ticket],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Bulk insert: executemany in chunks, single transaction.
+        """
+        count = self._executemany_chunked(
+            self._INSERT_SQL,
+            (self._to_row(ticket) for ticket in tickets),
+            chunk_size
+        )
+        logger.info("Bulk inserted %d tickets.", count)
+        return count
+
     def get_all(self) -> List[Ticket]:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, event_id, participant_id, price,
-                   seat_number, ticket_type, purchase_date, is_used
-            FROM tickets
-            """
-        )
-        rows = cursor.fetchall()
-        tickets: List[Ticket] = []
-        for row in rows:
-            tickets.append(
-                Ticket(
-                    id=row[0],
-                    event_id=row[1],
-                    participant_id=row[2],
-                    price=row[3],
-                    seat_number=row[4],
-                    ticket_type=row[5],
-                    purchase_date=row[6],
-                    is_used=bool(row[7])
-                )
-            )
+        cursor.execute(self._SELECT_SQL)
+        tickets: List[Ticket] = [self._from_row(row) for row in cursor.fetchall()]
         #logger.info("Fetched %d tickets from database.", len(tickets))
         return tickets
+
+    def iter_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Ticket]:
+        """
+        Lazy variant of get_all: reads batch_size rows at a time
+        with fetchmany, so memory stays flat for large tables.
+        """
+        for row in self._iter_rows(self._SELECT_SQL, batch_size=batch_size):
+            yield self._from_row(row)
     
+    def load_batch(
+        self,
+        event_id: str | None = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE
+    ) -> TicketBatch:
+        """
+        Loads tickets (optionally of one event) into a columnar
+        TicketBatch without creating Ticket objects.
+        """
+        cursor = self._conn.cursor()
+        if event_id is None:
+            cursor.execute(f"SELECT {BATCH_COLUMNS} FROM tickets")
+        else:
+            cursor.execute(
+                f"SELECT {BATCH_COLUMNS} FROM tickets WHERE event_id = ?",
+                (event_id,)
+            )
+        return TicketBatch.from_cursor(cursor, fetch_size)
+
     def get_by_id(self, ticket_id: str) -> Ticket | None:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, event_id, participant_id, price, seat_number,
-                   ticket_type, purchase_date, is_used
-            FROM tickets
-            WHERE id = ?
-            """,
-            (ticket_id,)
-        )
+        cursor.execute(self._SELECT_SQL + " WHERE id = ?", (ticket_id,))
         row = cursor.fetchone()
         if row is None:
             return None
 
-        return Ticket(
-            id=row[0],
-            event_id=row[1],
-            participant_id=row[2],
-            price=row[3],
-            seat_number=row[4],
-            ticket_type=row[5],
-            purchase_date=row[6],
-            is_used=bool(row[7]),
-        )
+        return self._from_row(row)
     
     def update(self, ticket: Ticket) -> None:
         cursor = self._conn.cursor()
@@ -106,13 +143,197 @@ class TicketRepository(BaseRepository):
                 ticket.id,
             )
         )
-        self._conn.commit()
+        self._commit()
         #logger.info("Ticket updated: %s", ticket.display_info())
 
+    def reserve(self, ticket: Ticket) -> None:
+        """
+        Oversell-proof insert: the capacity check, the seat check and
+        the INSERT are ONE conditional statement run under
+        BEGIN IMMEDIATE, so concurrent processes cannot both pass the
+        check. Raises ValueError if the event is missing, sold out or
+        the seat is taken. sqlite3.OperationalError (busy) is left to
+        the caller's retry policy.
+
+        Inside an open unit of work the unit's transaction is used.
+        """
+        own_transaction = not self._conn.in_transaction
+        cursor = self._conn.cursor()
+        if own_transaction:
+            cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute(
+                """
+                INSERT INTO tickets
+                (id, event_id, participant_id, price, seat_number,
+                 ticket_type, purchase_date, is_used)
+                SELECT ?, ?, ?, ?, ?, ?, ?, ?
+                WHERE (SELECT COUNT(*) FROM tickets WHERE event_id = ?) <
+                      (SELECT v.capacity
+                       FROM events e JOIN venues v ON v.id = e.venue_id
+                       WHERE e.id = ?)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM tickets WHERE event_id = ? AND seat_number = ?
+                  )
+                """,
+                (
+                    *self._to_row(ticket),
+                    ticket.event_id,
+                    ticket.event_id,
+                    ticket.event_id,
+                    ticket.seat_number,
+                )
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(self._reservation_failure(ticket))
+            if own_transaction:
+                self._conn.commit()
+        except Exception:
+            if own_transaction:
+                self._conn.rollback()
+            raise
+
+    def _reservation_failure(self, ticket: Ticket) -> str:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT 1 FROM tickets WHERE event_id = ? AND seat_number = ?",
+            (ticket.event_id, ticket.seat_number)
+        )
+        if cursor.fetchone() is not None:
+            return f"Seat {ticket.seat_number} is already sold."
+
+        cursor.execute(
+            "SELECT 1 FROM events e JOIN venues v ON v.id = e.venue_id WHERE e.id = ?",
+            (ticket.event_id,)
+        )
+        if cursor.fetchone() is None:
+            return "Event not found."
+        return "Event is sold out."
+
+    def iter_seat_numbers(self, event_id: str) -> Iterator[str]:
+        for (seat_number,) in self._iter_rows(
+            "SELECT seat_number FROM tickets WHERE event_id = ?",
+            (event_id,)
+        ):
+            yield seat_number
+
+    def get_ids_by_type(self, event_id: str) -> Dict[str, List[str]]:
+        """
+        Ticket ids of one event grouped by ticket_type.
+        """
+        groups: Dict[str, List[str]] = {}
+        for ticket_id, ticket_type in self._iter_rows(
+            "SELECT id, ticket_type FROM tickets WHERE event_id = ?",
+            (event_id,)
+        ):
+            groups.setdefault(ticket_type, []).append(ticket_id)
+        return groups
+
+    def update_prices(
+        self,
+        rows: Iterable[Tuple[float, str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Bulk price update from (price, ticket_id) pairs, one transaction.
+        """
+        return self._executemany_chunked(
+            "UPDATE tickets SET price = ? WHERE id = ?",
+            rows,
+            chunk_size
+        )
+
+    def mark_event_used(self, event_id: str) -> int:
+        """
+        Set-based check-in of a whole event: one UPDATE, returns the
+        number of tickets that were still unused.
+        """
+        return self._patch_where({"is_used": True}, "event_id = ? AND is_used = 0", (event_id,))
+
+    # ---------- Check-in ---------- #
+
+    def use_ticket(self, ticket_id: str, event_id: Optional[str] = None) -> bool:
+        """
+        Check-in as ONE conditional statement: flips is_used only if
+        the ticket exists (for event_id, if given) and is still unused.
+        True if this call used it.
+        """
+        where, params = "id = ? AND is_used = 0", (ticket_id,)
+        if event_id is not None:
+            where, params = f"{where} AND event_id = ?", (ticket_id, event_id)
+        return self._patch_where({"is_used": True}, where, params) == 1
+
+    def used_state(self, ticket_id: str, event_id: Optional[str] = None) -> Optional[bool]:
+        """
+        is_used of a ticket, None if it does not exist (for event_id).
+        """
+        sql, params = "SELECT is_used FROM tickets WHERE id = ?", (ticket_id,)
+        if event_id is not None:
+            sql, params = f"{sql} AND event_id = ?", (ticket_id, event_id)
+        cursor = self._conn.cursor()
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+        return None if row is None else bool(row[0])
+
+    def use_tickets(
+        self,
+        ticket_ids: Sequence[str],
+        event_id: Optional[str] = None,
+        chunk_size: int = 500
+    ) -> Dict[str, bool]:
+        """
+        Batched check-in: reads the state of all ids and marks the
+        unused ones as used under ONE write lock (BEGIN IMMEDIATE), so
+        two gates cannot both get the same ticket through.
+        Returns {ticket_id: was_used_before} for the ids that exist
+        (for event_id, if given); missing ids are left out.
+
+        Inside an open unit of work the unit's transaction is used.
+        """
+        ids = list(dict.fromkeys(ticket_ids))
+        own_transaction = not self._conn.in_transaction
+        cursor = self._conn.cursor()
+        if own_transaction:
+            cursor.execute("BEGIN IMMEDIATE")
+        try:
+            states: Dict[str, bool] = {}
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                placeholders = ", ".join("?" for _ in chunk)
+                sql = f"SELECT id, is_used FROM tickets WHERE id IN ({placeholders})"
+                params: tuple = tuple(chunk)
+                if event_id is not None:
+                    sql, params = f"{sql} AND event_id = ?", (*chunk, event_id)
+                cursor.execute(sql, params)
+                states.update((ticket_id, bool(used)) for ticket_id, used in cursor.fetchall())
+
+            unused = [ticket_id for ticket_id, used in states.items() if not used]
+            for start in range(0, len(unused), chunk_size):
+                chunk = unused[start:start + chunk_size]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(f"UPDATE tickets SET is_used = 1 WHERE id IN ({placeholders})", chunk)
+            if own_transaction:
+                self._conn.commit()
+        except Exception:
+            if own_transaction:
+                self._conn.rollback()
+            raise
+        return states
+
+    def iter_check_in_states(self, event_id: str) -> Iterator[Tuple[str, bool]]:
+        """
+        (ticket_id, is_used) of every ticket of an event.
+        """
+        for ticket_id, used in self._iter_rows(
+            "SELECT id, is_used FROM tickets WHERE event_id = ?",
+            (event_id,)
+        ):
+            yield ticket_id, bool(used)
+
     def delete_by_id(self, ticket_id: str) -> bool:
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM tickets WHERE id = ?", (ticket_id,))
-        self._conn.commit()
+        self._commit()
         deleted = cursor.rowcount > 0
         if deleted:
             logger.info("Ticket deleted: id=%s", ticket_id)
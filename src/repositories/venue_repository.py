@@ -1,80 +1,100 @@
 import sqlite3
-from typing import List
-from .base_repository import BaseRepository
+from typing import Iterable, Iterator, List, Tuple
+from .base_repository import BaseRepository, DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE
+from ..database.unit_of_work import in_unit_of_work
 from ..models.venue import Venue
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
 class VenueRepository(BaseRepository):
+    _INSERT_SQL = """
+        INSERT INTO venues (id, name, address, capacity, manager_name, phone, is_open)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+
+    _SELECT_SQL = """
+        SELECT id, name, address, capacity, manager_name, phone, is_open
+        FROM venues
+        """
+
+    _PAGE_ORDER = ("name", "id")
+    _TABLE = "venues"
+    _KIND = "venue"
+    _PATCHABLE = ("name", "address", "capacity", "manager_name", "phone", "is_open")
+
     def __init__(self, connection: sqlite3.Connection):
         super().__init__(connection)
 
+    @staticmethod
+    def _to_row(venue: Venue) -> tuple:
+        return (
+            venue.id,
+            venue.name,
+            venue.address,
+            venue.capacity,
+            venue.manager_name,
+            venue.phone,
+            1 if venue.is_open else 0
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Venue:
+        return Venue(
+            id=row[0],
+            name=row[1],
+            address=row[2],
+            capacity=row[3],
+            manager_name=row[4],
+            phone=row[5],
+            is_open=bool(row[6])
+        )
+
     def add(self, venue: Venue) -> None:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO venues (id, name, address, capacity, manager_name, phone, is_open)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                venue.id,
-                venue.name,
-                venue.address,
-                venue.capacity,
-                venue.manager_name,
-                venue.phone,
-                1 if venue.is_open else 0
-            )
-        )
-        self._conn.commit()
+        cursor.execute(self._INSERT_SQL, self._to_row(venue))
+        self._commit()
         #logger.info("Venue created: %s", venue.display_info())
 
+    def add_many(
+        self,
+        venues: Iterable[Venue],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Bulk insert: executemany in chunks, single transaction.
+        """
+        count = self._executemany_chunked(
+            self._INSERT_SQL,
+            (self._to_row(venue) for venue in venues),
+            chunk_size
+        )
+        logger.info("Bulk inserted %d venues.", count)
+        return count
+
     def get_all(self) -> List[Venue]:
         cursor = self._conn.cursor()
-        cursor.execute(
-            "SELECT id, name, address, capacity, manager_name, phone, is_open FROM venues"
-        )
-        rows = cursor.fetchall()
-        venues: List[Venue] = []
-        for row in rows:
-            venues.append(
-                Venue(
-                    id=row[0],
-                    name=row[1],
-                    address=row[2],
-                    capacity=row[3],
-                    manager_name=row[4],
-                    phone=row[5],
-                    is_open=bool(row[6])
-                )
-            )
+        cursor.execute(self._SELECT_SQL)
+        venues: List[Venue] = [self._from_row(row) for row in cursor.fetchall()]
         #logger.info("Fetched %d venues from database.", len(venues))
         return venues
+
+    def iter_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Venue]:
+        """
+        Lazy variant of get_all: reads batch_size rows at a time
+        with fetchmany, so memory stays flat for large tables.
+        """
+        for row in self._iter_rows(self._SELECT_SQL, batch_size=batch_size):
+            yield self._from_row(row)
     
     def get_by_id(self, venue_id: str) -> Venue | None:
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, name, address, capacity, manager_name, phone, is_open
-            FROM venues
-            WHERE id = ?
-            """,
-            (venue_id,)
-        )
+        cursor.execute(self._SELECT_SQL + " WHERE id = ?", (venue_id,))
         row = cursor.fetchone()
         if row is None:
             return None
 
-        return Venue(
-            id=row[0],
-            name=row[1],
-            address=row[2],
-            capacity=row[3],
-            manager_name=row[4],
-            phone=row[5],
-            is_open=bool(row[6]),
-        )
+        return self._from_row(row)
     
     def update(self, venue: Venue) -> None:
         cursor = self._conn.cursor()
@@ -94,13 +114,38 @@ class VenueRepository(BaseRepository):
                 venue.id,
             )
         )
-        self._conn.commit()
+        self._commit()
         #logger.info("Venue updated: %s", venue.display_info())
 
+    def close(self, venue_id: str) -> Tuple[int, int]:
+        """
+        Closes the venue and deactivates its active events in ONE
+        transaction (two set-based UPDATEs, no rows loaded).
+        Returns (venues closed, events deactivated); (0, 0) if the
+        venue does not exist.
+        """
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute("UPDATE venues SET is_open = 0 WHERE id = ?", (venue_id,))
+            venues = cursor.rowcount
+            events = 0
+            if venues:
+                cursor.execute(
+                    "UPDATE events SET is_active = 0 WHERE venue_id = ? AND is_active = 1",
+                    (venue_id,)
+                )
+                events = cursor.rowcount
+            self._commit()
+        except Exception:
+            if not in_unit_of_work(self._conn):
+                self._conn.rollback()
+            raise
+        return venues, events
+
     def delete_by_id(self, venue_id: str) -> bool:
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM venues WHERE id = ?", (venue_id,))
-        self._conn.commit()
+        self._commit()
         deleted = cursor.rowcount > 0
         if deleted:
             logger.info("Venue deleted: id=%s", venue_id)
@@ -0,0 +1,102 @@
+import argparse
+
+from .logging_config import setup_logging, shutdown_logging, get_logger
+from .instrumentation import PrometheusFileWriter, enable_metrics
+from .database.connection import CONNECTION_PROFILES, DEFAULT_PROFILE
+from .database.pool import ConnectionPool
+from .database.schema import initialize_database
+from .controllers.http_controller import create_server
+
+logger = get_logger(__name__)
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Event Management System – HTTP JSON API")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port (default: 8080)")
+    parser.add_argument(
+        "--db",
+        default="event_management.db",
+        help="SQLite database file (default: event_management.db)"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(CONNECTION_PROFILES),
+        default=DEFAULT_PROFILE,
+        help=f"Connection PRAGMA profile (default: {DEFAULT_PROFILE})"
+    )
+    parser.add_argument(
+        "--readers",
+        type=int,
+        default=4,
+        help="Pooled read-only connections (default: 4)"
+    )
+    parser.add_argument(
+        "--log-sample",
+        type=int,
+        default=1,
+        help="Log only 1 of N high-volume messages such as 'Ticket sold' (default: 1 = all)"
+    )
+    parser.add_argument("--log-json", action="store_true", help="Structured JSON log lines")
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Time every service/repository call and SQL statement (shown in GET /metrics)"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="FILE",
+        help="Also write the metrics in Prometheus text format to FILE (implies --metrics)"
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=15.0,
+        help="Seconds between --metrics-file rewrites (default: 15)"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # request threads only enqueue log records; a background thread writes them.
+    # The server process logs only through these handlers, so it can
+    # skip the per-record caller/thread lookups.
+    setup_logging(
+        use_queue=True,
+        json_format=args.log_json,
+        sample_rate=args.log_sample,
+        lean_records=True
+    )
+    logger.info("Starting Event Management HTTP server...")
+
+    # before the pool opens its connections – they time SQL only if enabled
+    metrics_writer = None
+    if args.metrics or args.metrics_file:
+        enable_metrics()
+    if args.metrics_file:
+        metrics_writer = PrometheusFileWriter(args.metrics_file, args.metrics_interval)
+        metrics_writer.start()
+
+    pool = ConnectionPool(args.db, readers=args.readers, profile=args.profile)
+    with pool.writer() as conn:
+        initialize_database(conn)
+
+    server = create_server(pool, args.host, args.port)
+    host, port = server.server_address[:2]
+    logger.info("Listening on http://%s:%d", host, port)
+    print(f"Serving on http://{host}:{port} (Ctrl+C to stop)", flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+        if metrics_writer is not None:
+            metrics_writer.stop()
+        logger.info("HTTP server stopped.")
+        shutdown_logging()
+
+if __name__ == "__main__":
+    main()
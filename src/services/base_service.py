@@ -11,3 +11,13 @@ class BaseService(ABC):
     @property
     def repository(self):
         return self._repository
+
+    def unit_of_work(self):
+        """
+        Groups several service calls into one transaction:
+
+            with ticket_service.unit_of_work():
+                for sale in batch:
+                    ticket_service.sell_ticket(**sale)
+        """
+        return self._repository.unit_of_work()
@@ -0,0 +1,145 @@
+from typing import Dict, Iterable, List, Optional
+
+from ...repositories.ticket_repository import TicketRepository
+from ...logging_config import get_logger
+from ..base_service import BaseService
+from .hot_set import HotSet
+
+logger = get_logger(__name__)
+
+# scan results
+VALID = "valid"
+ALREADY_USED = "already_used"
+UNKNOWN = "unknown"
+
+
+class CheckInService(BaseService):
+    """
+    Gate scanning: validates a ticket and marks it used in one step.
+
+    - scan()      – one conditional UPDATE per ticket (no read first)
+    - scan_many() – a batch from one gate under one write lock
+    - with event_id the event's tickets are kept in a HotSet, so
+      repeated scans of used tickets are answered from memory
+
+    A ticket of another event is UNKNOWN for the given event_id.
+    """
+
+    def __init__(self, repository: TicketRepository, hot_set: HotSet | None = None):
+        super().__init__(repository)
+        self._hot_set = hot_set if hot_set is not None else HotSet()
+
+    @property
+    def hot_set(self) -> HotSet:
+        return self._hot_set
+
+    # ---------- Hot set ---------- #
+
+    def open_event(self, event_id: str) -> tuple[int, int]:
+        """
+        (Re)loads the event's tickets into the hot set.
+        Returns (used, total).
+        """
+        self._hot_set.load(event_id, self.repository.iter_check_in_states(event_id))
+        used, total = self._hot_set.progress(event_id)
+        logger.info("Check-in opened: event_id=%s, used=%d, total=%d", event_id, used, total)
+        return used, total
+
+    def close_event(self, event_id: str) -> None:
+        self._hot_set.drop(event_id)
+
+    def progress(self, event_id: str) -> tuple[int, int]:
+        """
+        (used, total) tickets of the event.
+        """
+        progress = self._hot_set.progress(event_id)
+        if progress is None:
+            return self.open_event(event_id)
+        return progress
+
+    def _hot(self, event_id: Optional[str]) -> bool:
+        if event_id is None:
+            return False
+        if not self._hot_set.is_loaded(event_id):
+            self.open_event(event_id)
+        return True
+
+    def _drop_on_rollback(self, event_id: str) -> None:
+        # a rolled-back unit of work un-uses the tickets again
+        self.repository.on_rollback(lambda: self._hot_set.drop(event_id))
+
+    # ---------- Scans ---------- #
+
+    def scan(self, ticket_id: str, event_id: str | None = None) -> str:
+        """
+        VALID (now marked used), ALREADY_USED or UNKNOWN.
+        """
+        hot = self._hot(event_id)
+        if hot and self._hot_set.lookup(event_id, ticket_id):
+            return ALREADY_USED
+
+        if self.repository.use_ticket(ticket_id, event_id):
+            status = VALID
+        else:
+            used = self.repository.used_state(ticket_id, event_id)
+            status = UNKNOWN if used is None else ALREADY_USED
+
+        if hot and status != UNKNOWN:
+            self._hot_set.mark_used(event_id, ticket_id)
+            self._drop_on_rollback(event_id)
+
+        logger.debug("Ticket scanned: id=%s, status=%s", ticket_id, status)
+
+        return status
+
+    def scan_many(self, ticket_ids: Iterable[str], event_id: str | None = None) -> List[str]:
+        """
+        Batch of scans (e.g. queued by one gate), statuses in input
+        order. One transaction; if the same ticket appears twice only
+        the first scan is VALID.
+        """
+        ids = list(ticket_ids)
+        hot = self._hot(event_id)
+        statuses: List[Optional[str]] = [None] * len(ids)
+
+        pending = []
+        for index, ticket_id in enumerate(ids):
+            if hot and self._hot_set.lookup(event_id, ticket_id):
+                statuses[index] = ALREADY_USED
+            else:
+                pending.append(index)
+
+        states = self.repository.use_tickets([ids[index] for index in pending], event_id) if pending else {}
+
+        admitted = set()
+        for index in pending:
+            ticket_id = ids[index]
+            was_used = states.get(ticket_id)
+            if was_used is None:
+                statuses[index] = UNKNOWN
+                continue
+            if was_used or ticket_id in admitted:
+                statuses[index] = ALREADY_USED
+            else:
+                statuses[index] = VALID
+                admitted.add(ticket_id)
+            if hot:
+                self._hot_set.mark_used(event_id, ticket_id)
+        if hot and pending:
+            self._drop_on_rollback(event_id)
+
+        logger.info(
+            "Tickets scanned: event_id=%s, scans=%d, valid=%d",
+            event_id,
+            len(ids),
+            len(admitted),
+        )
+
+        return statuses
+
+    @staticmethod
+    def summarize(statuses: Iterable[str]) -> Dict[str, int]:
+        counts = {VALID: 0, ALREADY_USED: 0, UNKNOWN: 0}
+        for status in statuses:
+            counts[status] += 1
+        return counts
@@ -0,0 +1,79 @@
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+class EventScanState:
+    """
+    Check-in state of ONE event: ids of unused and used tickets.
+    """
+
+    __slots__ = ("unused", "used")
+
+    def __init__(self, states: Iterable[Tuple[str, bool]]):
+        self.unused: Set[str] = set()
+        self.used: Set[str] = set()
+        for ticket_id, used in states:
+            (self.used if used else self.unused).add(ticket_id)
+
+
+class HotSet:
+    """
+    In-memory check-in state of the events currently being scanned,
+    shared by every gate (thread) of this process.
+
+    Used tickets never go back to unused during a check-in, so a
+    ticket found in `used` is rejected without touching the database;
+    everything else is still decided by the database (another process
+    may have scanned it). After out-of-band changes (e.g. an admin
+    resets is_used) call drop().
+    """
+
+    def __init__(self):
+        self._events: Dict[str, EventScanState] = {}
+        self._lock = threading.Lock()
+
+    def is_loaded(self, event_id: str) -> bool:
+        return event_id in self._events
+
+    def load(self, event_id: str, states: Iterable[Tuple[str, bool]]) -> None:
+        state = EventScanState(states)
+        with self._lock:
+            self._events[event_id] = state
+
+    def lookup(self, event_id: str, ticket_id: str) -> Optional[bool]:
+        """
+        True = used, False = not used yet, None = not in the set
+        (unknown, or sold after the event was loaded).
+        """
+        state = self._events.get(event_id)
+        if state is None:
+            return None
+        if ticket_id in state.used:
+            return True
+        if ticket_id in state.unused:
+            return False
+        return None
+
+    def mark_used(self, event_id: str, ticket_id: str) -> None:
+        with self._lock:
+            state = self._events.get(event_id)
+            if state is not None:
+                state.unused.discard(ticket_id)
+                state.used.add(ticket_id)
+
+    def progress(self, event_id: str) -> Optional[Tuple[int, int]]:
+        """
+        (used, total) tickets of a loaded event.
+        """
+        with self._lock:
+            state = self._events.get(event_id)
+            if state is None:
+                return None
+            return len(state.used), len(state.used) + len(state.unused)
+
+    def drop(self, event_id: str | None = None) -> None:
+        with self._lock:
+            if event_id is None:
+                self._events.clear()
+            else:
+                self._events.pop(event_id, None)
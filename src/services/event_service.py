@@ -1,16 +1,28 @@
-from typing import List
+from typing import Iterator, List
 
 from ..models.event import Event
+from ..repositories.pagination import DEFAULT_PAGE_SIZE, Page
+from ..repositories.base_repository import DEFAULT_BATCH_SIZE
 from ..repositories.event_repository import EventRepository
 from ..logging_config import get_logger
+from ..utils.validators import validate_record
 from .base_service import BaseService
+from .inventory.seat_inventory import SeatInventory
 
 logger = get_logger(__name__)
 
 
 class EventService(BaseService):
-    def __init__(self, repository: EventRepository):
+    def __init__(self, repository: EventRepository, inventory: SeatInventory | None = None):
         super().__init__(repository)
+        self._inventory = inventory
+
+    def _invalidate_seat_map(self, event_id: str) -> None:
+        # the map is sized from the event's venue – rebuild it on next use
+        if self._inventory is None:
+            return
+        self._inventory.invalidate(event_id)
+        self.repository.on_rollback(lambda: self._inventory.invalidate(event_id))
 
     # ✅ CREATE
     def create_event(
@@ -50,12 +62,39 @@ class EventService(BaseService):
 
     # ✅ READ (LIST)
     def list_events(self) -> List[Event]:
-        events = self.repository.get_all()
+        """
+        Compatibility wrapper: all events as one list (built on
+        iter_events). Prefer iter_events / list_events_page.
+        """
+        return list(self.iter_events())
+    
+    # ✅ READ (STREAM)
+    def iter_events(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Event]:
+        """
+        Yields events lazily; use it instead of list_events
+        when the result is only printed or scanned once.
+        """
+        count = 0
+        for event in self.repository.iter_all(batch_size):
+            count += 1
+            yield event
 
-        logger.info("Retrieved %d events.", len(events))
+        logger.info("Streamed %d events.", count)
+
+    # ✅ READ (PAGE)
+    def list_events_page(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        start_at: str | None = None
+    ) -> Page:
+        """
+        Keyset pagination over events, ordered by date.
+        Pass page.next_cursor / page.prev_cursor to move,
+        or start_at to jump to a date.
+        """
+        return self.repository.get_page(page_size, cursor, start_at)
 
-        return events
-    
     # ✅ UPDATE
     def update_event(
         self,
@@ -76,6 +115,7 @@ class EventService(BaseService):
         if duration_minutes <= 0:
             raise ValueError("Duration must be positive.")
 
+        venue_changed = event.venue_id != venue_id
         event._name = name
         event._date = date
         event._time = time
@@ -86,17 +126,38 @@ class EventService(BaseService):
         event._is_active = is_active
 
         self.repository.update(event)
+        if venue_changed:
+            self._invalidate_seat_map(event_id)
 
         # ✅ update log
         logger.info("Event updated: id=%s, name=%s", event.id, event.name)
 
         return event
     
+    # ✅ UPDATE (PARTIAL)
+    def patch_event(self, event_id: str, **fields) -> int:
+        """
+        Changes only the given fields with one UPDATE (no read first),
+        e.g. patch_event(event_id, is_active=False).
+        """
+        fields = validate_record("event", fields)
+
+        count = self.repository.patch(event_id, **fields)
+        if count == 0:
+            raise ValueError("Event not found.")
+        if "venue_id" in fields:
+            self._invalidate_seat_map(event_id)
+
+        logger.info("Event patched: id=%s, fields=%s", event_id, ", ".join(fields))
+
+        return count
+
     # ✅ DELETE
     def delete_event(self, event_id: str) -> bool:
         deleted = self.repository.delete_by_id(event_id)
         if not deleted:
             raise ValueError("Event not found.")
+        self._invalidate_seat_map(event_id)
 
         # ✅ delete log
         logger.info("Event deleted: id=%s", event_id)
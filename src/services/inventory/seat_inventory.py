@@ -0,0 +1,125 @@
+import threading
+from typing import Dict, List, Optional
+
+from ...repositories.event_repository import EventRepository
+from ...repositories.ticket_repository import TicketRepository
+from ...repositories.venue_repository import VenueRepository
+from ...logging_config import get_logger
+from .seat_map import SeatMap
+
+logger = get_logger(__name__)
+
+
+class SeatInventory:
+    """
+    In-memory seat availability per event, backed by SeatMap bitmaps.
+
+    A map is built lazily from the tickets table the first time an
+    event is touched (capacity = the venue's capacity) and is then kept
+    in sync by TicketService on sell / update / delete. VenueService
+    and EventService drop the maps a capacity or venue change affects.
+    Claims are atomic: one lock guards check-and-set.
+    """
+
+    def __init__(
+        self,
+        ticket_repository: TicketRepository,
+        event_repository: EventRepository,
+        venue_repository: VenueRepository
+    ):
+        self._tickets = ticket_repository
+        self._events = event_repository
+        self._venues = venue_repository
+        self._maps: Dict[str, SeatMap] = {}
+        # event_id -> venue_id of every loaded map (for invalidate_venue)
+        self._venue_of: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def _map(self, event_id: str) -> SeatMap:
+        seat_map = self._maps.get(event_id)
+        if seat_map is None:
+            seat_map = self._load(event_id)
+            self._maps[event_id] = seat_map
+        return seat_map
+
+    def _load(self, event_id: str) -> SeatMap:
+        event = self._events.get_by_id(event_id)
+        if event is None:
+            raise ValueError("Event not found.")
+        venue = self._venues.get_by_id(event.venue_id)
+        if venue is None:
+            raise ValueError("Venue not found.")
+
+        seat_map = SeatMap(venue.capacity)
+        self._venue_of[event_id] = venue.id
+        for seat in self._tickets.iter_seat_numbers(event_id):
+            # over-capacity legacy data: keep loading, claim() just refuses
+            seat_map.claim(seat)
+
+        logger.info(
+            "Seat map loaded: event_id=%s, sold=%d, capacity=%d",
+            event_id,
+            seat_map.sold,
+            seat_map.capacity,
+        )
+        return seat_map
+
+    # ---------- Queries ---------- #
+
+    def is_available(self, event_id: str, seat_number: str) -> bool:
+        with self._lock:
+            return self._map(event_id).is_free(seat_number)
+
+    def availability(self, event_id: str) -> tuple[int, int]:
+        """
+        (sold, capacity) of an event.
+        """
+        with self._lock:
+            seat_map = self._map(event_id)
+            return seat_map.sold, seat_map.capacity
+
+    def best_available(self, event_id: str, count: int = 1) -> Optional[List[str]]:
+        """
+        Lowest-numbered block of `count` contiguous free seats.
+        """
+        with self._lock:
+            seats = self._map(event_id).find_contiguous(count)
+        return None if seats is None else [str(s) for s in seats]
+
+    # ---------- Claims ---------- #
+
+    def claim(self, event_id: str, seat_number: str) -> None:
+        with self._lock:
+            seat_map = self._map(event_id)
+            if seat_map.sold >= seat_map.capacity:
+                raise ValueError("Event is sold out.")
+            if not seat_map.claim(seat_number):
+                raise ValueError(f"Seat {seat_number} is already sold.")
+
+    def release(self, event_id: str, seat_number: str) -> None:
+        with self._lock:
+            seat_map = self._maps.get(event_id)
+            if seat_map is not None:
+                seat_map.release(seat_number)
+
+    def invalidate(self, event_id: str | None = None) -> None:
+        """
+        Drops cached maps (one event or all); they are rebuilt from the
+        tickets table on next use. Call after out-of-band writes.
+        """
+        with self._lock:
+            if event_id is None:
+                self._maps.clear()
+                self._venue_of.clear()
+            else:
+                self._maps.pop(event_id, None)
+                self._venue_of.pop(event_id, None)
+
+    def invalidate_venue(self, venue_id: str) -> None:
+        """
+        Drops the maps of every loaded event held at the venue
+        (its capacity changed or it was deleted).
+        """
+        with self._lock:
+            for event_id in [e for e, v in self._venue_of.items() if v == venue_id]:
+                self.invalidate(event_id)
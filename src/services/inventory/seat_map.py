@@ -0,0 +1,136 @@
+from typing import List, Optional, Set
+
+
+class SeatMap:
+    """
+    Compact availability map of ONE event.
+
+    Seats are numbered 1..capacity and stored as bits in a bytearray
+    (capacity / 8 bytes), so availability checks and claims are O(1).
+    Seat labels that are not a number in that range (e.g. legacy "A10")
+    are kept in a small set and still count towards capacity.
+    """
+
+    __slots__ = ("_capacity", "_bits", "_named", "_sold")
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self._capacity = capacity
+        self._bits = bytearray((capacity + 7) // 8)
+        self._named: Set[str] = set()
+        self._sold = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def sold(self) -> int:
+        return self._sold
+
+    @property
+    def available(self) -> int:
+        return self._capacity - self._sold
+
+    def _index(self, seat) -> Optional[int]:
+        """
+        0-based bit index of a numbered seat, None for a named seat.
+        """
+        label = str(seat).strip()
+        if label.isdigit():
+            number = int(label)
+            if 1 <= number <= self._capacity:
+                return number - 1
+        return None
+
+    def is_free(self, seat) -> bool:
+        if self._sold >= self._capacity:
+            return False
+        index = self._index(seat)
+        if index is None:
+            return str(seat).strip() not in self._named
+        return not self._bits[index >> 3] & (1 << (index & 7))
+
+    def claim(self, seat) -> bool:
+        """
+        Marks a seat as sold. Returns False if it is already taken
+        or the event is sold out.
+        """
+        if self._sold >= self._capacity:
+            return False
+
+        index = self._index(seat)
+        if index is None:
+            label = str(seat).strip()
+            if label in self._named:
+                return False
+            self._named.add(label)
+        else:
+            mask = 1 << (index & 7)
+            if self._bits[index >> 3] & mask:
+                return False
+            self._bits[index >> 3] |= mask
+
+        self._sold += 1
+        return True
+
+    def release(self, seat) -> bool:
+        index = self._index(seat)
+        if index is None:
+            label = str(seat).strip()
+            if label not in self._named:
+                return False
+            self._named.discard(label)
+        else:
+            mask = 1 << (index & 7)
+            if not self._bits[index >> 3] & mask:
+                return False
+            self._bits[index >> 3] &= ~mask & 0xFF
+
+        self._sold -= 1
+        return True
+
+    def find_contiguous(self, count: int) -> Optional[List[int]]:
+        """
+        Lowest-numbered block of `count` adjacent free seats, or None.
+        Fully sold / fully free bytes are skipped 8 seats at a time.
+        """
+        if count <= 0:
+            raise ValueError("Seat count must be positive.")
+        if count > self.available:
+            return None
+
+        bits = self._bits
+        capacity = self._capacity
+        start = 0
+        run = 0
+        i = 0
+        while i < capacity:
+            aligned = (i & 7) == 0
+            byte = bits[i >> 3]
+
+            if aligned and byte == 0xFF:
+                run = 0
+                i += 8
+                continue
+
+            if aligned and byte == 0 and i + 8 <= capacity:
+                if run == 0:
+                    start = i
+                run += 8
+                i += 8
+            elif byte & (1 << (i & 7)):
+                run = 0
+                i += 1
+                continue
+            else:
+                if run == 0:
+                    start = i
+                run += 1
+                i += 1
+
+            if run >= count:
+                return list(range(start + 1, start + count + 1))
+
+        return None
@@ -1,8 +1,11 @@
-from typing import List
+from typing import Iterable, Iterator, List, Mapping
 
 from ..models.participant import Participant
+from ..repositories.pagination import DEFAULT_PAGE_SIZE, Page
+from ..repositories.base_repository import DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE
 from ..repositories.participant_repository import ParticipantRepository
 from ..logging_config import get_logger
+from ..utils.validators import validate_record
 from .base_service import BaseService
 
 logger = get_logger(__name__)
@@ -26,10 +29,7 @@ class ParticipantService(BaseService):
         """
         Creates a Participant and saves it.
         """
-        if age <= 0:
-            raise ValueError("Age must be positive.")
-
-        participant = Participant(
+        participant = self._build_participant(
             full_name=full_name,
             email=email,
             phone=phone,
@@ -50,14 +50,85 @@ class ParticipantService(BaseService):
 
         return participant
 
+    # ✅ CREATE (BULK)
+    def create_participants_bulk(
+        self,
+        rows: Iterable[Mapping],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Bulk version of create_participant for imports.
+        Each row is a mapping with create_participant's arguments.
+        All rows are written in one transaction; returns the count.
+        """
+        count = self.repository.add_many(
+            (self._build_participant(**row) for row in rows),
+            chunk_size
+        )
+
+        logger.info("Participants created in bulk: count=%d", count)
+
+        return count
+
+    @staticmethod
+    def _build_participant(
+        full_name: str,
+        email: str,
+        phone: str,
+        age: int,
+        gender: str,
+        registration_date: str,
+        is_vip: bool = False
+    ) -> Participant:
+        if age <= 0:
+            raise ValueError("Age must be positive.")
+
+        return Participant(
+            full_name=full_name,
+            email=email,
+            phone=phone,
+            age=age,
+            gender=gender,
+            registration_date=registration_date,
+            is_vip=is_vip
+        )
+
     # ✅ READ (LIST)
     def list_participants(self) -> List[Participant]:
-        participants = self.repository.get_all()
+        """
+        Compatibility wrapper: all participants as one list (built on
+        iter_participants). Prefer iter_participants /
+        list_participants_page for large tables.
+        """
+        return list(self.iter_participants())
+    
+    # ✅ READ (STREAM)
+    def iter_participants(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Participant]:
+        """
+        Streaming read for large participant tables:
+        only one fetchmany batch is kept in memory.
+        """
+        count = 0
+        for participant in self.repository.iter_all(batch_size):
+            count += 1
+            yield participant
 
-        logger.info("Retrieved %d participants.", len(participants))
+        logger.info("Streamed %d participants.", count)
+
+    # ✅ READ (PAGE)
+    def list_participants_page(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        start_at: str | None = None
+    ) -> Page:
+        """
+        Keyset pagination over participants, ordered by full name.
+        Pass page.next_cursor / page.prev_cursor to move,
+        or start_at to jump to a full name.
+        """
+        return self.repository.get_page(page_size, cursor, start_at)
 
-        return participants
-    
     # ✅ UPDATE
     def update_participant(
         self,
@@ -96,6 +167,22 @@ class ParticipantService(BaseService):
 
         return participant
     
+    # ✅ UPDATE (PARTIAL)
+    def patch_participant(self, participant_id: str, **fields) -> int:
+        """
+        Changes only the given fields with one UPDATE (no read first),
+        e.g. patch_participant(participant_id, is_vip=True).
+        """
+        fields = validate_record("participant", fields)
+
+        count = self.repository.patch(participant_id, **fields)
+        if count == 0:
+            raise ValueError("Participant not found.")
+
+        logger.info("Participant patched: id=%s, fields=%s", participant_id, ", ".join(fields))
+
+        return count
+
     # ✅ DELETE
     def delete_participant(self, participant_id: str) -> bool:
         deleted = self.repository.delete_by_id(participant_id)
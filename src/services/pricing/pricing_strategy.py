@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from array import array
+from typing import Iterable
 
 
 class PricingStrategy(ABC):
@@ -11,3 +13,11 @@ class PricingStrategy(ABC):
     @abstractmethod
     def calculate_price(self, base_price: float) -> float:
         pass
+
+    def calculate_prices(self, base_prices: Iterable[float]) -> array:
+        """
+        Batch version of calculate_price: one pass over a whole
+        column of base prices, returns an array('d') of final prices.
+        Subclasses override it with a tighter loop.
+        """
+        return array("d", map(self.calculate_price, base_prices))
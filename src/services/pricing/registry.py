@@ -0,0 +1,48 @@
+from typing import Dict
+
+from .pricing_strategy import PricingStrategy
+from .standard_pricing import StandardPricing
+from .student_pricing import StudentPricing
+from .vip_pricing import VipPricing
+
+
+class PricingRegistry:
+    """
+    Keeps ONE instance per pricing strategy and caches the mapping
+    from raw ticket_type strings ("VIP", " vip ", "Student", ...)
+    to that instance, so a sale does not build a new strategy object.
+    Unknown types fall back to Standard pricing.
+    """
+
+    MAX_CACHED_TYPES = 1024
+
+    def __init__(self):
+        self._strategies: Dict[str, PricingStrategy] = {
+            "standard": StandardPricing(),
+            "vip": VipPricing(),
+            "student": StudentPricing(),
+        }
+        self._default = self._strategies["standard"]
+        self._resolved: Dict[str, PricingStrategy] = {}
+
+    def register(self, name: str, strategy: PricingStrategy) -> None:
+        """
+        Adds (or replaces) a strategy – OCP: new pricing without
+        touching TicketService.
+        """
+        self._strategies[name.strip().lower()] = strategy
+        self._resolved.clear()
+
+    def get(self, ticket_type: str) -> PricingStrategy:
+        strategy = self._resolved.get(ticket_type)
+        if strategy is None:
+            key = (ticket_type or "").strip().lower()
+            strategy = self._strategies.get(key, self._default)
+            if len(self._resolved) >= self.MAX_CACHED_TYPES:
+                self._resolved.clear()
+            self._resolved[ticket_type] = strategy
+        return strategy
+
+
+# Shared default registry used by TicketService.
+default_registry = PricingRegistry()
@@ -1,3 +1,6 @@
+from array import array
+from typing import Iterable
+
 from .pricing_strategy import PricingStrategy
 
 
@@ -9,3 +12,6 @@ class StandardPricing(PricingStrategy):
 
     def calculate_price(self, base_price: float) -> float:
         return base_price
+
+    def calculate_prices(self, base_prices: Iterable[float]) -> array:
+        return array("d", base_prices)
@@ -1,3 +1,6 @@
+from array import array
+from typing import Iterable
+
 from .pricing_strategy import PricingStrategy
 
 
@@ -6,6 +9,11 @@ class StudentPricing(PricingStrategy):
     Student ticket pricing:
     Final price = base price * 0.7 (30% discount).
     """
+    MULTIPLIER = 0.7
 
     def calculate_price(self, base_price: float) -> float:
-        return base_price * 0.7
+        return base_price * self.MULTIPLIER
+
+    def calculate_prices(self, base_prices: Iterable[float]) -> array:
+        m = self.MULTIPLIER
+        return array("d", [p * m for p in base_prices])
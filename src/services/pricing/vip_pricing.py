@@ -1,3 +1,6 @@
+from array import array
+from typing import Iterable
+
 from .pricing_strategy import PricingStrategy
 
 
@@ -6,6 +9,11 @@ class VipPricing(PricingStrategy):
     VIP ticket pricing:
     Final price = base price * 1.5 (50% more).
     """
+    MULTIPLIER = 1.5
 
     def calculate_price(self, base_price: float) -> float:
-        return base_price * 1.5
+        return base_price * self.MULTIPLIER
+
+    def calculate_prices(self, base_prices: Iterable[float]) -> array:
+        m = self.MULTIPLIER
+        return array("d", [p * m for p in base_prices])
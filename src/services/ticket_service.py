@@ -1,38 +1,68 @@
 # src/services/ticket_service.py
 
-from typing import List
+from array import array
+from typing import Iterable, Iterator, List, Mapping
 
 from ..models.ticket import Ticket
+from ..analytics.ticket_batch import TicketBatch
+from ..repositories.pagination import DEFAULT_PAGE_SIZE, Page
+from ..repositories.base_repository import DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE
 from ..repositories.ticket_repository import TicketRepository
+from ..database.retry import run_with_busy_retry
 from ..logging_config import get_logger
+from ..utils.validators import validate_record
 from .base_service import BaseService
 
 from .pricing.pricing_strategy import PricingStrategy
-from .pricing.standard_pricing import StandardPricing
-from .pricing.vip_pricing import VipPricing
-from .pricing.student_pricing import StudentPricing
+from .pricing.registry import PricingRegistry, default_registry
+from .inventory.seat_inventory import SeatInventory
 
 logger = get_logger(__name__)
 
 
 class TicketService(BaseService):
-    def __init__(self, repository: TicketRepository):
+    def __init__(
+        self,
+        repository: TicketRepository,
+        pricing: PricingRegistry | None = None,
+        inventory: SeatInventory | None = None
+    ):
         super().__init__(repository)
+        self._pricing = pricing or default_registry
+        self._inventory = inventory
 
     # ---------- Strategy seçimi ---------- #
 
     def _get_pricing_strategy(self, ticket_type: str) -> PricingStrategy:
         """
-        Selects a pricing strategy based on ticket_type string.
+        Selects a pricing strategy based on ticket_type string
+        (cached, shared instances from the PricingRegistry).
         """
-        t = (ticket_type or "").strip().lower()
-        if t == "vip":
-            return VipPricing()
-        elif t == "student":
-            return StudentPricing()
-        else:
-            # default: Standard
-            return StandardPricing()
+        return self._pricing.get(ticket_type)
+
+    # ---------- Seat inventory ---------- #
+
+    @property
+    def inventory(self) -> SeatInventory | None:
+        return self._inventory
+
+    def _claim_seat(self, event_id: str, seat_number: str) -> None:
+        """
+        Claims the seat in the inventory (if one is attached).
+        Raises ValueError when the seat is taken or the event is sold out.
+        """
+        if self._inventory is None:
+            return
+        self._inventory.claim(event_id, seat_number)
+        self.repository.on_rollback(
+            lambda: self._inventory.release(event_id, seat_number)
+        )
+
+    def _release_seat(self, event_id: str, seat_number: str) -> None:
+        if self._inventory is None:
+            return
+        self._inventory.release(event_id, seat_number)
+        self.repository.on_rollback(lambda: self._inventory.invalidate(event_id))
 
     # ---------- Create / Sell Ticket ---------- #
 
@@ -50,23 +80,23 @@ class TicketService(BaseService):
         Creates and saves a ticket using the Strategy pattern
         to calculate the final price based on ticket type.
         """
-        if price < 0:
-            raise ValueError("Price cannot be negative.")
-
-        strategy = self._get_pricing_strategy(ticket_type)
-        final_price = strategy.calculate_price(price)
-
-        ticket = Ticket(
+        ticket = self._build_ticket(
             event_id=event_id,
             participant_id=participant_id,
-            price=final_price,
+            price=price,
             seat_number=seat_number,
             ticket_type=ticket_type,
             purchase_date=purchase_date,
             is_used=is_used
         )
+        final_price = ticket.price
 
-        self.repository.add(ticket)
+        self._claim_seat(event_id, seat_number)
+        try:
+            self.repository.add(ticket)
+        except Exception:
+            self._release_seat(event_id, seat_number)
+            raise
 
         # ✅ sadə, biznes səviyyəli log
         logger.info(
@@ -79,13 +109,194 @@ class TicketService(BaseService):
 
         return ticket
 
+    def reserve_ticket(
+        self,
+        event_id: str,
+        participant_id: str,
+        price: float,          # base price
+        seat_number: str,
+        ticket_type: str,
+        purchase_date: str
+    ) -> Ticket:
+        """
+        Concurrency-safe sale for shared database files: capacity check,
+        seat claim and insert happen atomically in the database
+        (TicketRepository.reserve), retried with backoff while another
+        process holds the write lock. Raises ValueError when the event
+        is sold out or the seat is taken.
+        """
+        ticket = self._build_ticket(
+            event_id=event_id,
+            participant_id=participant_id,
+            price=price,
+            seat_number=seat_number,
+            ticket_type=ticket_type,
+            purchase_date=purchase_date
+        )
+
+        try:
+            run_with_busy_retry(lambda: self.repository.reserve(ticket))
+        except ValueError:
+            # another process may have sold seats – local map is stale
+            if self._inventory is not None:
+                self._inventory.invalidate(event_id)
+            raise
+
+        if self._inventory is not None:
+            try:
+                self._claim_seat(event_id, seat_number)
+            except ValueError:
+                self._inventory.invalidate(event_id)
+
+        logger.info(
+            "Ticket reserved: id=%s, event_id=%s, seat=%s, final_price=%.2f",
+            ticket.id,
+            event_id,
+            seat_number,
+            ticket.price,
+        )
+
+        return ticket
+
+    def sell_tickets_bulk(
+        self,
+        sales: Iterable[Mapping],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Bulk version of sell_ticket for imports.
+        Each item of `sales` is a mapping with the same keys as
+        sell_ticket's arguments. Validation and pricing are applied
+        per row, rows are written with executemany in one transaction.
+        Returns the number of sold tickets.
+        """
+        touched_events = set()
+
+        def tickets():
+            for sale in sales:
+                ticket = self._build_ticket(**sale)
+                if self._inventory is not None:
+                    touched_events.add(ticket.event_id)
+                    self._inventory.claim(ticket.event_id, ticket.seat_number)
+                yield ticket
+
+        def resync():
+            for event_id in touched_events:
+                self._inventory.invalidate(event_id)
+
+        try:
+            count = self.repository.add_many(tickets(), chunk_size)
+        except Exception:
+            if self._inventory is not None:
+                resync()
+            raise
+
+        if self._inventory is not None:
+            self.repository.on_rollback(resync)
+
+        logger.info("Tickets sold in bulk: count=%d", count)
+
+        return count
+
+    def _build_ticket(
+        self,
+        event_id: str,
+        participant_id: str,
+        price: float,
+        seat_number: str,
+        ticket_type: str,
+        purchase_date: str,
+        is_used: bool = False
+    ) -> Ticket:
+        if price < 0:
+            raise ValueError("Price cannot be negative.")
+
+        strategy = self._get_pricing_strategy(ticket_type)
+
+        return Ticket(
+            event_id=event_id,
+            participant_id=participant_id,
+            price=strategy.calculate_price(price),
+            seat_number=seat_number,
+            ticket_type=ticket_type,
+            purchase_date=purchase_date,
+            is_used=is_used
+        )
+
+    def reprice_event(self, event_id: str, base_price: float) -> int:
+        """
+        Sets a new base price for every ticket of an event.
+        Tickets are grouped by type and each group is priced with ONE
+        calculate_prices() call; all rows are written in one transaction.
+        Returns the number of repriced tickets.
+        """
+        if base_price < 0:
+            raise ValueError("Price cannot be negative.")
+
+        ids_by_type = self.repository.get_ids_by_type(event_id)
+
+        def rows():
+            for ticket_type, ids in ids_by_type.items():
+                strategy = self._get_pricing_strategy(ticket_type)
+                prices = strategy.calculate_prices(array("d", [base_price]) * len(ids))
+                yield from zip(prices, ids)
+
+        count = self.repository.update_prices(rows())
+
+        logger.info(
+            "Event repriced: event_id=%s, base_price=%.2f, tickets=%d",
+            event_id,
+            base_price,
+            count,
+        )
+
+        return count
+
     # ---------- Read ---------- #
 
     def list_tickets(self) -> List[Ticket]:
-        tickets = self.repository.get_all()
-        # istəsən bu logu saxla, istəsən sil – zəruri deyil, amma pis də deyil
-        logger.info("Retrieved %d tickets.", len(tickets))
-        return tickets
+        """
+        Compatibility wrapper: all tickets as one list (built on
+        iter_tickets). The list holds every ticket – callers should
+        use iter_tickets or list_tickets_page instead.
+        """
+        return list(self.iter_tickets())
+
+    def iter_tickets(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Ticket]:
+        """
+        Streams tickets instead of building a full list –
+        memory stays flat even with millions of rows.
+        """
+        count = 0
+        for ticket in self.repository.iter_all(batch_size):
+            count += 1
+            yield ticket
+
+        logger.info("Streamed %d tickets.", count)
+
+    def list_tickets_page(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        start_at: str | None = None
+    ) -> Page:
+        """
+        Keyset pagination over tickets, ordered by purchase date.
+        Pass page.next_cursor / page.prev_cursor to move,
+        or start_at to jump to a purchase date.
+        """
+        return self.repository.get_page(page_size, cursor, start_at)
+
+    # ---------- Analytics ---------- #
+
+    def sales_batch(self, event_id: str | None = None) -> TicketBatch:
+        """
+        Columnar snapshot of ticket sales for revenue / attendance
+        reports, e.g. sales_batch().revenue_by_event().
+        """
+        batch = self.repository.load_batch(event_id)
+        logger.info("Loaded %d tickets for analytics.", len(batch))
+        return batch
 
     # ---------- Update ---------- #
 
@@ -112,6 +323,11 @@ class TicketService(BaseService):
         if price < 0:
             raise ValueError("Price cannot be negative.")
 
+        old_event_id, old_seat = ticket.event_id, ticket.seat_number
+        seat_changed = (event_id, seat_number) != (old_event_id, old_seat)
+        if seat_changed:
+            self._claim_seat(event_id, seat_number)
+
         ticket._event_id = event_id
         ticket._participant_id = participant_id
         ticket._price = price
@@ -120,7 +336,15 @@ class TicketService(BaseService):
         ticket._purchase_date = purchase_date
         ticket._is_used = is_used
 
-        self.repository.update(ticket)
+        try:
+            self.repository.update(ticket)
+        except Exception:
+            if seat_changed:
+                self._release_seat(event_id, seat_number)
+            raise
+
+        if seat_changed:
+            self._release_seat(old_event_id, old_seat)
 
         # ✅ update log
         logger.info(
@@ -132,13 +356,48 @@ class TicketService(BaseService):
 
         return ticket
 
+    def patch_ticket(self, ticket_id: str, **fields) -> int:
+        """
+        Changes only the given fields with one UPDATE and no read,
+        e.g. patch_ticket(ticket_id, is_used=True). The price is
+        stored as given (no pricing strategy). Event and seat cannot
+        be patched – use update_ticket for those.
+        """
+        fields = validate_record("ticket", fields)
+
+        count = self.repository.patch(ticket_id, **fields)
+        if count == 0:
+            raise ValueError("Ticket not found.")
+
+        logger.info("Ticket patched: id=%s, fields=%s", ticket_id, ", ".join(fields))
+
+        return count
+
+    def mark_event_tickets_used(self, event_id: str) -> int:
+        """
+        Marks every unused ticket of an event as used (one statement).
+        Returns the number of tickets changed.
+        """
+        count = self.repository.mark_event_used(event_id)
+
+        logger.info("Event tickets marked used: event_id=%s, tickets=%d", event_id, count)
+
+        return count
+
     # ---------- Delete ---------- #
 
     def delete_ticket(self, ticket_id: str) -> bool:
+        ticket = None
+        if self._inventory is not None:
+            ticket = self.repository.get_by_id(ticket_id)
+
         deleted = self.repository.delete_by_id(ticket_id)
         if not deleted:
             raise ValueError("Ticket not found.")
 
+        if ticket is not None:
+            self._release_seat(ticket.event_id, ticket.seat_number)
+
         # ✅ delete log
         logger.info("Ticket deleted: id=%s", ticket_id)
 
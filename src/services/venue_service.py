@@ -1,16 +1,32 @@
-from typing import List
+from typing import Iterator, List
 
 from ..models.venue import Venue
+from ..repositories.pagination import DEFAULT_PAGE_SIZE, Page
+from ..repositories.base_repository import DEFAULT_BATCH_SIZE
 from ..repositories.venue_repository import VenueRepository
 from ..logging_config import get_logger
+from ..utils.validators import validate_record
 from .base_service import BaseService
+from .inventory.seat_inventory import SeatInventory
 
 logger = get_logger(__name__)
 
 
 class VenueService(BaseService):
-    def __init__(self, repository: VenueRepository):
+    def __init__(self, repository: VenueRepository, inventory: SeatInventory | None = None):
         super().__init__(repository)
+        self._inventory = inventory
+
+    def _invalidate_seat_maps(self, venue_id: str) -> None:
+        """
+        Seat maps are sized from the venue capacity – drop them for
+        the venue's events (again on rollback: a map rebuilt inside
+        the unit of work saw the uncommitted capacity).
+        """
+        if self._inventory is None:
+            return
+        self._inventory.invalidate_venue(venue_id)
+        self.repository.on_rollback(lambda: self._inventory.invalidate_venue(venue_id))
 
     # ✅ CREATE
     def create_venue(
@@ -48,14 +64,37 @@ class VenueService(BaseService):
     # ✅ READ (LIST)
     def list_venues(self) -> List[Venue]:
         """
-        Returns all venues from the database.
+        Returns all venues as one list. Kept for compatibility –
+        it is built on iter_venues, but the list itself still holds
+        every row; prefer iter_venues / list_venues_page.
         """
-        venues = self.repository.get_all()
+        return list(self.iter_venues())
 
-        # ✅ BU LOG QALA BİLƏR (istəsən silə də bilərsən)
-        logger.info("Retrieved %d venues.", len(venues))
+    # ✅ READ (STREAM)
+    def iter_venues(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Venue]:
+        """
+        Lazy version of list_venues – yields venues batch by batch.
+        """
+        count = 0
+        for venue in self.repository.iter_all(batch_size):
+            count += 1
+            yield venue
 
-        return venues
+        logger.info("Streamed %d venues.", count)
+
+    # ✅ READ (PAGE)
+    def list_venues_page(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        start_at: str | None = None
+    ) -> Page:
+        """
+        Keyset pagination over venues, ordered by name.
+        Pass page.next_cursor / page.prev_cursor to move,
+        or start_at to jump to a name.
+        """
+        return self.repository.get_page(page_size, cursor, start_at)
 
     # ✅ UPDATE
     def update_venue(
@@ -75,6 +114,7 @@ class VenueService(BaseService):
         if capacity <= 0:
             raise ValueError("Capacity must be positive.")
 
+        capacity_changed = venue.capacity != capacity
         venue._name = name
         venue._address = address
         venue._capacity = capacity
@@ -83,17 +123,51 @@ class VenueService(BaseService):
         venue._is_open = is_open
 
         self.repository.update(venue)
+        if capacity_changed:
+            self._invalidate_seat_maps(venue_id)
 
         # ✅ LOG — UPDATE
         logger.info("Venue updated: id=%s, name=%s", venue.id, venue.name)
 
         return venue
     
+    # ✅ UPDATE (PARTIAL)
+    def patch_venue(self, venue_id: str, **fields) -> int:
+        """
+        Changes only the given fields with one UPDATE (no read first),
+        e.g. patch_venue(venue_id, phone="0501234567").
+        """
+        fields = validate_record("venue", fields)
+
+        count = self.repository.patch(venue_id, **fields)
+        if count == 0:
+            raise ValueError("Venue not found.")
+        if "capacity" in fields:
+            self._invalidate_seat_maps(venue_id)
+
+        logger.info("Venue patched: id=%s, fields=%s", venue_id, ", ".join(fields))
+
+        return count
+
+    def close_venue(self, venue_id: str) -> int:
+        """
+        Closes the venue and deactivates all of its events in one
+        transaction. Returns the number of deactivated events.
+        """
+        venues, events = self.repository.close(venue_id)
+        if venues == 0:
+            raise ValueError("Venue not found.")
+
+        logger.info("Venue closed: id=%s, events_deactivated=%d", venue_id, events)
+
+        return events
+
     # ✅ DELETE
     def delete_venue(self, venue_id: str) -> bool:
         deleted = self.repository.delete_by_id(venue_id)
         if not deleted:
             raise ValueError("Venue not found.")
+        self._invalidate_seat_maps(venue_id)
 
         # ✅ LOG — DELETE
         logger.info("Venue deleted: id=%s", venue_id)
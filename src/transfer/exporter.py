@@ -0,0 +1,324 @@
+# src/transfer/exporter.py
+"""
+Streaming exporters: CSV, JSONL and a gzip-compressed columnar format.
+
+    python -m src.transfer.exporter tickets tickets.csv
+    python -m src.transfer.exporter tickets delta.cols.gz --watermark purchase_date --state nightly.json
+    python -m src.transfer.exporter participants people.jsonl.gz --since 120000
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..database.connection import CONNECTION_PROFILES, DEFAULT_PROFILE, DatabaseConnection
+from ..logging_config import get_logger, setup_logging
+from ..repositories.base_repository import DEFAULT_BATCH_SIZE
+from ..repositories.event_repository import EventRepository
+from ..repositories.participant_repository import ParticipantRepository
+from ..repositories.ticket_repository import TicketRepository
+from ..repositories.venue_repository import VenueRepository
+
+logger = get_logger(__name__)
+
+TABLES = {
+    "venues": VenueRepository,
+    "events": EventRepository,
+    "participants": ParticipantRepository,
+    "tickets": TicketRepository,
+}
+
+# stored as 0/1 in SQLite, exported as true/false in JSON formats
+BOOL_COLUMNS = {"is_open", "is_active", "is_vip", "is_used"}
+
+COLUMNAR_FORMAT = "event-management-columnar"
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+
+def detect_format(path: str) -> tuple[str, bool]:
+    """
+    (format, gzip?) from the file name:
+    .csv / .jsonl (optionally + .gz) and .cols.gz (columnar, always gzip).
+    """
+    name = path.lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+    for fmt in ("csv", "jsonl", "cols"):
+        if name.endswith("." + fmt):
+            return fmt, compressed or fmt == "cols"
+    raise ValueError("Output must end with .csv, .jsonl or .cols.gz (optionally .gz).")
+
+
+class CsvWriter:
+    def __init__(self, f, columns: List[str]):
+        self._writer = csv.writer(f)
+        self._writer.writerow(columns)
+
+    def write_rows(self, rows: List[tuple]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        pass
+
+
+class JsonlWriter:
+    def __init__(self, f, columns: List[str]):
+        self._f = f
+        self._columns = columns
+        self._bools = [i for i, c in enumerate(columns) if c in BOOL_COLUMNS]
+
+    def write_rows(self, rows: List[tuple]) -> None:
+        lines = []
+        for row in rows:
+            record = dict(zip(self._columns, row))
+            for i in self._bools:
+                record[self._columns[i]] = bool(row[i])
+            lines.append(json.dumps(record, ensure_ascii=False))
+        self._f.write("\n".join(lines) + "\n")
+
+    def close(self) -> None:
+        pass
+
+
+class ColumnarWriter:
+    """
+    Column-oriented JSON lines, gzip-compressed:
+
+        {"format": ..., "version": 1, "table": ..., "columns": [...]}
+        {"rows": n, "columns": {"id": [...], "price": [...], ...}}   <- row group
+        ...
+
+    Values of one column sit next to each other, which compresses much
+    better than rows and lets readers load only the columns they need.
+    Only one row group is held in memory.
+    """
+
+    def __init__(self, f, columns: List[str], table: str,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        self._f = f
+        self._columns = columns
+        self._row_group_size = row_group_size
+        self._pending: List[tuple] = []
+        f.write(json.dumps({
+            "format": COLUMNAR_FORMAT, "version": 1, "table": table, "columns": columns,
+        }) + "\n")
+
+    def write_rows(self, rows: List[tuple]) -> None:
+        self._pending.extend(rows)
+        while len(self._pending) >= self._row_group_size:
+            self._flush(self._pending[:self._row_group_size])
+            del self._pending[:self._row_group_size]
+
+    def _flush(self, rows: List[tuple]) -> None:
+        group = {}
+        for name, values in zip(self._columns, zip(*rows)):
+            group[name] = [bool(v) for v in values] if name in BOOL_COLUMNS else list(values)
+        self._f.write(json.dumps({"rows": len(rows), "columns": group}, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        if self._pending:
+            self._flush(self._pending)
+            self._pending = []
+
+
+def read_columnar(path: str, columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Streams rows (dicts) back from a columnar file, one row group at a time.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != COLUMNAR_FORMAT:
+            raise ValueError("Not a columnar export file.")
+        names = columns or header["columns"]
+        for line in f:
+            group = json.loads(line)["columns"]
+            yield from (dict(zip(names, values)) for values in zip(*(group[n] for n in names)))
+
+
+class ExportReport:
+    def __init__(self, table: str, path: str, watermark: str):
+        self.table = table
+        self.path = path
+        self.watermark = watermark
+        self.rows = 0
+        self.high_watermark: Any = None
+        # ids exported at high_watermark (date watermarks only)
+        self.boundary_ids: List[str] = []
+        self.elapsed = 0.0
+
+    def summary(self) -> str:
+        rate = self.rows / self.elapsed if self.elapsed else 0.0
+        return (
+            f"Exported {self.rows} {self.table} to {self.path} in {self.elapsed:.2f}s "
+            f"({rate:,.0f} rows/sec), {self.watermark} watermark = {self.high_watermark}"
+        )
+
+
+class Exporter:
+    """
+    Streams a table to a file: rows are read with fetchmany
+    (batch_size at a time) as plain tuples – no model objects – and
+    written immediately, so memory does not depend on table size.
+
+    Incremental export: pass `since` (value of the watermark column)
+    to move only rows added after the previous run; the report's
+    high_watermark is the value to pass next time. Date watermarks are
+    day-granular, so also pass the report's boundary_ids as
+    `exported_ids`: rows of the `since` day are then re-read and only
+    the ids not exported before are written.
+
+    The file is written under a temporary name and renamed at the
+    end, so a failed run never leaves a half-written export behind.
+    """
+
+    def __init__(self, connection, batch_size: int = DEFAULT_BATCH_SIZE,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        self._conn = connection
+        self._batch_size = batch_size
+        self._row_group_size = row_group_size
+
+    def export(
+        self,
+        table: str,
+        path: str,
+        watermark: str = "rowid",
+        since: Optional[Any] = None,
+        exported_ids: Optional[Iterable[str]] = None
+    ) -> ExportReport:
+        if table not in TABLES:
+            raise ValueError(f"Unknown table '{table}'. Available: {', '.join(TABLES)}")
+        fmt, compressed = detect_format(path)
+        repository = TABLES[table](self._conn)
+        columns = repository.column_names()
+
+        report = ExportReport(table, path, watermark)
+        report.high_watermark = since
+        skip = set(exported_ids) if exported_ids is not None else set()
+        report.boundary_ids = list(skip)
+        track = watermark != "rowid"
+        started = time.perf_counter()
+        tmp_path = path + ".part"
+
+        raw = gzip.open(tmp_path, "wb", compresslevel=6) if compressed else open(tmp_path, "wb")
+        try:
+            with io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+                writer = self._writer(fmt, f, columns, table)
+                batch: List[tuple] = []
+                rows = repository.iter_rows_since(
+                    watermark, since, self._batch_size, inclusive=exported_ids is not None
+                )
+                for row in rows:
+                    if track:
+                        # row[1] is the id
+                        if row[0] == since and row[1] in skip:
+                            continue
+                        if row[0] != report.high_watermark:
+                            report.boundary_ids = []
+                        report.boundary_ids.append(row[1])
+                    report.high_watermark = row[0]
+                    batch.append(row[1:])
+                    if len(batch) >= self._batch_size:
+                        writer.write_rows(batch)
+                        report.rows += len(batch)
+                        batch = []
+                if batch:
+                    writer.write_rows(batch)
+                    report.rows += len(batch)
+                writer.close()
+            os.replace(tmp_path, path)
+        except BaseException:
+            raw.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        report.elapsed = time.perf_counter() - started
+        logger.info(
+            "Export finished: table=%s, rows=%d, file=%s, %s > %s -> %s",
+            table, report.rows, path, watermark, since, report.high_watermark
+        )
+        return report
+
+    def _writer(self, fmt: str, f, columns: List[str], table: str):
+        if fmt == "csv":
+            return CsvWriter(f, columns)
+        if fmt == "jsonl":
+            return JsonlWriter(f, columns)
+        return ColumnarWriter(f, columns, table, self._row_group_size)
+
+
+# ---------- Watermark state (nightly jobs) ---------- #
+
+def load_state(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(path: str, state: dict) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export a table to CSV, JSONL or columnar")
+    parser.add_argument("table", choices=sorted(TABLES))
+    parser.add_argument("file", help="Output: .csv, .jsonl, .cols.gz (csv/jsonl may add .gz)")
+    parser.add_argument("--db", default="event_management.db", help="SQLite database file")
+    parser.add_argument(
+        "--profile",
+        choices=sorted(CONNECTION_PROFILES),
+        default=DEFAULT_PROFILE,
+        help=f"Connection PRAGMA profile (default: {DEFAULT_PROFILE})"
+    )
+    parser.add_argument("--watermark", default="rowid",
+                        help="Column for incremental export (rowid, tickets: purchase_date, events: date)")
+    parser.add_argument("--since", help="Export only rows with watermark > SINCE")
+    parser.add_argument("--state", help="JSON file remembering the last watermark per table "
+                                        "(and, for date watermarks, the ids of the last day)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_logging(use_queue=True)
+
+    state = load_state(args.state) if args.state else {}
+    key = f"{args.table}.{args.watermark}"
+    since, exported_ids = state.get(key), None
+    if isinstance(since, dict):
+        # date watermark: {"since": day, "ids": [ids already exported on that day]}
+        since, exported_ids = since["since"], since["ids"]
+    if args.since is not None:
+        since, exported_ids = args.since, None
+    if since is not None and args.watermark == "rowid":
+        since = int(since)
+
+    db = DatabaseConnection(args.db, profile=args.profile)
+    try:
+        report = Exporter(db.connection, args.batch_size).export(
+            args.table, args.file, args.watermark, since, exported_ids
+        )
+    finally:
+        db.close()
+
+    if args.state and report.high_watermark is not None:
+        if args.watermark == "rowid":
+            state[key] = report.high_watermark
+        else:
+            state[key] = {"since": report.high_watermark, "ids": report.boundary_ids}
+        save_state(args.state, state)
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+# src/transfer/gate_snapshot.py
+"""
+Offline check-in for gate devices without database access.
+
+    python -m src.transfer.gate_snapshot build <event_id> gate.snap --db event_management.db
+    python -m src.transfer.gate_snapshot scan gate.snap --journal gate1.scans.jsonl --gate gate1
+    python -m src.transfer.gate_snapshot merge gate1.scans.jsonl gate2.scans.jsonl --db event_management.db
+
+build writes one event's tickets as a compact binary file; scan
+validates ticket ids (one per stdin line) against it and journals
+admitted tickets; merge marks the journaled tickets used in the
+database once the device is back online.
+
+File layout (little-endian):
+    header   128 bytes (HEADER)
+    hashes   count x uint64, sorted – 64-bit salted hash of ticket id
+    used     ceil(count / 8) bytes, bit i = ticket of hashes[i] was
+             already used when the snapshot was built
+"""
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from ..database.connection import DatabaseConnection
+from ..logging_config import get_logger, setup_logging
+from ..repositories.event_repository import EventRepository
+from ..repositories.ticket_repository import TicketRepository
+from ..services.checkin.check_in_service import ALREADY_USED, UNKNOWN, VALID
+
+logger = get_logger(__name__)
+
+MAGIC = b"EMGATE01"
+VERSION = 1
+# magic, version, flags, count, salt, created_at, event_id
+HEADER = struct.Struct("<8sHHQ16sd64s20x")
+MAX_SALT_ATTEMPTS = 8
+
+
+def ticket_hash(ticket_id: str, salt: bytes) -> int:
+    digest = hashlib.blake2b(ticket_id.encode("utf-8"), digest_size=8, salt=salt).digest()
+    return int.from_bytes(digest, "little")
+
+
+# ---------- Build ---------- #
+
+class SnapshotReport:
+    def __init__(self, event_id: str, path: str):
+        self.event_id = event_id
+        self.path = path
+        self.tickets = 0
+        self.used = 0
+        self.size = 0
+        self.elapsed = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Snapshot of event {self.event_id}: {self.tickets} tickets "
+            f"({self.used} already used), {self.size:,} bytes -> {self.path} "
+            f"in {self.elapsed:.2f}s"
+        )
+
+
+def build_snapshot(connection, event_id: str, path: str) -> SnapshotReport:
+    """
+    Writes the gate snapshot of one event. The file is written under
+    a temporary name and renamed at the end.
+    """
+    if len(event_id.encode("utf-8")) > 64:
+        raise ValueError("Event id is too long for a snapshot (max 64 bytes).")
+    if EventRepository(connection).get_by_id(event_id) is None:
+        raise ValueError("Event not found.")
+
+    report = SnapshotReport(event_id, path)
+    started = time.perf_counter()
+    states = list(TicketRepository(connection).iter_check_in_states(event_id))
+
+    # a new salt in the (very unlikely) case of a 64-bit collision
+    for _ in range(MAX_SALT_ATTEMPTS):
+        salt = os.urandom(16)
+        entries = sorted((ticket_hash(ticket_id, salt), used) for ticket_id, used in states)
+        if all(entries[i][0] != entries[i + 1][0] for i in range(len(entries) - 1)):
+            break
+    else:
+        raise ValueError("Could not build collision-free ticket hashes.")
+
+    hashes = array("Q", (entry[0] for entry in entries))
+    used = bytearray((len(entries) + 7) // 8)
+    for index, (_, is_used) in enumerate(entries):
+        if is_used:
+            used[index >> 3] |= 1 << (index & 7)
+            report.used += 1
+    if sys.byteorder != "little":
+        hashes.byteswap()
+
+    tmp_path = path + ".part"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(
+                MAGIC, VERSION, 0, len(entries), salt, time.time(), event_id.encode("utf-8")
+            ))
+            hashes.tofile(f)
+            f.write(used)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    report.tickets = len(entries)
+    report.size = os.path.getsize(path)
+    report.elapsed = time.perf_counter() - started
+    logger.info("Gate snapshot built: event_id=%s, tickets=%d, file=%s", event_id, report.tickets, path)
+    return report
+
+
+# ---------- Offline reader ---------- #
+
+class GateSnapshot:
+    """
+    Memory-mapped, read-only view of a snapshot. Lookups hash the id
+    and binary-search the mapped hash array in place (no copy, no
+    parsing at open), so opening is instant and a scan takes a few
+    microseconds regardless of event size.
+
+    Tickets admitted on this device are kept in a separate bitmap and
+    appended to the journal (JSON lines); reopening with the same
+    journal restores them after a restart.
+    """
+
+    def __init__(self, path: str, journal_path: Optional[str] = None, gate: str = "gate"):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._mmap)
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+        self._gate = gate
+        self._lock = threading.Lock()
+        self._scanned = bytearray(len(self._used))
+        self._journal = None
+        if journal_path is not None:
+            if os.path.exists(journal_path):
+                self._replay(journal_path)
+            self._journal = open(journal_path, "a", encoding="utf-8")
+            if self._journal.tell() and not _ends_with_newline(journal_path):
+                self._journal.write("\n")    # after a torn last line
+
+    def _open(self) -> None:
+        if len(self._view) < HEADER.size:
+            raise ValueError("Not a gate snapshot (file too short).")
+        magic, version, _, count, salt, created_at, event_id = HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            raise ValueError("Not a gate snapshot (bad magic).")
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}.")
+
+        hashes_end = HEADER.size + 8 * count
+        used_end = hashes_end + (count + 7) // 8
+        if len(self._view) < used_end:
+            raise ValueError("Gate snapshot is truncated.")
+
+        self._count = count
+        self._salt = salt
+        self._created_at = created_at
+        self._event_id = event_id.rstrip(b"\0").decode("utf-8")
+        if sys.byteorder == "little":
+            self._hashes = self._view[HEADER.size:hashes_end].cast("Q")
+        else:
+            # big-endian host: one byte-swapped copy at open
+            self._hashes = array("Q")
+            self._hashes.frombytes(self._view[HEADER.size:hashes_end])
+            self._hashes.byteswap()
+        self._used = self._view[hashes_end:used_end]
+
+    @property
+    def event_id(self) -> str:
+        return self._event_id
+
+    @property
+    def created_at(self) -> float:
+        return self._created_at
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _index(self, ticket_id: str) -> Optional[int]:
+        key = ticket_hash(ticket_id, self._salt)
+        index = bisect.bisect_left(self._hashes, key)
+        if index < self._count and self._hashes[index] == key:
+            return index
+        return None
+
+    def _is_used(self, index: int) -> bool:
+        byte, bit = index >> 3, 1 << (index & 7)
+        return bool((self._used[byte] | self._scanned[byte]) & bit)
+
+    def status(self, ticket_id: str) -> str:
+        """
+        VALID / ALREADY_USED / UNKNOWN without admitting the ticket.
+        """
+        index = self._index(ticket_id)
+        if index is None:
+            return UNKNOWN
+        return ALREADY_USED if self._is_used(index) else VALID
+
+    def scan(self, ticket_id: str) -> str:
+        """
+        Admits the ticket if it is valid: VALID (now used on this
+        device), ALREADY_USED or UNKNOWN.
+        """
+        index = self._index(ticket_id)
+        if index is None:
+            return UNKNOWN
+        with self._lock:
+            if self._is_used(index):
+                return ALREADY_USED
+            self._scanned[index >> 3] |= 1 << (index & 7)
+            if self._journal is not None:
+                self._journal.write(json.dumps({
+                    "event_id": self._event_id,
+                    "ticket_id": ticket_id,
+                    "gate": self._gate,
+                    "scanned_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                }) + "\n")
+                self._journal.flush()
+        return VALID
+
+    def _replay(self, journal_path: str) -> None:
+        for scan in read_journal([journal_path]):
+            if scan["event_id"] != self._event_id:
+                continue
+            index = self._index(scan["ticket_id"])
+            if index is not None:
+                self._scanned[index >> 3] |= 1 << (index & 7)
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+        if getattr(self, "_journal", None) is not None:
+            self._journal.close()
+            self._journal = None
+        # views must be released before the map can be closed
+        for name in ("_hashes", "_used"):
+            view = self.__dict__.pop(name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._view.release()
+        self._mmap.close()
+        self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "GateSnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# ---------- Merge (back online) ---------- #
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def read_journal(paths: Iterable[str]) -> Iterable[dict]:
+    """
+    Scans from journal files; an unreadable line (e.g. the last line
+    of a device that lost power mid-write) is skipped.
+    """
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    scan = json.loads(line)
+                    if isinstance(scan["event_id"], str) and isinstance(scan["ticket_id"], str):
+                        yield scan
+                        continue
+                except (ValueError, KeyError, TypeError):
+                    pass
+                logger.warning("Skipped journal line: file=%s, line=%d", path, line_no)
+
+
+class MergeReport:
+    def __init__(self):
+        self.scans = 0
+        self.merged = 0          # marked used now
+        self.already_used = 0    # used online or merged before
+        self.unknown = 0         # deleted since the snapshot
+        self.duplicates = 0      # admitted by more than one device
+        self.elapsed = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Merged {self.merged} of {self.scans} offline scans "
+            f"({self.already_used} already used, {self.unknown} unknown, "
+            f"{self.duplicates} admitted twice offline) in {self.elapsed:.2f}s"
+        )
+
+
+def merge_scans(connection, journal_paths: Iterable[str]) -> MergeReport:
+    """
+    Marks the journaled tickets used: per event ONE batched
+    conditional update (TicketRepository.use_tickets), so running the
+    merge again is harmless.
+    """
+    report = MergeReport()
+    started = time.perf_counter()
+    by_event: Dict[str, List[str]] = {}
+    seen = set()
+    for scan in read_journal(journal_paths):
+        report.scans += 1
+        key = (scan["event_id"], scan["ticket_id"])
+        if key in seen:
+            report.duplicates += 1
+            continue
+        seen.add(key)
+        by_event.setdefault(scan["event_id"], []).append(scan["ticket_id"])
+
+    repository = TicketRepository(connection)
+    for event_id, ticket_ids in by_event.items():
+        states = repository.use_tickets(ticket_ids, event_id)
+        report.unknown += len(ticket_ids) - len(states)
+        report.already_used += sum(states.values())
+        report.merged += len(states) - sum(states.values())
+
+    report.elapsed = time.perf_counter() - started
+    logger.info(
+        "Offline scans merged: scans=%d, merged=%d, already_used=%d, unknown=%d, duplicates=%d",
+        report.scans, report.merged, report.already_used, report.unknown, report.duplicates
+    )
+    return report
+
+
+# ---------- CLI ---------- #
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline gate snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Write an event's snapshot")
+    build.add_argument("event_id")
+    build.add_argument("file")
+    build.add_argument("--db", default="event_management.db", help="SQLite database file")
+
+    scan = commands.add_parser("scan", help="Validate ticket ids read from stdin (offline)")
+    scan.add_argument("file")
+    scan.add_argument("--journal", required=True, help="Append admitted tickets to this file")
+    scan.add_argument("--gate", default="gate", help="Device name stored in the journal")
+
+    merge = commands.add_parser("merge", help="Mark journaled tickets used in the database")
+    merge.add_argument("journals", nargs="+")
+    merge.add_argument("--db", default="event_management.db", help="SQLite database file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_logging(use_queue=True)
+
+    if args.command == "scan":
+        with GateSnapshot(args.file, args.journal, args.gate) as snapshot:
+            print(f"Event {snapshot.event_id}: {len(snapshot)} tickets. Scan ticket ids (Ctrl+D to stop).")
+            for line in sys.stdin:
+                ticket_id = line.strip()
+                if ticket_id:
+                    print(f"{ticket_id}: {snapshot.scan(ticket_id)}", flush=True)
+        return
+
+    db = DatabaseConnection(args.db)
+    try:
+        if args.command == "build":
+            report = build_snapshot(db.connection, args.event_id, args.file)
+        else:
+            report = merge_scans(db.connection, args.journals)
+    finally:
+        db.close()
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+# src/transfer/importer.py
+"""
+Streaming CSV/JSONL importer for participants and tickets.
+
+    python -m src.transfer.importer participants attendees.csv [--rejects bad.csv]
+    python -m src.transfer.importer tickets sales.jsonl --db other.db
+"""
+import argparse
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..database.connection import CONNECTION_PROFILES, DatabaseConnection
+from ..database.schema import initialize_database
+from ..logging_config import get_logger, setup_logging
+from ..repositories.base_repository import DEFAULT_CHUNK_SIZE
+from ..repositories.event_repository import EventRepository
+from ..repositories.participant_repository import ParticipantRepository
+from ..repositories.ticket_repository import TicketRepository
+from ..repositories.venue_repository import VenueRepository
+from ..services.inventory.seat_inventory import SeatInventory
+from ..services.participant_service import ParticipantService
+from ..services.ticket_service import TicketService
+from ..utils.validators import validate_records
+from .progress import ProgressMeter
+from .readers import LineSource, is_csv, read_records
+
+logger = get_logger(__name__)
+
+# column -> required?  (other columns in the file are ignored)
+PARTICIPANT_COLUMNS = {
+    "full_name": True,
+    "email": True,
+    "phone": True,
+    "age": True,
+    "gender": True,
+    "registration_date": True,
+    "is_vip": False,
+}
+
+TICKET_COLUMNS = {
+    "event_id": True,
+    "participant_id": True,
+    "price": True,             # base price – the pricing strategy is applied
+    "seat_number": True,
+    "ticket_type": True,
+    "purchase_date": True,
+    "is_used": False,
+}
+
+
+class RejectWriter:
+    """
+    Streams rejected rows to a file in the input's format, with the
+    line number and the reason. The file is only created on the
+    first reject.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._csv = None
+
+    def write(self, line_no: int, record, reason: str) -> None:
+        if not isinstance(record, dict):
+            record = {}
+        if self._file is None:
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            if is_csv(self.path):
+                self._csv = csv.DictWriter(
+                    self._file,
+                    fieldnames=["line", "error", *record],
+                    extrasaction="ignore"
+                )
+                self._csv.writeheader()
+
+        if self._csv is not None:
+            self._csv.writerow({**record, "line": line_no, "error": reason})
+        else:
+            self._file.write(json.dumps(
+                {"line": line_no, "error": reason, "record": record},
+                ensure_ascii=False
+            ) + "\n")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class ImportReport:
+    def __init__(self, kind: str, reject_path: str):
+        self.kind = kind
+        self.reject_path = reject_path
+        self.imported = 0
+        self.rejected = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return (self.imported + self.rejected) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        text = (
+            f"Imported {self.imported} {self.kind}, rejected {self.rejected} "
+            f"in {self.elapsed:.2f}s ({self.rows_per_sec:,.0f} rows/sec)"
+        )
+        if self.rejected:
+            text += f"\nRejected rows: {self.reject_path}"
+        return text
+
+
+def default_reject_path(path: str) -> str:
+    # attendees.csv -> attendees.rejects.csv
+    p = Path(path)
+    return str(p.with_name(f"{p.stem}.rejects{p.suffix or '.jsonl'}"))
+
+
+class Importer:
+    """
+    Import pipeline: read (stream) -> validate -> bulk insert.
+
+    - rows are streamed and validated a chunk at a time, column by
+      column, with the CLI rules (validators.validate_records), so
+      memory does not depend on file size
+    - valid rows are written chunk_size at a time through the services'
+      bulk methods (executemany, one transaction per chunk)
+    - a chunk the database refuses (e.g. a duplicate seat) is retried
+      row by row, so only the offending rows are rejected
+    - invalid rows go to the reject file with line number and reason
+    """
+
+    def __init__(
+        self,
+        connection,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        show_progress: bool = True
+    ):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+        self._chunk_size = chunk_size
+        self._show_progress = show_progress
+
+        ticket_repo = TicketRepository(connection)
+        self._participant_service = ParticipantService(ParticipantRepository(connection))
+        # the seat inventory rejects sold-out / double-sold rows before insert
+        self._inventory = SeatInventory(
+            ticket_repo, EventRepository(connection), VenueRepository(connection)
+        )
+        self._ticket_service = TicketService(ticket_repo, inventory=self._inventory)
+
+    # ---------- Public API ---------- #
+
+    def import_participants(self, path: str, reject_path: Optional[str] = None) -> ImportReport:
+        return self._import(
+            "participants",
+            path,
+            reject_path,
+            lambda records: _validate_chunk("participant", PARTICIPANT_COLUMNS, records),
+            lambda rows: self._participant_service.create_participants_bulk(rows, self._chunk_size)
+        )
+
+    def import_tickets(self, path: str, reject_path: Optional[str] = None) -> ImportReport:
+        def validate(records):
+            rows, errors = _validate_chunk("ticket", TICKET_COLUMNS, records)
+            for i, row in enumerate(rows):
+                if row is None:
+                    continue
+                try:
+                    sold, capacity = self._inventory.availability(row["event_id"])
+                    if sold >= capacity:
+                        raise ValueError("Event is sold out.")
+                    if not self._inventory.is_available(row["event_id"], row["seat_number"]):
+                        raise ValueError(f"Seat {row['seat_number']} is already sold.")
+                except ValueError as exc:
+                    rows[i], errors[i] = None, str(exc)
+            return rows, errors
+
+        return self._import(
+            "tickets",
+            path,
+            reject_path,
+            validate,
+            lambda rows: self._ticket_service.sell_tickets_bulk(rows, self._chunk_size)
+        )
+
+    # ---------- Pipeline ---------- #
+
+    def _import(
+        self,
+        kind: str,
+        path: str,
+        reject_path: Optional[str],
+        validate: Callable[[List[dict]], Tuple[List[Optional[dict]], Dict[int, str]]],
+        write: Callable[[List[dict]], int]
+    ) -> ImportReport:
+        reject_path = reject_path or default_reject_path(path)
+        report = ImportReport(kind, reject_path)
+        rejects = RejectWriter(reject_path)
+        source = LineSource(path)
+        meter = ProgressMeter(
+            f"Importing {kind}",
+            fraction=lambda: source.bytes_read / source.size if source.size else 1.0
+        ) if self._show_progress else None
+
+        logger.info("Import started: kind=%s, file=%s", kind, path)
+        started = time.perf_counter()
+        pending: List[Tuple[int, dict]] = []
+        try:
+            for line_no, record in read_records(source):
+                if isinstance(record, Exception):
+                    report.rejected += 1
+                    rejects.write(line_no, record, str(record))
+                    continue
+
+                pending.append((line_no, record))
+                if len(pending) >= self._chunk_size:
+                    self._process(pending, validate, write, rejects, report)
+                    pending = []
+                    if meter is not None:
+                        meter.update(report.imported, report.rejected)
+
+            if pending:
+                self._process(pending, validate, write, rejects, report)
+        finally:
+            rejects.close()
+            report.elapsed = time.perf_counter() - started
+            if meter is not None:
+                meter.finish(report.imported, report.rejected)
+
+        logger.info(
+            "Import finished: kind=%s, imported=%d, rejected=%d, elapsed=%.2fs",
+            kind, report.imported, report.rejected, report.elapsed
+        )
+        return report
+
+    @staticmethod
+    def _process(pending, validate, write, rejects: RejectWriter, report: ImportReport) -> None:
+        """
+        Validates a chunk column by column, rejects the bad rows and
+        bulk-inserts the rest; a chunk the database refuses is retried
+        row by row.
+        """
+        rows, errors = validate([record for _, record in pending])
+        chunk = []
+        for i, (line_no, record) in enumerate(pending):
+            if i in errors:
+                report.rejected += 1
+                rejects.write(line_no, record, errors[i])
+            else:
+                chunk.append((line_no, record, rows[i]))
+        if not chunk:
+            return
+
+        try:
+            report.imported += write([row for _, _, row in chunk])
+            return
+        except Exception as exc:
+            logger.warning("Import chunk failed (%s), retrying row by row.", exc)
+
+        for line_no, record, row in chunk:
+            try:
+                report.imported += write([row])
+            except Exception as exc:
+                report.rejected += 1
+                rejects.write(line_no, record, str(exc))
+
+
+def _validate_chunk(
+    kind: str,
+    columns: dict,
+    records: List[dict]
+) -> Tuple[List[Optional[dict]], Dict[int, str]]:
+    """
+    Keeps the known columns (empty CSV cells = not given), checks the
+    required ones and validates the chunk column by column with the
+    CLI rules (validators.validate_records).
+    """
+    rows: List[Optional[dict]] = [None] * len(records)
+    errors: Dict[int, str] = {}
+    complete = []
+    for i, record in enumerate(records):
+        row = {
+            name: value for name, value in record.items()
+            if name in columns and value not in ("", None)
+        }
+        missing = [name for name, required in columns.items() if required and name not in row]
+        if missing:
+            errors[i] = f"Missing required field(s): {', '.join(missing)}."
+        else:
+            complete.append((i, row))
+
+    validated, column_errors = validate_records(kind, [row for _, row in complete])
+    for position, (i, _) in enumerate(complete):
+        if position in column_errors:
+            errors[i] = column_errors[position]
+        else:
+            rows[i] = validated[position]
+    return rows, errors
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Import participants or tickets from CSV/JSONL")
+    parser.add_argument("kind", choices=["participants", "tickets"])
+    parser.add_argument("file", help="Input file (.csv or .jsonl)")
+    parser.add_argument("--db", default="event_management.db", help="SQLite database file")
+    parser.add_argument(
+        "--profile",
+        choices=sorted(CONNECTION_PROFILES),
+        default="bulk-load",
+        help="Connection PRAGMA profile (default: bulk-load)"
+    )
+    parser.add_argument("--rejects", help="Reject file (default: <file>.rejects.<ext>)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--quiet", action="store_true", help="No progress meter")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_logging(use_queue=True)
+
+    db = DatabaseConnection(args.db, profile=args.profile)
+    initialize_database(db.connection)
+
+    importer = Importer(db.connection, args.chunk_size, show_progress=not args.quiet)
+    if args.kind == "participants":
+        report = importer.import_participants(args.file, args.rejects)
+    else:
+        report = importer.import_tickets(args.file, args.rejects)
+
+    db.close()
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# src/transfer/progress.py
+import sys
+import time
+from typing import Callable, Optional, TextIO
+
+
+class ProgressMeter:
+    """
+    Single-line progress / throughput meter (stderr by default),
+    redrawn at most every `interval` seconds so it costs nothing
+    per row.
+
+        meter = ProgressMeter("participants", fraction=lambda: src.bytes_read / src.size)
+        meter.update(done, rejected)
+        meter.finish(done, rejected)
+    """
+
+    def __init__(
+        self,
+        label: str,
+        fraction: Optional[Callable[[], float]] = None,
+        stream: TextIO = sys.stderr,
+        interval: float = 0.5
+    ):
+        self._label = label
+        self._fraction = fraction
+        self._stream = stream
+        self._interval = interval
+        self._started = time.perf_counter()
+        self._next_draw = self._started + interval
+
+    def update(self, done: int, rejected: int = 0) -> None:
+        now = time.perf_counter()
+        if now < self._next_draw:
+            return
+        self._next_draw = now + self._interval
+        self._draw(done, rejected, now, end="\r")
+
+    def finish(self, done: int, rejected: int = 0) -> None:
+        self._draw(done, rejected, time.perf_counter(), end="\n")
+
+    def _draw(self, done: int, rejected: int, now: float, end: str) -> None:
+        elapsed = now - self._started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        text = f"{self._label}: {done} rows, {rejected} rejected, {rate:,.0f} rows/s"
+        if self._fraction is not None:
+            text += f", {min(self._fraction(), 1.0):.0%}"
+        self._stream.write(f"{text}, {elapsed:.1f}s{end}")
+        self._stream.flush()
@@ -0,0 +1,64 @@
+# src/transfer/readers.py
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Iterator, Tuple
+
+
+def is_csv(path: str) -> bool:
+    return Path(path).suffix.lower() == ".csv"
+
+
+class LineSource:
+    """
+    Reads a UTF-8 text file line by line (binary under the hood) and
+    counts the bytes consumed, so progress can be shown as a
+    percentage of the file without loading it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.bytes_read = 0
+
+    def __iter__(self) -> Iterator[str]:
+        with open(self.path, "rb") as f:
+            encoding = "utf-8-sig"     # drop a BOM on the first line (Excel CSV)
+            for raw in f:
+                self.bytes_read += len(raw)
+                yield raw.decode(encoding)
+                encoding = "utf-8"
+
+
+def read_records(source) -> Iterator[Tuple[int, object]]:
+    """
+    Streams (line number, record dict) from a .csv or JSONL file –
+    one record in memory at a time. `source` is a path or a LineSource.
+
+    A JSONL line that cannot be parsed is yielded as
+    (line number, ValueError) so callers can report / reject it like
+    any other bad row. Blank lines and lines starting with # are skipped.
+    """
+    if isinstance(source, str):
+        source = LineSource(source)
+
+    if is_csv(source.path):
+        reader = csv.DictReader(iter(source))
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_no, line in enumerate(source, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_no, ValueError(f"Invalid JSON: {exc.msg}")
+            continue
+        if not isinstance(record, dict):
+            yield line_no, ValueError("Record must be a JSON object.")
+            continue
+        yield line_no, record
@@ -0,0 +1,96 @@
+# src/utils/histogram.py
+
+import bisect
+import threading
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence
+
+
+def _bucket_bounds() -> List[float]:
+    """
+    Log-scale upper bounds from 10 µs to ~100 s (ratio 1.25),
+    i.e. at most ~12% error on any reported percentile.
+    """
+    bounds = []
+    value = 1e-5
+    while value < 100.0:
+        bounds.append(value)
+        value *= 1.25
+    return bounds
+
+
+BUCKET_BOUNDS = _bucket_bounds()
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (seconds). Recording is O(log buckets)
+    and memory is constant no matter how many samples are recorded.
+    Thread-safe.
+    """
+
+    __slots__ = ("_counts", "_count", "_sum", "_max", "_lock")
+
+    def __init__(self):
+        self._counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        index = bisect.bisect_left(BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += seconds
+            if seconds > self._max:
+                self._max = seconds
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._sum
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-th percentile (0 < q <= 100).
+        """
+        with self._lock:
+            if self._count == 0:
+                return 0.0
+            rank = q / 100 * self._count
+            seen = 0
+            for index, bucket_count in enumerate(self._counts):
+                seen += bucket_count
+                if seen >= rank and bucket_count:
+                    if index < len(BUCKET_BOUNDS):
+                        return min(BUCKET_BOUNDS[index], self._max)
+                    return self._max
+            return self._max
+
+    def cumulative_buckets(self, bounds: Optional[Sequence[float]] = None) -> List[tuple]:
+        """
+        (upper_bound, cumulative_count) for every bound, empty or not –
+        the shape Prometheus histograms use. `bounds` must be values of
+        BUCKET_BOUNDS (default: all), so the counts stay exact.
+        """
+        with self._lock:
+            running = list(accumulate(self._counts))
+        return [
+            (bound, running[bisect.bisect_left(BUCKET_BOUNDS, bound)])
+            for bound in (BUCKET_BOUNDS if bounds is None else bounds)
+        ]
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self._count,
+            "mean_ms": (self._sum / self._count * 1000) if self._count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self._max * 1000,
+        }
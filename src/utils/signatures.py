@@ -0,0 +1,25 @@
+# src/utils/signatures.py
+
+import functools
+import inspect
+
+
+@functools.lru_cache(maxsize=None)
+def _signature(function) -> inspect.Signature:
+    # inspect.signature is slow; service methods never change
+    return inspect.signature(function)
+
+
+def check_call_fields(method, fields: dict) -> None:
+    """
+    Checks that `fields` can be passed as keyword arguments to the
+    bound `method` (no unknown, no missing names) without calling it.
+    Raises ValueError("Invalid fields: ...") otherwise.
+
+    Shared by the batch script runner and the HTTP API, so both
+    reject the same inputs.
+    """
+    try:
+        _signature(method.__func__).bind(method.__self__, **fields)
+    except TypeError as exc:
+        raise ValueError(f"Invalid fields: {exc}")
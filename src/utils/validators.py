@@ -1,7 +1,16 @@
 # src/utils/validators.py
 
 import re
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# Bir dəfə kompilyasiya olunur – hər çağırışda yox.
+_INT_RE = re.compile(r"-?\d+")
+_PHONE_RE = re.compile(r"\d{10}")
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+# Kanonik ISO forması (sürətli yol); qalan hər şey strptime-a düşür.
+_ISO_DATE_RE = re.compile(r"[1-9][0-9]{3}-[0-9]{2}-[0-9]{2}")
+_ISO_TIME_RE = re.compile(r"([01][0-9]|2[0-3]):[0-5][0-9]")
 
 
 def normalize_name(name: str) -> str:
@@ -37,7 +46,7 @@ def validate_positive_int(raw: str, field_name: str) -> int:
     if not raw:
         raise ValueError(f"{field_name} is required.")
 
-    if not re.fullmatch(r"-?\d+", raw):
+    if not _INT_RE.fullmatch(raw):
         raise ValueError(f"{field_name} must be an integer number.")
 
     value = int(raw)
@@ -73,7 +82,7 @@ def validate_phone(phone: str) -> str:
     if not phone:
         raise ValueError("Phone is required.")
 
-    if not re.fullmatch(r"\d{10}", phone):
+    if not _PHONE_RE.fullmatch(phone):
         raise ValueError("Phone must contain exactly 10 digits (e.g. 0501234567).")
 
     return phone
@@ -87,7 +96,7 @@ def validate_email(email: str) -> str:
     if not email:
         raise ValueError("Email is required.")
 
-    if not re.fullmatch(r"[^@\s]+@[^@\s]+\.[^@\s]+", email):
+    if not _EMAIL_RE.fullmatch(email):
         raise ValueError("Email format is invalid (e.g. user@example.com).")
 
     return email
@@ -111,6 +120,15 @@ def validate_date(date_str: str) -> str:
     if not date_str:
         raise ValueError("Date is required.")
 
+    # sürətli yol: artıq YYYY-MM-DD-dirsə yalnız təqvim yoxlaması
+    if _ISO_DATE_RE.fullmatch(date_str):
+        try:
+            date.fromisoformat(date_str)
+            return date_str
+        except ValueError:
+            raise ValueError("Date must be in format YYYY-MM-DD (e.g. 2025-06-01).")
+
+    # yavaş yol: 2025-6-1 kimi qısa formalar normallaşdırılır
     try:
         dt = datetime.strptime(date_str, "%Y-%m-%d")
     except ValueError:
@@ -128,6 +146,11 @@ def validate_time(time_str: str) -> str:
     if not time_str:
         raise ValueError("Time is required.")
 
+    # sürətli yol: artıq HH:MM-dirsə (regex saat/dəqiqə aralığını yoxlayır)
+    if _ISO_TIME_RE.fullmatch(time_str):
+        return time_str
+
+    # yavaş yol: 9:30 kimi qısa formalar normallaşdırılır
     try:
         t = datetime.strptime(time_str, "%H:%M")
     except ValueError:
@@ -144,3 +167,173 @@ def validate_yes_no(choice: str, field_name: str) -> bool:
     if c not in ("y", "n"):
         raise ValueError(f"{field_name} must be 'y' or 'n'.")
     return c == "y"
+
+
+def _yes_no_or_bool(field_name: str):
+    def check(value) -> bool:
+        if isinstance(value, bool):
+            return value
+        # exports write 0/1 (SQLite) or true/false (JSON)
+        text = str(value).strip().lower()
+        if text in ("1", "true"):
+            return True
+        if text in ("0", "false"):
+            return False
+        return validate_yes_no(text, field_name)
+    return check
+
+
+def _required_text(field_name: str):
+    def check(value) -> str:
+        value = str(value).strip()
+        if not value:
+            raise ValueError(f"{field_name} is required.")
+        return value
+    return check
+
+
+# Sahə adı -> yoxlama funksiyası (CLI ilə eyni qaydalar), qeyd növünə görə.
+# Skriptlər, importlar və s. üçün – input() olmadan.
+RECORD_VALIDATORS = {
+    "venue": {
+        "name": lambda v: normalize_name(str(v)),
+        "address": _required_text("Address"),
+        "capacity": lambda v: validate_positive_int(str(v), "Capacity"),
+        "manager_name": lambda v: normalize_full_name(str(v)),
+        "phone": lambda v: validate_phone(str(v)),
+        "is_open": _yes_no_or_bool("Is open"),
+    },
+    "event": {
+        "name": _required_text("Name"),
+        "date": lambda v: validate_date(str(v)),
+        "time": lambda v: validate_time(str(v)),
+        "duration_minutes": lambda v: validate_positive_int(str(v), "Duration"),
+        "venue_id": _required_text("Venue id"),
+        "is_active": _yes_no_or_bool("Is active"),
+    },
+    "participant": {
+        "full_name": lambda v: normalize_full_name(str(v)),
+        "email": lambda v: validate_email(str(v)),
+        "phone": lambda v: validate_phone(str(v)),
+        "age": lambda v: validate_positive_int(str(v), "Age"),
+        "gender": lambda v: validate_gender(str(v)),
+        "registration_date": lambda v: validate_date(str(v)),
+        "is_vip": _yes_no_or_bool("Is VIP"),
+    },
+    "ticket": {
+        "event_id": _required_text("Event id"),
+        "participant_id": _required_text("Participant id"),
+        "price": lambda v: validate_price(str(v)),
+        "seat_number": _required_text("Seat number"),
+        "ticket_type": _required_text("Ticket type"),
+        "purchase_date": lambda v: validate_date(str(v)),
+        "is_used": _yes_no_or_bool("Is used"),
+    },
+}
+
+
+def validate_record(kind: str, fields: dict) -> dict:
+    """
+    Validates / normalizes a whole record (dict of raw values, e.g. a
+    CSV row or a JSON object) with the same rules as the CLI prompts.
+    Fields without a rule are passed through unchanged.
+    """
+    rules = RECORD_VALIDATORS[kind]
+    return {
+        name: rules[name](value) if name in rules else value
+        for name, value in fields.items()
+    }
+
+
+# ---------- Batch (sütun) yoxlaması ---------- #
+
+# Sütunda təkrarlanan dəyərlərin (tarix, cins, yaş...) nəticəsi yadda
+# saxlanılır; unikal dəyərlərlə (email) yaddaş böyüməsin deyə limitli.
+COLUMN_CACHE_LIMIT = 4096
+
+
+def validate_column(
+    values: Iterable[Any],
+    check: Callable[[Any], Any]
+) -> Tuple[List[Any], Dict[int, str]]:
+    """
+    Validates a whole column with one validator.
+    Returns (results, errors): results[i] is the normalized value
+    (None where row i failed), errors maps row index -> message.
+    Repeated values are validated once; for mostly-unique columns
+    (emails, phones) the cache switches itself off.
+    """
+    results: List[Any] = []
+    errors: Dict[int, str] = {}
+    append = results.append
+    rows = enumerate(values)
+
+    cache: Dict[Any, Tuple[bool, Any]] = {}
+    hits = 0
+    for index, value in rows:
+        # type in the key: True == 1 but they validate differently
+        key = (value.__class__, value)
+        try:
+            cached = cache.get(key)
+        except TypeError:              # unhashable value
+            cached, key = None, None
+
+        if cached is None:
+            try:
+                cached = (True, check(value))
+            except ValueError as exc:
+                cached = (False, str(exc))
+            if key is not None:
+                cache[key] = cached
+        else:
+            hits += 1
+
+        ok, outcome = cached
+        if ok:
+            append(outcome)
+        else:
+            append(None)
+            errors[index] = outcome
+
+        if len(cache) >= COLUMN_CACHE_LIMIT:
+            if hits < COLUMN_CACHE_LIMIT:
+                break                  # mostly unique – lookups do not pay off
+            cache.clear()
+
+    # no-cache loop for the rest of a mostly-unique column
+    for index, value in rows:
+        try:
+            append(check(value))
+        except ValueError as exc:
+            append(None)
+            errors[index] = str(exc)
+
+    return results, errors
+
+
+def validate_records(
+    kind: str,
+    records: List[dict]
+) -> Tuple[List[dict], Dict[int, str]]:
+    """
+    Column-wise version of validate_record for a chunk of records:
+    each field is validated as a column with validate_column.
+    Returns (rows, errors) – rows[i] is the normalized record (None if
+    record i has an error), errors maps record index -> first message.
+    """
+    rules = RECORD_VALIDATORS[kind]
+    rows = [dict(record) for record in records]
+    errors: Dict[int, str] = {}
+
+    for name, check in rules.items():
+        indexes = [i for i, row in enumerate(rows) if name in row]
+        if not indexes:
+            continue
+        results, column_errors = validate_column((rows[i][name] for i in indexes), check)
+        for position, i in enumerate(indexes):
+            if position in column_errors:
+                errors.setdefault(i, column_errors[position])
+            else:
+                rows[i][name] = results[position]
+
+    return [None if i in errors else row for i, row in enumerate(rows)], errors
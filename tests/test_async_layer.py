@@ -0,0 +1,165 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from src.aio.executor import SQLiteExecutor
+from src.aio.repositories import AsyncTicketRepository
+from src.aio.services import AsyncTicketService, AsyncVenueService
+from src.database.schema import initialize_database
+from src.models.ticket import Ticket
+
+
+class AsyncLayerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "async.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, coro_fn):
+        async def scenario():
+            executor = SQLiteExecutor(self.db_path, max_pending=32, max_batch=16)
+            await executor.run(initialize_database, write=False)
+            try:
+                return await coro_fn(executor)
+            finally:
+                await executor.close()
+        return asyncio.run(scenario())
+
+    def test_concurrent_sales_are_batched(self):
+        async def scenario(executor):
+            commits = []
+            await executor.run(lambda conn: conn.set_trace_callback(
+                lambda sql: commits.append(sql) if sql == "COMMIT" else None
+            ))
+            service = AsyncTicketService(executor)
+            tickets = await asyncio.gather(*(
+                service.sell_ticket(
+                    event_id="event-1",
+                    participant_id="part-1",
+                    price=100.0,
+                    seat_number=str(i),
+                    ticket_type="VIP",
+                    purchase_date="2025-01-01"
+                )
+                for i in range(200)
+            ))
+            page = await service.list_tickets_page(page_size=1000)
+            streamed = [t.id async for t in service.iter_tickets(page_size=64)]
+            return tickets, page, len(commits), streamed
+
+        tickets, page, commits, streamed = self._run(scenario)
+
+        self.assertTrue(all(isinstance(t, Ticket) for t in tickets))
+        self.assertAlmostEqual(tickets[0].price, 150.0)
+        self.assertEqual(len(page.items), 200)
+        self.assertEqual(sorted(streamed), sorted(t.id for t in tickets))
+        self.assertLess(commits, 200)
+
+    def test_failing_job_does_not_abort_batch(self):
+        async def scenario(executor):
+            service = AsyncVenueService(executor)
+            results = await asyncio.gather(
+                service.create_venue(
+                    name="Hall", address="Street 1", capacity=10,
+                    manager_name="John Doe", phone="0501234567"
+                ),
+                service.create_venue(
+                    name="Bad", address="Street 2", capacity=0,
+                    manager_name="John Doe", phone="0501234567"
+                ),
+                return_exceptions=True
+            )
+            page = await service.list_venues_page()
+            return results, page
+
+        results, page = self._run(scenario)
+
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual([v.name for v in page.items], ["Hall"])
+
+    def test_failed_commit_is_rolled_back(self):
+        async def scenario(executor):
+            def prepare(conn):
+                conn.execute("PRAGMA foreign_keys = ON")
+                conn.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+                conn.execute(
+                    "CREATE TABLE child (parent_id INTEGER "
+                    "REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED)"
+                )
+            await executor.run(prepare)
+
+            # the deferred foreign key only fails at COMMIT
+            with self.assertRaises(sqlite3.IntegrityError):
+                await executor.run(
+                    lambda conn: conn.execute("INSERT INTO child VALUES (1)"), write=True
+                )
+            in_transaction = await executor.run(lambda conn: conn.in_transaction)
+            await executor.run(
+                lambda conn: conn.execute("INSERT INTO parent VALUES (1)"), write=True
+            )
+            return in_transaction
+
+        self.assertFalse(self._run(scenario))
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM parent").fetchone()[0], 1)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM child").fetchone()[0], 0)
+        conn.close()
+
+    def test_cancelled_job_keeps_its_slot_until_it_ran(self):
+        ran = []
+
+        async def scenario(executor):
+            release = threading.Event()
+            blocked = asyncio.ensure_future(executor.run(lambda conn: release.wait()))
+            await asyncio.sleep(0.05)
+            blocked.cancel()
+
+            # the blocked job still occupies the only slot
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    executor.run(lambda conn: ran.append("late")), 0.05
+                )
+            release.set()
+            await executor.run(lambda conn: ran.append("next"))
+
+        async def limited():
+            executor = SQLiteExecutor(self.db_path, max_pending=1)
+            try:
+                await scenario(executor)
+            finally:
+                await executor.close()
+
+        asyncio.run(limited())
+        self.assertEqual(ran, ["next"])
+
+    def test_write_batches_take_the_write_lock_up_front(self):
+        async def scenario(executor):
+            statements = []
+            await executor.run(lambda conn: conn.set_trace_callback(statements.append))
+            await executor.run(lambda conn: conn.execute("SELECT 1"), write=True)
+            return statements
+
+        self.assertIn("BEGIN IMMEDIATE", self._run(scenario))
+
+    def test_async_repository_round_trip(self):
+        async def scenario(executor):
+            repo = AsyncTicketRepository(executor)
+            ticket = Ticket("event-1", "part-1", 10.0, "A1", "Standard", "2025-01-01")
+            await repo.add(ticket)
+            loaded = await repo.get_by_id(ticket.id)
+            deleted = await repo.delete_by_id(ticket.id)
+            return ticket, loaded, deleted
+
+        ticket, loaded, deleted = self._run(scenario)
+
+        self.assertEqual(loaded.id, ticket.id)
+        self.assertTrue(deleted)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.controllers.batch_controller import BatchController
+from src.database.schema import initialize_database
+
+
+class BatchControllerTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def jsonl(self, *commands):
+        return self.write("script.jsonl", "\n".join(
+            c if isinstance(c, str) else json.dumps(c) for c in commands
+        ))
+
+    def test_refs_partial_update_and_sales(self):
+        path = self.jsonl(
+            {"command": "create_venue", "ref": "hall", "name": "hall", "address": "Street 1",
+             "capacity": 1, "manager_name": "john doe", "phone": "0501234567"},
+            {"command": "create_event", "ref": "show", "name": "Concert", "date": "2025-12-31",
+             "time": "20:00", "category": "Music", "description": "", "duration_minutes": 90,
+             "venue_id": "$hall"},
+            {"command": "update_event", "id": "$show", "is_active": False},
+            {"command": "sell_ticket", "event_id": "$show", "participant_id": "p-1",
+             "price": 100, "seat_number": "A1", "ticket_type": "VIP",
+             "purchase_date": "2025-01-01"},
+            {"command": "sell_ticket", "event_id": "$show", "participant_id": "p-2",
+             "price": 100, "seat_number": "A2", "ticket_type": "VIP",
+             "purchase_date": "2025-01-01"},
+        )
+
+        report = BatchController(self.conn, chunk_size=2).run(path)
+
+        self.assertEqual((report.total, report.succeeded, report.failed), (5, 4, 1))
+        self.assertEqual(report.errors[0].line, 5)
+        self.assertIn("sold out", report.errors[0].message)
+
+        name, manager = self.conn.execute("SELECT name, manager_name FROM venues").fetchone()
+        self.assertEqual((name, manager), ("Hall", "John Doe"))
+        name, is_active = self.conn.execute("SELECT name, is_active FROM events").fetchone()
+        self.assertEqual((name, is_active), ("Concert", 0))
+        price = self.conn.execute("SELECT price FROM tickets").fetchone()[0]
+        self.assertEqual(price, 150.0)
+
+    def test_failed_commands_do_not_undo_neighbours(self):
+        path = self.jsonl(
+            {"command": "create_participant", "full_name": "Ann Lee", "email": "ann@example.com",
+             "phone": "0501234567", "age": 30, "gender": "F", "registration_date": "2025-01-01"},
+            "{not json",
+            {"command": "create_participant", "full_name": "Bob", "email": "broken",
+             "phone": "0501234567", "age": 30, "gender": "M", "registration_date": "2025-01-01"},
+            {"command": "launch_rocket"},
+            {"command": "delete_venue", "id": "missing"},
+            {"command": "create_venue", "name": "X", "unknown": 1},
+        )
+
+        report = BatchController(self.conn).run(path)
+
+        self.assertEqual((report.succeeded, report.failed), (1, 5))
+        self.assertEqual([e.line for e in report.errors], [2, 3, 4, 5, 6])
+        self.assertIn("Email format", report.errors[1].message)
+        self.assertIn("Unknown command", report.errors[2].message)
+        self.assertIn("not found", report.errors[3].message)
+        self.assertIn("Invalid fields", report.errors[4].message)
+        count = self.conn.execute("SELECT COUNT(*) FROM participants").fetchone()[0]
+        self.assertEqual(count, 1)
+
+    def test_csv_script(self):
+        path = self.write("script.csv", (
+            "command,ref,full_name,email,phone,age,gender,registration_date,is_vip,id\n"
+            "create_participant,ann,Ann Lee,ann@example.com,0501234567,30,f,2025-01-01,y,\n"
+            "update_participant,,,,,31,,,,$ann\n"
+        ))
+
+        report = BatchController(self.conn).run(path)
+
+        self.assertEqual(report.failed, 0, report.summary())
+        row = self.conn.execute("SELECT age, gender, is_vip FROM participants").fetchone()
+        self.assertEqual(row, (31, "F", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
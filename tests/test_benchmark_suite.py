@@ -0,0 +1,76 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from benchmarks.compare import compare
+from benchmarks.datagen import create_database
+from benchmarks.suite import run_suite
+
+
+def _document(**ops_per_sec):
+    return {"results": {name: {"ops_per_sec": value} for name, value in ops_per_sec.items()}}
+
+
+class DatagenAndSuiteTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "bench.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_datagen_fills_unique_seats(self):
+        create_database(self.db_path, "tiny", venues=2, events=4, participants=50, tickets=100)
+        conn = sqlite3.connect(self.db_path)
+        counts = [conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                  for t in ("venues", "events", "participants", "tickets")]
+        seats = conn.execute("SELECT COUNT(DISTINCT event_id || '/' || seat_number) FROM tickets").fetchone()[0]
+        conn.close()
+        self.assertEqual(counts, [2, 4, 50, 100])
+        self.assertEqual(seats, 100)
+        with self.assertRaises(ValueError):
+            create_database(self.db_path, "tiny")
+
+    def test_suite_runs_selected_benchmarks(self):
+        create_database(self.db_path, "tiny")
+        results = run_suite(
+            self.db_path, ["repository.ticket.get_by_id", "service.ticket.sell_ticket", "check_in"], 0.01
+        )
+        self.assertEqual(
+            sorted(results),
+            ["repository.ticket.get_by_id", "scenario.check_in_rush",
+             "scenario.check_in_rush.gate_batches",
+             "service.ticket.sell_ticket", "service.ticket.sell_ticket.unit_of_work_100"]
+        )
+        single, batched = results["scenario.check_in_rush"], results["scenario.check_in_rush.gate_batches"]
+        self.assertEqual(single["valid"] + single["already_used"] + single["unknown"], single["ops"])
+        for status in ("valid", "already_used", "unknown"):
+            self.assertEqual(single[status], batched[status])
+        self.assertGreater(results["repository.ticket.get_by_id"]["ops_per_sec"], 0)
+
+
+class CompareTests(unittest.TestCase):
+    def test_flags_regressions_improvements_and_missing(self):
+        rows = compare(
+            _document(fast=1000, slow=1000, same=1000, gone=5),
+            _document(fast=1500, slow=800, same=950, new=1),
+            threshold=0.10
+        )
+        status = {row["name"]: row["status"] for row in rows}
+        self.assertEqual(status, {
+            "fast": "IMPROVED", "slow": "REGRESSION", "same": "ok", "gone": "MISSING", "new": "NEW",
+        })
+
+    def test_latency_metrics_are_lower_is_better(self):
+        rows = compare(
+            {"results": {"op": {"p99_us": 100.0}}},
+            {"results": {"op": {"p99_us": 150.0}}},
+            metric="p99_us"
+        )
+        self.assertEqual(rows[0]["status"], "REGRESSION")
+        self.assertAlmostEqual(rows[0]["change"], -0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
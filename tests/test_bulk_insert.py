@@ -0,0 +1,95 @@
+import unittest
+import sqlite3
+
+from src.database.schema import initialize_database
+from src.models.venue import Venue
+from src.repositories.venue_repository import VenueRepository
+from src.repositories.participant_repository import ParticipantRepository
+from src.repositories.ticket_repository import TicketRepository
+from src.services.participant_service import ParticipantService
+from src.services.ticket_service import TicketService
+
+
+class BulkInsertTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+
+        self.ticket_service = TicketService(TicketRepository(self.conn))
+        self.participant_service = ParticipantService(
+            ParticipantRepository(self.conn)
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _count(self, table: str) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_add_many_uses_chunks(self):
+        repo = VenueRepository(self.conn)
+        venues = (
+            Venue(
+                name=f"Hall {i}",
+                address="Street 1",
+                capacity=100,
+                manager_name="John Doe",
+                phone="0501234567"
+            )
+            for i in range(25)
+        )
+
+        count = repo.add_many(venues, chunk_size=10)
+
+        self.assertEqual(count, 25)
+        self.assertEqual(self._count("venues"), 25)
+
+    def test_sell_tickets_bulk_applies_pricing(self):
+        sales = [
+            {
+                "event_id": "event-1",
+                "participant_id": f"part-{i}",
+                "price": 100.0,
+                "seat_number": str(i),
+                "ticket_type": "VIP" if i % 2 else "Standard",
+                "purchase_date": "2025-01-01",
+            }
+            for i in range(10)
+        ]
+
+        count = self.ticket_service.sell_tickets_bulk(sales, chunk_size=3)
+
+        self.assertEqual(count, 10)
+        prices = sorted(
+            row[0] for row in self.conn.execute("SELECT price FROM tickets")
+        )
+        self.assertEqual(prices, [100.0] * 5 + [150.0] * 5)
+
+    def test_bulk_is_atomic_on_invalid_row(self):
+        rows = [
+            {
+                "full_name": "Alice Smith",
+                "email": "alice@example.com",
+                "phone": "0501234567",
+                "age": 25,
+                "gender": "F",
+                "registration_date": "2025-01-01",
+            },
+            {
+                "full_name": "Bob Smith",
+                "email": "bob@example.com",
+                "phone": "0501234568",
+                "age": -1,
+                "gender": "M",
+                "registration_date": "2025-01-01",
+            },
+        ]
+
+        with self.assertRaises(ValueError):
+            self.participant_service.create_participants_bulk(rows, chunk_size=1)
+
+        self.assertEqual(self._count("participants"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.database.row_cache import RowCache
+from src.database.schema import initialize_database
+from src.database.unit_of_work import UnitOfWork
+from src.models.event import Event
+from src.models.participant import Participant
+from src.models.ticket import Ticket
+from src.models.venue import Venue
+from src.repositories.cached_repository import CachedRepository, cached
+from src.repositories.event_repository import EventRepository
+from src.repositories.participant_repository import ParticipantRepository
+from src.repositories.ticket_repository import TicketRepository
+from src.repositories.venue_repository import VenueRepository
+from src.services.venue_service import VenueService
+
+
+def _venue(name="Hall") -> Venue:
+    return Venue(name=name, address="Street 1", capacity=100,
+                 manager_name="John Doe", phone="0501234567", is_open=True)
+
+
+class CachedRepositoryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "cache.db")
+        self.conn = sqlite3.connect(self.db_path)
+        initialize_database(self.conn)
+        self.repo = CachedRepository(VenueRepository(self.conn))
+        self.venue = _venue()
+        self.repo.add(self.venue)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def test_hits_return_fresh_equal_models(self):
+        first = self.repo.get_by_id(self.venue.id)
+        second = self.repo.get_by_id(self.venue.id)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertEqual((self.repo.stats.hits, self.repo.stats.misses), (1, 1))
+
+    def test_service_update_and_delete_invalidate(self):
+        service = VenueService(self.repo)
+        self.repo.get_by_id(self.venue.id)
+        service.update_venue(self.venue.id, "Renamed", "Street 2", 200, "Jane Doe", "0507654321", False)
+        self.assertEqual(self.repo.get_by_id(self.venue.id).name, "Renamed")
+
+        service.delete_venue(self.venue.id)
+        self.assertIsNone(self.repo.get_by_id(self.venue.id))
+
+    def test_commit_from_another_connection_invalidates(self):
+        self.assertEqual(self.repo.get_by_id(self.venue.id).capacity, 100)
+
+        other = sqlite3.connect(self.db_path)
+        other.execute("UPDATE venues SET capacity = 500 WHERE id = ?", (self.venue.id,))
+        other.commit()
+        other.close()
+
+        self.assertEqual(self.repo.get_by_id(self.venue.id).capacity, 500)
+        self.assertEqual(self.repo.stats.invalidations, 1)
+
+    def test_rolled_back_unit_of_work_clears_the_cache(self):
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork(self.conn):
+                venue = self.repo.get_by_id(self.venue.id)
+                venue._capacity = 999
+                self.repo.update(venue)
+                self.assertEqual(self.repo.get_by_id(self.venue.id).capacity, 999)
+                raise RuntimeError("abort")
+        self.assertEqual(self.repo.get_by_id(self.venue.id).capacity, 100)
+
+    def test_cached_repositories_share_one_cache_per_connection(self):
+        first, second = cached(VenueRepository(self.conn)), cached(VenueRepository(self.conn))
+        self.assertIs(first.cache, second.cache)
+        first.get_by_id(self.venue.id)
+        second.get_by_id(self.venue.id)
+        self.assertEqual(second.stats.hits, 1)
+
+    def test_size_bound_and_ttl(self):
+        cache = RowCache(self.conn, max_size=2, ttl=60)
+        for key in "abc":
+            cache.put(key, (key,))
+        self.assertEqual((len(cache), cache.get("a"), cache.stats.evictions), (2, None, 1))
+
+        expired = RowCache(self.conn, ttl=0)
+        expired.put("a", ("a",))
+        self.assertIsNone(expired.get("a"))
+        self.assertEqual(expired.stats.expirations, 1)
+
+
+class RowRoundTripTests(unittest.TestCase):
+    def test_cached_rows_rebuild_identical_models(self):
+        conn = sqlite3.connect(":memory:")
+        initialize_database(conn)
+        models = [
+            (VenueRepository, _venue()),
+            (EventRepository, Event("Gig", "2025-06-01", "20:00", "Music", "", 90, "v1", False)),
+            (ParticipantRepository, Participant("Ann Lee", "a@b.co", "0501234567", 30, "Female",
+                                                "2025-01-01", True)),
+            (TicketRepository, Ticket("e1", "p1", 12.5, "A1", "VIP", "2025-01-01", True)),
+        ]
+        for repository_cls, model in models:
+            repo = CachedRepository(repository_cls(conn))
+            repo.add(model)
+            repo.get_by_id(model.id)
+            self.assertEqual(repo.get_by_id(model.id).to_dict(), model.to_dict())
+            self.assertEqual(repo.stats.hits, 1)
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
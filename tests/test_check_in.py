@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from src.database.schema import initialize_database
+from src.database.unit_of_work import UnitOfWork
+from src.models.ticket import Ticket
+from src.repositories.ticket_repository import TicketRepository
+from src.services.checkin.check_in_service import ALREADY_USED, UNKNOWN, VALID, CheckInService
+from src.services.checkin.hot_set import HotSet
+
+
+def _tickets(event_id, count):
+    return [Ticket(event_id, "p1", 10.0, str(seat), "Standard", "2025-01-01") for seat in range(1, count + 1)]
+
+
+class CheckInServiceTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+        self.repo = TicketRepository(self.conn)
+        self.tickets = _tickets("e1", 3)
+        self.other = _tickets("e2", 1)[0]
+        self.repo.add_many(self.tickets + [self.other])
+        self.service = CheckInService(self.repo)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_scan_flips_is_used_once(self):
+        ticket_id = self.tickets[0].id
+        self.assertEqual(self.service.scan(ticket_id), VALID)
+        self.assertEqual(self.service.scan(ticket_id), ALREADY_USED)
+        self.assertEqual(self.service.scan("missing"), UNKNOWN)
+        self.assertTrue(self.repo.get_by_id(ticket_id).is_used)
+
+    def test_event_scans_use_the_hot_set(self):
+        self.assertEqual(self.service.scan(self.tickets[0].id, "e1"), VALID)
+        self.assertEqual(self.service.progress("e1"), (1, 3))
+        self.assertEqual(self.service.scan(self.other.id, "e1"), UNKNOWN)
+
+        # a used ticket in the hot set is rejected without a query
+        self.repo.patch(self.tickets[0].id, is_used=False)
+        self.assertEqual(self.service.scan(self.tickets[0].id, "e1"), ALREADY_USED)
+
+        # tickets sold after the event was loaded still go through
+        late = _tickets("e1", 4)[3]
+        self.repo.add(late)
+        self.assertEqual(self.service.scan(late.id, "e1"), VALID)
+        self.assertEqual(self.service.progress("e1"), (2, 4))
+
+    def test_scan_many_keeps_order_and_admits_duplicates_once(self):
+        first, second, third = (t.id for t in self.tickets)
+        self.service.scan(third)
+        statuses = self.service.scan_many([first, "missing", first, second, third, self.other.id], "e1")
+        self.assertEqual(statuses, [VALID, UNKNOWN, ALREADY_USED, VALID, ALREADY_USED, UNKNOWN])
+        self.assertEqual(self.service.summarize(statuses), {VALID: 2, ALREADY_USED: 2, UNKNOWN: 2})
+        self.assertFalse(self.repo.get_by_id(self.other.id).is_used)
+
+    def test_rolled_back_scans_are_forgotten(self):
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork(self.conn):
+                self.service.scan_many([t.id for t in self.tickets], "e1")
+                raise RuntimeError("abort")
+        self.assertEqual(self.service.scan(self.tickets[0].id, "e1"), VALID)
+
+
+class ConcurrentGateTests(unittest.TestCase):
+    def test_each_ticket_is_admitted_by_exactly_one_gate(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "gates.db")
+            conn = sqlite3.connect(path)
+            initialize_database(conn)
+            tickets = _tickets("e1", 200)
+            TicketRepository(conn).add_many(tickets)
+            conn.close()
+
+            hot_set = HotSet()
+            admitted = []
+            lock = threading.Lock()
+
+            def gate(offset):
+                gate_conn = sqlite3.connect(path, timeout=10)
+                service = CheckInService(TicketRepository(gate_conn), hot_set)
+                ids = [t.id for t in tickets[offset:] + tickets[:offset]]
+                for start in range(0, len(ids), 25):
+                    batch = ids[start:start + 25]
+                    statuses = service.scan_many(batch, "e1")
+                    with lock:
+                        admitted.extend(i for i, s in zip(batch, statuses) if s == VALID)
+                gate_conn.close()
+
+            threads = [threading.Thread(target=gate, args=(offset,)) for offset in (0, 50, 100, 150)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sorted(admitted), sorted(t.id for t in tickets))
+
+
+if __name__ == "__main__":
+    unittest.main()
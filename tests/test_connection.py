@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+
+from src.database.connection import DatabaseConnection
+
+
+class DatabaseConnectionTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "test.db")
+
+    def tearDown(self):
+        if DatabaseConnection._instance is not None:
+            DatabaseConnection._instance.close()
+        self.tmp.cleanup()
+
+    def _pragma(self, conn, name):
+        return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def test_production_profile(self):
+        conn = DatabaseConnection(self.db_path).connection
+
+        self.assertEqual(self._pragma(conn, "journal_mode"), "wal")
+        self.assertEqual(self._pragma(conn, "synchronous"), 1)  # NORMAL
+        self.assertEqual(self._pragma(conn, "temp_store"), 2)   # MEMORY
+        self.assertEqual(self._pragma(conn, "busy_timeout"), 5000)
+
+    def test_bulk_load_profile(self):
+        db = DatabaseConnection(self.db_path, profile="bulk-load")
+
+        self.assertEqual(db.profile, "bulk-load")
+        self.assertEqual(self._pragma(db.connection, "synchronous"), 0)  # OFF
+
+    def test_unknown_profile_raises(self):
+        with self.assertRaises(ValueError):
+            DatabaseConnection(self.db_path, profile="turbo")
+        self.assertIsNone(DatabaseConnection._instance)
+
+
+if __name__ == "__main__":
+    unittest.main()
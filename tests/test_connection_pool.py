@@ -0,0 +1,115 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.database.pool import ConnectionPool
+from src.database.schema import initialize_database
+from src.models.venue import Venue
+from src.repositories.venue_repository import VenueRepository
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pool = ConnectionPool(
+            os.path.join(self.tmp.name, "pool.db"),
+            readers=2,
+            checkout_timeout=0.2
+        )
+        with self.pool.writer() as conn:
+            initialize_database(conn)
+
+    def tearDown(self):
+        self.pool.close()
+        self.tmp.cleanup()
+
+    def test_writes_visible_to_readers(self):
+        venue = Venue("Hall", "Street 1", 100, "John Doe", "0501234567")
+        with self.pool.write_repository(VenueRepository) as repo:
+            repo.add(venue)
+
+        with self.pool.read_repository(VenueRepository) as repo:
+            self.assertEqual(repo.get_by_id(venue.id).name, "Hall")
+
+    def test_readers_are_read_only(self):
+        with self.pool.reader() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM venues")
+
+    def test_thread_affinity_and_nesting(self):
+        with self.pool.reader() as first:
+            with self.pool.reader() as nested:
+                self.assertIs(first, nested)
+        with self.pool.reader() as again:
+            self.assertIs(first, again)
+
+    def test_parallel_readers_and_timeout(self):
+        holding = threading.Barrier(3)
+        release = threading.Event()
+        errors = []
+
+        def hold():
+            with self.pool.reader() as conn:
+                conn.execute("SELECT COUNT(*) FROM venues").fetchone()
+                holding.wait()
+                release.wait()
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for t in threads:
+            t.start()
+        holding.wait()
+
+        # both readers are busy – a third checkout times out
+        try:
+            with self.pool.reader():
+                pass
+        except TimeoutError as exc:
+            errors.append(exc)
+
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(errors), 1)
+
+    def test_unhealthy_connections_are_closed_and_slots_freed(self):
+        with self.pool.writer() as stale:
+            pass
+        with mock.patch.object(self.pool, "_is_healthy", return_value=False):
+            with self.pool.writer() as fresh:
+                self.assertIsNot(fresh, stale)
+            with self.assertRaises(sqlite3.ProgrammingError):
+                stale.execute("SELECT 1")
+
+            with self.pool.reader():
+                pass
+            with mock.patch.object(self.pool, "_open", side_effect=sqlite3.OperationalError("disk")):
+                with self.assertRaises(sqlite3.OperationalError):
+                    with self.pool.reader():
+                        pass
+
+        # the failed reopen gave its slot back – both readers still open
+        errors = []
+
+        def read():
+            try:
+                with self.pool.reader():
+                    pass
+            except TimeoutError as exc:
+                errors.append(exc)
+
+        with self.pool.reader():
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_memory_database_rejected(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(":memory:")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import csv
+import gzip
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from src.database.schema import initialize_database
+from src.models.ticket import Ticket
+from src.repositories.ticket_repository import TicketRepository
+from src.transfer.exporter import Exporter, detect_format, main, read_columnar
+from src.transfer.importer import Importer
+
+
+def ticket(seat, day, is_used=False):
+    return Ticket("event-1", "p-1", 10.0, seat, "Standard", f"2025-01-0{day}", is_used)
+
+
+class ExporterTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "export.db")
+        self.conn = sqlite3.connect(self.db_path)
+        initialize_database(self.conn)
+        self.repo = TicketRepository(self.conn)
+        self.repo.add_many([ticket("A1", 1, True), ticket("A2", 2), ticket("A3", 3)])
+        self.exporter = Exporter(self.conn, batch_size=2)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format("a.csv"), ("csv", False))
+        self.assertEqual(detect_format("a.jsonl.gz"), ("jsonl", True))
+        self.assertEqual(detect_format("a.cols.gz"), ("cols", True))
+        with self.assertRaises(ValueError):
+            detect_format("a.xlsx")
+
+    def test_csv_export(self):
+        report = self.exporter.export("tickets", self.path("t.csv"))
+
+        with open(self.path("t.csv"), newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(report.rows, 3)
+        self.assertEqual([r["seat_number"] for r in rows], ["A1", "A2", "A3"])
+        self.assertEqual(report.high_watermark, 3)
+        self.assertFalse(os.path.exists(self.path("t.csv.part")))
+
+    def test_jsonl_gzip_export_has_bools(self):
+        self.exporter.export("tickets", self.path("t.jsonl.gz"))
+
+        with gzip.open(self.path("t.jsonl.gz"), "rt") as f:
+            records = [json.loads(line) for line in f]
+        self.assertIs(records[0]["is_used"], True)
+        self.assertIs(records[1]["is_used"], False)
+
+    def test_columnar_roundtrip_in_row_groups(self):
+        exporter = Exporter(self.conn, batch_size=2, row_group_size=2)
+        exporter.export("tickets", self.path("t.cols.gz"))
+
+        with gzip.open(self.path("t.cols.gz"), "rt") as f:
+            groups = [json.loads(line) for line in f][1:]
+        self.assertEqual([g["rows"] for g in groups], [2, 1])
+
+        rows = list(read_columnar(self.path("t.cols.gz"), ["seat_number", "is_used"]))
+        self.assertEqual(rows[0], {"seat_number": "A1", "is_used": True})
+        self.assertEqual(len(rows), 3)
+
+    def test_incremental_by_purchase_date(self):
+        first = self.exporter.export("tickets", self.path("a.jsonl"), "purchase_date", "2025-01-01")
+        self.assertEqual((first.rows, first.high_watermark), (2, "2025-01-03"))
+
+        self.repo.add(ticket("A4", 4))
+        second = self.exporter.export(
+            "tickets", self.path("b.jsonl"), "purchase_date", first.high_watermark
+        )
+        self.assertEqual(second.rows, 1)
+
+        with self.assertRaises(ValueError):
+            self.exporter.export("tickets", self.path("c.jsonl"), "price")
+
+    def test_same_day_rows_after_a_date_watermark_are_not_lost(self):
+        first = self.exporter.export("tickets", self.path("a.jsonl"), "purchase_date")
+        self.assertEqual(len(first.boundary_ids), 1)
+
+        self.repo.add_many([ticket("A4", 3), ticket("A5", 4)])
+        second = self.exporter.export(
+            "tickets", self.path("b.jsonl"), "purchase_date",
+            first.high_watermark, first.boundary_ids
+        )
+        with open(self.path("b.jsonl")) as f:
+            self.assertEqual(sorted(json.loads(line)["seat_number"] for line in f), ["A4", "A5"])
+        self.assertEqual((second.high_watermark, len(second.boundary_ids)), ("2025-01-04", 1))
+
+        third = self.exporter.export(
+            "tickets", self.path("c.jsonl"), "purchase_date",
+            second.high_watermark, second.boundary_ids
+        )
+        self.assertEqual((third.rows, third.boundary_ids), (0, second.boundary_ids))
+
+    # main() configures logging for the real log file – keep tests off it
+    @mock.patch("src.transfer.exporter.setup_logging")
+    def test_state_file_moves_only_the_delta(self, _):
+        state = self.path("state.json")
+        args = ["tickets", self.path("n.csv"), "--db", self.db_path, "--state", state]
+        main(args)
+        self.repo.add(ticket("A4", 4))
+        main(args)
+
+        with open(self.path("n.csv"), newline="") as f:
+            self.assertEqual([r["seat_number"] for r in csv.DictReader(f)], ["A4"])
+        with open(state) as f:
+            self.assertEqual(json.load(f), {"tickets.rowid": 4})
+
+    @mock.patch("src.transfer.exporter.setup_logging")
+    def test_state_file_keeps_boundary_ids_of_date_watermarks(self, _):
+        state = self.path("state.json")
+        args = ["tickets", self.path("n.csv"), "--db", self.db_path, "--state", state,
+                "--watermark", "purchase_date"]
+        main(args)
+        self.repo.add(ticket("A4", 3))
+        main(args)
+
+        with open(self.path("n.csv"), newline="") as f:
+            self.assertEqual([r["seat_number"] for r in csv.DictReader(f)], ["A4"])
+        with open(state) as f:
+            entry = json.load(f)["tickets.purchase_date"]
+        self.assertEqual((entry["since"], len(entry["ids"])), ("2025-01-03", 2))
+
+    def test_csv_export_imports_back(self):
+        self.conn.execute(
+            "INSERT INTO participants VALUES ('p-1', 'Ann Lee', 'ann@example.com', "
+            "'0501234567', 30, 'F', '2025-01-01', 1)"
+        )
+        self.conn.commit()
+        self.exporter.export("participants", self.path("p.csv"))
+        self.conn.execute("DELETE FROM participants")
+        self.conn.commit()
+
+        report = Importer(self.conn, show_progress=False).import_participants(self.path("p.csv"))
+        self.assertEqual((report.imported, report.rejected), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
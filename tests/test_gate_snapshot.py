@@ -0,0 +1,92 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.database.schema import initialize_database
+from src.models.event import Event
+from src.models.ticket import Ticket
+from src.repositories.event_repository import EventRepository
+from src.repositories.ticket_repository import TicketRepository
+from src.services.checkin.check_in_service import ALREADY_USED, UNKNOWN, VALID
+from src.transfer.gate_snapshot import GateSnapshot, build_snapshot, merge_scans
+
+
+class GateSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "gate.snap")
+        self.journal = os.path.join(self.tmp.name, "gate1.scans.jsonl")
+
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+        self.event = Event("Gig", "2025-06-01", "20:00", "Music", "", 90, "v1")
+        EventRepository(self.conn).add(self.event)
+        self.tickets = [
+            Ticket(self.event.id, "p1", 10.0, str(seat), "Standard", "2025-01-01", is_used=seat == 1)
+            for seat in range(1, 101)
+        ]
+        self.repo = TicketRepository(self.conn)
+        self.repo.add_many(self.tickets)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def test_build_and_validate_offline(self):
+        report = build_snapshot(self.conn, self.event.id, self.path)
+        self.assertEqual((report.tickets, report.used), (100, 1))
+        self.assertEqual(report.size, 128 + 100 * 8 + 13)
+
+        with GateSnapshot(self.path) as snapshot:
+            self.assertEqual((snapshot.event_id, len(snapshot)), (self.event.id, 100))
+            self.assertEqual(snapshot.status(self.tickets[5].id), VALID)
+            self.assertEqual(snapshot.scan(self.tickets[5].id), VALID)
+            self.assertEqual(snapshot.scan(self.tickets[5].id), ALREADY_USED)
+            self.assertEqual(snapshot.scan(self.tickets[0].id), ALREADY_USED)
+            self.assertEqual(snapshot.scan("forged"), UNKNOWN)
+
+    def test_journal_survives_restart(self):
+        build_snapshot(self.conn, self.event.id, self.path)
+        with GateSnapshot(self.path, self.journal, gate="gate1") as snapshot:
+            snapshot.scan(self.tickets[1].id)
+        with open(self.journal, "a", encoding="utf-8") as f:
+            f.write('{"event_id": "trunc')     # power loss mid-write
+
+        with GateSnapshot(self.path, self.journal, gate="gate1") as snapshot:
+            self.assertEqual(snapshot.scan(self.tickets[1].id), ALREADY_USED)
+            self.assertEqual(snapshot.scan(self.tickets[2].id), VALID)
+        with GateSnapshot(self.path, self.journal) as snapshot:
+            self.assertEqual(snapshot.status(self.tickets[2].id), ALREADY_USED)
+
+    def test_merge_marks_journaled_tickets_used(self):
+        build_snapshot(self.conn, self.event.id, self.path)
+        journals = [os.path.join(self.tmp.name, f"gate{i}.jsonl") for i in (1, 2)]
+        for journal in journals:
+            with GateSnapshot(self.path, journal) as snapshot:
+                snapshot.scan(self.tickets[1].id)     # both devices admit it
+                snapshot.scan(self.tickets[journals.index(journal) + 2].id)
+        with open(journals[0], "a", encoding="utf-8") as f:
+            f.write(json.dumps({"event_id": self.event.id, "ticket_id": "deleted"}) + "\n")
+            f.write(json.dumps({"event_id": self.event.id, "ticket_id": self.tickets[0].id}) + "\n")
+
+        report = merge_scans(self.conn, journals)
+        self.assertEqual(
+            (report.scans, report.merged, report.already_used, report.unknown, report.duplicates),
+            (6, 3, 1, 1, 1)
+        )
+        self.assertTrue(all(self.repo.get_by_id(t.id).is_used for t in self.tickets[:4]))
+        self.assertEqual(merge_scans(self.conn, journals).merged, 0)
+
+    def test_rejects_foreign_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"x" * 200)
+        with self.assertRaises(ValueError):
+            GateSnapshot(self.path)
+        with self.assertRaisesRegex(ValueError, "not found"):
+            build_snapshot(self.conn, "missing", self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+import http.client
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.controllers.http_controller import HttpController, create_server
+from src.database.pool import ConnectionPool
+from src.database.schema import initialize_database
+from src.services.venue_service import VenueService
+
+
+VENUE = {
+    "name": "Hall",
+    "address": "Street 1",
+    "capacity": 2,
+    "manager_name": "John Doe",
+    "phone": "0501234567",
+}
+
+
+def sale(seat, event_id):
+    return {
+        "event_id": event_id,
+        "participant_id": "p-1",
+        "price": 100.0,
+        "seat_number": seat,
+        "ticket_type": "VIP",
+        "purchase_date": "2025-01-01",
+    }
+
+
+class HttpControllerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pool = ConnectionPool(os.path.join(self.tmp.name, "api.db"), readers=2)
+        with self.pool.writer() as conn:
+            initialize_database(conn)
+        self.controller = HttpController(self.pool)
+
+    def tearDown(self):
+        self.pool.close()
+        self.tmp.cleanup()
+
+    def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else b""
+        return self.controller.handle(method, path, data)
+
+    def create_event(self):
+        status, venue = self.request("POST", "/venues", VENUE)
+        self.assertEqual(status, 201)
+        status, event = self.request("POST", "/events", {
+            "name": "Concert",
+            "date": "2025-12-31",
+            "time": "20:00",
+            "category": "Music",
+            "description": "",
+            "duration_minutes": 90,
+            "venue_id": venue["id"],
+        })
+        self.assertEqual(status, 201)
+        return event["id"]
+
+    def test_crud_roundtrip(self):
+        status, venue = self.request("POST", "/venues", VENUE)
+        self.assertEqual(status, 201)
+
+        status, fetched = self.request("GET", f"/venues/{venue['id']}")
+        self.assertEqual((status, fetched["name"]), (200, "Hall"))
+
+        status, updated = self.request(
+            "PUT", f"/venues/{venue['id']}", dict(VENUE, name="Arena", is_open=False)
+        )
+        self.assertEqual((status, updated["name"]), (200, "Arena"))
+
+        status, patched = self.request("PATCH", f"/venues/{venue['id']}", {"phone": "0507654321"})
+        self.assertEqual((status, patched["rowcount"]), (200, 1))
+        status, fetched = self.request("GET", f"/venues/{venue['id']}")
+        self.assertEqual((fetched["name"], fetched["phone"]), ("Arena", "0507654321"))
+        status, _ = self.request("PATCH", f"/venues/{venue['id']}", {"id": "other"})
+        self.assertEqual(status, 400)
+
+        status, _ = self.request("DELETE", f"/venues/{venue['id']}")
+        self.assertEqual(status, 200)
+        status, _ = self.request("GET", f"/venues/{venue['id']}")
+        self.assertEqual(status, 404)
+
+    def test_pagination(self):
+        for i in range(5):
+            self.request("POST", "/venues", dict(VENUE, name=f"Venue {i}"))
+
+        status, page = self.request("GET", "/venues?page_size=2")
+        self.assertEqual(status, 200)
+        self.assertEqual([v["name"] for v in page["items"]], ["Venue 0", "Venue 1"])
+
+        _, page = self.request("GET", f"/venues?page_size=2&cursor={page['next_cursor']}")
+        self.assertEqual([v["name"] for v in page["items"]], ["Venue 2", "Venue 3"])
+
+    def test_ticket_sale_conflicts(self):
+        event_id = self.create_event()
+
+        status, ticket = self.request("POST", "/tickets", sale("A1", event_id))
+        self.assertEqual((status, ticket["price"]), (201, 150.0))
+        status, _ = self.request("POST", "/tickets", sale("A1", event_id))
+        self.assertEqual(status, 409)
+
+        self.request("POST", "/tickets", sale("A2", event_id))
+        status, body = self.request("POST", "/tickets", sale("A3", event_id))
+        self.assertEqual(status, 409)
+        self.assertIn("sold out", body["error"])
+
+    def test_check_in_scans(self):
+        event_id = self.create_event()
+        _, ticket = self.request("POST", "/tickets", sale("A1", event_id))
+
+        status, body = self.request("POST", "/check-in", {"ticket_id": ticket["id"], "event_id": event_id})
+        self.assertEqual((status, body["status"]), (200, "valid"))
+        status, body = self.request("POST", "/check-in", {
+            "ticket_ids": [ticket["id"], "missing"], "event_id": event_id,
+        })
+        self.assertEqual(body["statuses"], ["already_used", "unknown"])
+        self.assertEqual(self.request("POST", "/check-in", {"ticket_ids": "x"})[0], 400)
+        self.assertTrue(self.request("GET", f"/tickets/{ticket['id']}")[1]["is_used"])
+
+    def test_client_errors(self):
+        self.assertEqual(self.request("GET", "/nothing")[0], 404)
+        self.assertEqual(self.request("PATCH", "/venues")[0], 405)
+        self.assertEqual(self.request("POST", "/venues", {"name": "x"})[0], 400)
+        self.assertEqual(self.controller.handle("POST", "/venues", b"{oops")[0], 400)
+        self.assertEqual(self.request("GET", "/venues?page_size=0")[0], 400)
+
+    def test_bodies_are_validated(self):
+        status, venue = self.request("POST", "/venues", dict(VENUE, capacity="3", name="  hall "))
+        self.assertEqual((status, venue["capacity"], venue["name"]), (201, 3, "Hall"))
+        self.assertEqual(self.request("POST", "/venues", dict(VENUE, capacity="x"))[0], 400)
+        self.assertEqual(self.request("POST", "/venues", dict(VENUE, phone=None))[0], 400)
+        self.assertEqual(
+            self.request("PATCH", f"/venues/{venue['id']}", {"is_open": "maybe"})[0], 400
+        )
+        self.assertEqual(
+            self.request("PUT", f"/venues/{venue['id']}", dict(VENUE, capacity=[1]))[0], 400
+        )
+
+    def test_batch_keeps_items_around_a_server_error(self):
+        with mock.patch.object(VenueService, "delete_venue", side_effect=RuntimeError("boom")):
+            status, body = self.request("POST", "/batch", {"requests": [
+                {"method": "POST", "path": "/venues", "body": VENUE},
+                {"method": "DELETE", "path": "/venues/some-id"},
+                {"method": "POST", "path": "/venues", "body": dict(VENUE, name="Arena")},
+            ]})
+
+        self.assertEqual(status, 200)
+        self.assertEqual([item["status"] for item in body["responses"]], [201, 500, 201])
+        self.assertEqual(body["responses"][1]["body"], {"error": "Internal server error."})
+        _, page = self.request("GET", "/venues")
+        self.assertEqual(len(page["items"]), 2)
+
+    def test_batch_isolates_failed_items(self):
+        event_id = self.create_event()
+
+        status, body = self.request("POST", "/batch", {"requests": [
+            {"method": "POST", "path": "/tickets", "body": sale("A1", event_id)},
+            {"method": "POST", "path": "/tickets", "body": sale("A1", event_id)},
+            {"method": "POST", "path": "/tickets", "body": sale("A2", event_id)},
+            {"method": "GET", "path": "/tickets?page_size=10"},
+        ]})
+
+        self.assertEqual(status, 200)
+        statuses = [item["status"] for item in body["responses"]]
+        self.assertEqual(statuses, [201, 409, 201, 200])
+        self.assertEqual(len(body["responses"][3]["body"]["items"]), 2)
+
+    def test_metrics_group_routes(self):
+        self.request("POST", "/venues", VENUE)
+        self.request("GET", "/venues/missing")
+        self.request("GET", "/venues/other")
+
+        _, metrics = self.request("GET", "/metrics")
+        self.assertEqual(metrics["routes"]["GET /venues/{id}"]["count"], 2)
+        self.assertEqual(metrics["status_counts"]["404"], 2)
+
+
+class HttpServerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pool = ConnectionPool(os.path.join(self.tmp.name, "api.db"), readers=1)
+        with self.pool.writer() as conn:
+            initialize_database(conn)
+        self.server = create_server(self.pool, port=0)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = http.client.HTTPConnection(
+            "127.0.0.1", self.server.server_address[1], timeout=5
+        )
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.pool.close()
+        self.tmp.cleanup()
+
+    def test_keep_alive_connection(self):
+        for _ in range(3):
+            self.client.request("POST", "/venues", json.dumps(VENUE),
+                                {"Content-Type": "application/json"})
+            response = self.client.getresponse()
+            response.read()
+            self.assertEqual(response.status, 201)
+        # same socket served all requests
+        self.client.request("GET", "/venues")
+        page = json.loads(self.client.getresponse().read())
+        self.assertEqual(len(page["items"]), 3)
+
+    def test_bad_content_length_is_a_json_400(self):
+        for value in ("abc", "-5"):
+            self.client.putrequest("POST", "/venues")
+            self.client.putheader("Content-Length", value)
+            self.client.endheaders()
+            response = self.client.getresponse()
+            self.assertEqual(response.status, 400)
+            self.assertIn("Content-Length", json.loads(response.read())["error"])
+            self.client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
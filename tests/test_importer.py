@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from benchmarks.stress_reservations import setup_event
+from src.transfer.importer import Importer
+from src.transfer.progress import ProgressMeter
+
+
+HEADER = "full_name,email,phone,age,gender,registration_date,is_vip,notes\n"
+
+
+class ImporterTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "import.db")
+        setup_event(self.db_path, capacity=3)
+        self.conn = sqlite3.connect(self.db_path)
+        self.importer = Importer(self.conn, chunk_size=2, show_progress=False)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_participants_csv_with_rejects(self):
+        path = self.write("people.csv", HEADER + (
+            "ann lee,ann@example.com,0501234567,30,f,2025-01-01,y,x\n"
+            "bob,not-an-email,0501234567,30,M,2025-01-01,n,\n"
+            "cem ak,cem@example.com,0501234567,25,M,2025-01-02,,\n"
+            ",,,,,,,\n"
+        ))
+
+        report = self.importer.import_participants(path)
+
+        self.assertEqual((report.imported, report.rejected), (2, 2))
+        rows = self.conn.execute(
+            "SELECT full_name, gender, is_vip FROM participants ORDER BY full_name"
+        ).fetchall()
+        self.assertEqual(rows, [("Ann Lee", "F", 1), ("Cem Ak", "M", 0)])
+
+        with open(report.reject_path, newline="", encoding="utf-8") as f:
+            rejects = list(csv.DictReader(f))
+        self.assertEqual([r["line"] for r in rejects], ["3", "5"])
+        self.assertEqual(rejects[0]["email"], "not-an-email")
+        self.assertIn("Missing required", rejects[1]["error"])
+
+    def test_tickets_jsonl_rejects_double_sold_and_sold_out(self):
+        def sale(seat):
+            return json.dumps({
+                "event_id": "event-1", "participant_id": "p-1", "price": 10,
+                "seat_number": seat, "ticket_type": "VIP", "purchase_date": "2025-01-01",
+            })
+
+        # A1 twice in one chunk -> chunk retried row by row
+        path = self.write("sales.jsonl", "\n".join([
+            sale("A1"), sale("A1"), sale("A2"), "{broken", sale("A3"), sale("A4"),
+        ]))
+
+        report = self.importer.import_tickets(path)
+
+        self.assertEqual((report.imported, report.rejected), (3, 3))
+        seats = [r[0] for r in self.conn.execute(
+            "SELECT seat_number FROM tickets ORDER BY seat_number"
+        )]
+        self.assertEqual(seats, ["A1", "A2", "A3"])
+
+        with open(report.reject_path, encoding="utf-8") as f:
+            rejects = [json.loads(line) for line in f]
+        self.assertEqual([r["line"] for r in rejects], [2, 4, 6])
+        self.assertIn("sold out", rejects[2]["error"])
+
+    def test_progress_meter_output(self):
+        stream = io.StringIO()
+        meter = ProgressMeter("Importing", fraction=lambda: 0.5, stream=stream, interval=0)
+        meter.update(10, 1)
+        meter.finish(20, 1)
+        lines = stream.getvalue()
+        self.assertIn("10 rows, 1 rejected", lines)
+        self.assertTrue(lines.endswith("\n"))
+        self.assertIn("50%", lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from src.database.connection import connect
+from src.database.schema import initialize_database
+from src.instrumentation import (
+    PROMETHEUS_BUCKETS,
+    REGISTRY,
+    TimedConnection,
+    disable_metrics,
+    enable_metrics,
+    format_metrics,
+    prometheus_text,
+    statement_key,
+)
+from src.repositories.ticket_repository import TicketRepository
+from src.services.ticket_service import TicketService
+
+ORIGINAL_SELL_TICKET = TicketService.sell_ticket
+
+
+class InstrumentationTests(unittest.TestCase):
+    def setUp(self):
+        REGISTRY.reset()
+        enable_metrics()
+        self.conn = connect(":memory:")
+        initialize_database(self.conn)
+        self.service = TicketService(TicketRepository(self.conn))
+
+    def tearDown(self):
+        disable_metrics()
+        REGISTRY.reset()
+        self.conn.close()
+
+    def sell(self, seat):
+        return self.service.sell_ticket("e1", "p1", 10.0, seat, "Standard", "2025-01-01")
+
+    def test_operations_and_sql_are_counted(self):
+        self.assertIsInstance(self.conn, TimedConnection)
+        self.sell("A1")
+        self.sell("A2")
+        with self.assertRaises(ValueError):
+            self.service.sell_ticket("e1", "p1", -1.0, "A3", "Standard", "2025-01-01")
+
+        metrics = REGISTRY.snapshot()
+        sell = metrics["operations"]["TicketService.sell_ticket"]
+        self.assertEqual((sell["count"], sell["errors"]), (3, 1))
+        self.assertEqual(metrics["operations"]["TicketRepository.add"]["count"], 2)
+        self.assertTrue(any(sql.startswith("INSERT INTO tickets") for sql in metrics["sql"]))
+        self.assertIn("TicketService.sell_ticket", format_metrics())
+
+    def test_prometheus_text_format(self):
+        self.sell("A1")
+        text = prometheus_text()
+        name = 'operation="TicketService.sell_ticket"'
+        self.assertIn(f'event_mgmt_operation_duration_seconds_bucket{{{name},le="+Inf"}} 1', text)
+        self.assertIn(f"event_mgmt_operation_duration_seconds_count{{{name}}} 1", text)
+        self.assertIn(f"event_mgmt_operation_errors_total{{{name}}} 0", text)
+        self.assertIn("# TYPE event_mgmt_sql_duration_seconds histogram", text)
+
+    def test_prometheus_buckets_are_the_same_for_every_series(self):
+        self.sell("A1")
+        REGISTRY.record("operation", "slow", 2.5)
+        text = prometheus_text()
+
+        def layout(name):
+            prefix = f'event_mgmt_operation_duration_seconds_bucket{{operation="{name}",'
+            return [line.split(",le=")[1].split("}")[0] for line in text.splitlines()
+                    if line.startswith(prefix)]
+
+        self.assertEqual(layout("slow"), layout("TicketService.sell_ticket"))
+        self.assertEqual(len(layout("slow")), len(PROMETHEUS_BUCKETS) + 1)
+        self.assertIn('operation="slow",le="1e-05"} 0', text)
+
+    def test_streaming_methods_are_timed_when_consumed(self):
+        for seat in ("A1", "A2", "A3"):
+            self.sell(seat)
+        self.assertEqual(len(list(self.service.iter_tickets(batch_size=2))), 3)
+        partial = self.service.repository.iter_rows_since()
+        next(partial)
+        partial.close()
+
+        operations = REGISTRY.snapshot()["operations"]
+        self.assertEqual(operations["TicketService.iter_tickets"]["count"], 1)
+        self.assertEqual(operations["TicketRepository.iter_all"]["count"], 1)
+        self.assertEqual(operations["TicketRepository.iter_rows_since"]["count"], 1)
+
+    def test_disabled_means_original_methods_and_plain_connections(self):
+        disable_metrics()
+        self.assertIs(TicketService.sell_ticket, ORIGINAL_SELL_TICKET)
+        self.assertNotIn("get_page", vars(TicketRepository))
+        conn = connect(":memory:")
+        self.assertNotIsInstance(conn, TimedConnection)
+        conn.close()
+
+    def test_statement_key_folds_placeholder_lists(self):
+        self.assertEqual(
+            statement_key("SELECT id\n  FROM tickets WHERE id IN (?, ?,?)"),
+            "SELECT id FROM tickets WHERE id IN (?, ...)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
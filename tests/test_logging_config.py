@@ -0,0 +1,99 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from src.logging_config import setup_logging, shutdown_logging
+
+
+class LoggingConfigTests(unittest.TestCase):
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved = (list(self.root.handlers), self.root.level)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmp.name, "app.log")
+        self.logger = logging.getLogger("tests.logging")
+
+    def tearDown(self):
+        shutdown_logging()
+        for handler in self.root.handlers:
+            handler.close()
+        self.root.handlers[:], level = self.saved
+        self.root.setLevel(level)
+        self.tmp.cleanup()
+
+    def lines(self, path=None):
+        with open(path or self.log_file, encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_queue_mode_writes_everything_on_shutdown(self):
+        setup_logging(use_queue=True, log_file=self.log_file)
+        for i in range(500):
+            self.logger.info("Ticket sold: %s", i)
+        shutdown_logging()
+
+        lines = self.lines()
+        self.assertEqual(len(lines), 500)
+        self.assertTrue(lines[-1].endswith("Ticket sold: 499"))
+
+    def test_sampling_keeps_one_of_n_but_never_warnings(self):
+        setup_logging(log_file=self.log_file, sample_rate=10)
+        for i in range(100):
+            self.logger.info("Ticket sold: %s", i)
+        self.logger.info("Venue created: %s", "x")
+        self.logger.warning("Ticket sold: %s", "oversell?")
+
+        lines = self.lines()
+        self.assertEqual(sum("[INFO]" in line and "Ticket sold" in line for line in lines), 10)
+        self.assertTrue(any("Venue created" in line for line in lines))
+        self.assertTrue(any("[WARNING]" in line for line in lines))
+
+    def test_json_format_includes_extras_and_exceptions(self):
+        setup_logging(use_queue=True, json_format=True, log_file=self.log_file)
+        self.logger.info("Ticket sold: %s", "t1", extra={"event_id": "e1"})
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            self.logger.exception("Request failed")
+        shutdown_logging()
+
+        first, second = (json.loads(line) for line in self.lines())
+        self.assertEqual(first["message"], "Ticket sold: t1")
+        self.assertEqual((first["level"], first["event_id"]), ("INFO", "e1"))
+        self.assertIn("RuntimeError: boom", second["exc_info"])
+
+    def test_file_rotates_by_size(self):
+        setup_logging(log_file=self.log_file, max_bytes=2000, backup_count=2)
+        for i in range(100):
+            self.logger.info("Retrieved %d tickets", i)
+
+        self.assertTrue(os.path.exists(self.log_file + ".1"))
+        self.assertLess(os.path.getsize(self.log_file), 2000)
+        self.assertFalse(os.path.exists(self.log_file + ".3"))
+
+    def test_record_lookups_stay_on_unless_asked(self):
+        saved = (logging._srcfile, logging.logThreads, logging.logProcesses)
+        try:
+            setup_logging(log_file=self.log_file)
+            self.assertIsNotNone(logging._srcfile)
+            self.assertTrue(logging.logThreads)
+
+            setup_logging(log_file=self.log_file, lean_records=True)
+            self.assertIsNone(logging._srcfile)
+            self.assertFalse(logging.logThreads)
+        finally:
+            logging._srcfile, logging.logThreads, logging.logProcesses = saved
+            logging.logMultiprocessing = True
+
+    def test_rotation_counts_bytes_of_non_ascii_text(self):
+        setup_logging(log_file=self.log_file, max_bytes=2000, backup_count=2)
+        for i in range(100):
+            self.logger.info("Bilet satıldı: %d %s", i, "ş" * 40)
+
+        self.assertLess(os.path.getsize(self.log_file), 2000)
+        self.assertLess(os.path.getsize(self.log_file + ".1"), 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -66,6 +66,23 @@ class TestModels(unittest.TestCase):
         self.assertEqual(ticket.ticket_type, "VIP")
         self.assertFalse(ticket.is_used)
 
+    def test_models_use_slots(self):
+        ticket = Ticket(
+            event_id="event-1",
+            participant_id="part-1",
+            price=50.0,
+            seat_number="A10",
+            ticket_type="VIP",
+            purchase_date="2025-02-02"
+        )
+        self.assertFalse(hasattr(ticket, "__dict__"))
+        with self.assertRaises(AttributeError):
+            ticket.unknown = 1
+
+        # services still update through the private attributes
+        ticket._is_used = True
+        self.assertTrue(ticket.to_dict()["is_used"])
+
 
 if __name__ == "__main__":
     unittest.main()
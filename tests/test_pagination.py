@@ -0,0 +1,66 @@
+import unittest
+import sqlite3
+
+from src.database.schema import initialize_database
+from src.models.participant import Participant
+from src.repositories.participant_repository import ParticipantRepository
+from src.services.participant_service import ParticipantService
+
+
+class KeysetPaginationTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+
+        repo = ParticipantRepository(self.conn)
+        repo.add_many(
+            Participant(
+                full_name=f"Person {i:02d}",
+                email=f"p{i}@example.com",
+                phone="0501234567",
+                age=30,
+                gender="F",
+                registration_date="2025-01-01",
+                id=f"id-{i:02d}"
+            )
+            for i in range(25)
+        )
+        self.service = ParticipantService(repo)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _names(self, page):
+        return [p.full_name for p in page.items]
+
+    def test_walk_forward_and_back(self):
+        first = self.service.list_participants_page(page_size=10)
+        self.assertEqual(self._names(first)[0], "Person 00")
+        self.assertFalse(first.has_prev)
+        self.assertTrue(first.has_next)
+
+        second = self.service.list_participants_page(10, cursor=first.next_cursor)
+        third = self.service.list_participants_page(10, cursor=second.next_cursor)
+        self.assertEqual(self._names(second)[0], "Person 10")
+        self.assertEqual(len(third.items), 5)
+        self.assertFalse(third.has_next)
+
+        back = self.service.list_participants_page(10, cursor=third.prev_cursor)
+        self.assertEqual(self._names(back), self._names(second))
+        self.assertTrue(back.has_prev)
+
+    def test_jump_to_prefix(self):
+        page = self.service.list_participants_page(5, start_at="Person 17")
+
+        self.assertEqual(self._names(page)[0], "Person 17")
+        self.assertTrue(page.has_prev)
+
+    def test_invalid_cursor_and_page_size(self):
+        with self.assertRaises(ValueError):
+            self.service.list_participants_page(10, cursor="not-a-cursor")
+        with self.assertRaises(ValueError):
+            self.service.list_participants_page(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
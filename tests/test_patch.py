@@ -0,0 +1,104 @@
+import sqlite3
+import unittest
+
+from src.database.schema import initialize_database
+from src.database.unit_of_work import UnitOfWork
+from src.models.event import Event
+from src.models.ticket import Ticket
+from src.models.venue import Venue
+from src.repositories.cached_repository import cached
+from src.repositories.event_repository import EventRepository
+from src.repositories.ticket_repository import TicketRepository
+from src.repositories.venue_repository import VenueRepository
+from src.services.event_service import EventService
+from src.services.ticket_service import TicketService
+from src.services.venue_service import VenueService
+
+
+class PatchTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+        self.venues = VenueService(cached(VenueRepository(self.conn)))
+        self.events = EventService(cached(EventRepository(self.conn)))
+        self.tickets = TicketService(cached(TicketRepository(self.conn)))
+
+        self.venue = Venue("Hall", "Street 1", 100, "John Doe", "0501234567")
+        other = Venue("Other", "Street 2", 100, "John Doe", "0501234567")
+        VenueRepository(self.conn).add_many([self.venue, other])
+        self.event_ids = [
+            self.events.create_event(f"Gig {i}", "2025-06-01", "20:00", "Music", "", 90, venue.id).id
+            for i, venue in enumerate((self.venue, self.venue, other))
+        ]
+        self.ticket_ids = []
+        for seat in ("A1", "A2", "A3"):
+            ticket = Ticket(self.event_ids[0], "p1", 10.0, seat, "Standard", "2025-01-01")
+            self.tickets.repository.add(ticket)
+            self.ticket_ids.append(ticket.id)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_patch_sets_only_given_columns(self):
+        before = self.tickets.repository.get_by_id(self.ticket_ids[0])
+        self.assertEqual(self.tickets.patch_ticket(self.ticket_ids[0], is_used=True), 1)
+
+        after = self.tickets.repository.get_by_id(self.ticket_ids[0])
+        self.assertTrue(after.is_used)
+        self.assertEqual(
+            {k: v for k, v in after.to_dict().items() if k != "is_used"},
+            {k: v for k, v in before.to_dict().items() if k != "is_used"}
+        )
+
+    def test_patch_rejects_unknown_fields_bad_values_and_missing_ids(self):
+        with self.assertRaises(ValueError):
+            self.tickets.patch_ticket(self.ticket_ids[0], seat_number="B1")
+        with self.assertRaises(ValueError):
+            self.tickets.patch_ticket(self.ticket_ids[0])
+        with self.assertRaises(ValueError):
+            self.venues.patch_venue(self.venue.id, is_open="maybe")
+        with self.assertRaises(ValueError):
+            self.tickets.patch_ticket(self.ticket_ids[0], price="free")
+        with self.assertRaises(ValueError):
+            self.events.patch_event(self.event_ids[0], duration_minutes="long")
+        with self.assertRaises(ValueError):
+            self.tickets.repository.patch(self.ticket_ids[0], purchase_date="yesterday")
+        with self.assertRaisesRegex(ValueError, "not found"):
+            self.events.patch_event("missing", is_active=False)
+
+    def test_patch_normalizes_values_like_create(self):
+        self.venues.patch_venue(self.venue.id, is_open="n", name="  grand hall ")
+        self.tickets.patch_ticket(self.ticket_ids[0], price="12.5")
+
+        venue = self.venues.repository.get_by_id(self.venue.id)
+        self.assertEqual((venue.is_open, venue.name), (False, "Grand hall"))
+        self.assertEqual(self.tickets.repository.get_by_id(self.ticket_ids[0]).price, 12.5)
+
+    def test_mark_event_tickets_used_counts_only_unused(self):
+        self.tickets.patch_ticket(self.ticket_ids[0], is_used=True)
+        self.assertEqual(self.tickets.mark_event_tickets_used(self.event_ids[0]), 2)
+        self.assertEqual(self.tickets.mark_event_tickets_used(self.event_ids[0]), 0)
+        self.assertTrue(all(self.tickets.repository.get_by_id(i).is_used for i in self.ticket_ids))
+
+    def test_close_venue_deactivates_its_events_and_clears_caches(self):
+        self.assertTrue(self.events.repository.get_by_id(self.event_ids[0]).is_active)
+
+        self.assertEqual(self.venues.close_venue(self.venue.id), 2)
+
+        self.assertFalse(self.venues.repository.get_by_id(self.venue.id).is_open)
+        active = [self.events.repository.get_by_id(i).is_active for i in self.event_ids]
+        self.assertEqual(active, [False, False, True])
+        with self.assertRaisesRegex(ValueError, "not found"):
+            self.venues.close_venue("missing")
+
+    def test_close_venue_rolls_back_with_the_unit_of_work(self):
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork(self.conn):
+                self.venues.close_venue(self.venue.id)
+                raise RuntimeError("abort")
+        self.assertTrue(self.venues.repository.get_by_id(self.venue.id).is_open)
+        self.assertTrue(self.events.repository.get_by_id(self.event_ids[0]).is_active)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import sqlite3
+from array import array
+
+from src.database.schema import initialize_database
+from src.repositories.ticket_repository import TicketRepository
+from src.services.ticket_service import TicketService
+from src.services.pricing.pricing_strategy import PricingStrategy
+from src.services.pricing.registry import PricingRegistry
+from src.services.pricing.standard_pricing import StandardPricing
+from src.services.pricing.student_pricing import StudentPricing
+from src.services.pricing.vip_pricing import VipPricing
+
+
+class HalfPricing(PricingStrategy):
+    def calculate_price(self, base_price: float) -> float:
+        return base_price / 2
+
+
+class BatchPricingTests(unittest.TestCase):
+    def test_batch_matches_single(self):
+        base = array("d", [0.0, 10.0, 99.99])
+        for strategy in (StandardPricing(), VipPricing(), StudentPricing(), HalfPricing()):
+            expected = [strategy.calculate_price(p) for p in base]
+            self.assertEqual(list(strategy.calculate_prices(base)), expected)
+
+    def test_registry_caches_instances(self):
+        registry = PricingRegistry()
+
+        self.assertIs(registry.get("VIP"), registry.get(" vip "))
+        self.assertIsInstance(registry.get("unknown"), StandardPricing)
+
+        registry.register("Half", HalfPricing())
+        self.assertIsInstance(registry.get("half"), HalfPricing)
+
+
+class RepriceEventTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+        self.service = TicketService(TicketRepository(self.conn))
+
+        types = ["Standard", "VIP", "Student", "VIP"]
+        self.service.sell_tickets_bulk(
+            {
+                "event_id": "event-1",
+                "participant_id": "part-1",
+                "price": 10.0,
+                "seat_number": str(i),
+                "ticket_type": ticket_type,
+                "purchase_date": "2025-01-01",
+            }
+            for i, ticket_type in enumerate(types)
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_reprice_event(self):
+        count = self.service.reprice_event("event-1", 100.0)
+
+        self.assertEqual(count, 4)
+        prices = dict(
+            self.conn.execute("SELECT seat_number, price FROM tickets").fetchall()
+        )
+        self.assertEqual(prices["0"], 100.0)
+        self.assertAlmostEqual(prices["1"], 150.0)
+        self.assertAlmostEqual(prices["2"], 70.0)
+        self.assertAlmostEqual(prices["3"], 150.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,5 +51,38 @@ class VenueServiceTests(unittest.TestCase):
         self.assertTrue(deleted)
 
 
+class IterAllTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+        self.repo = VenueRepository(self.conn)
+        self.repo.add_many(
+            Venue(
+                name=f"Hall {i}",
+                address="Street 1",
+                capacity=100,
+                manager_name="John Doe",
+                phone="0501234567"
+            )
+            for i in range(12)
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_iter_all_matches_get_all(self):
+        streamed = self.repo.iter_all(batch_size=5)
+
+        self.assertNotIsInstance(streamed, list)
+        self.assertEqual(
+            [v.id for v in streamed],
+            [v.id for v in self.repo.get_all()]
+        )
+
+    def test_iter_all_rejects_bad_batch_size(self):
+        with self.assertRaises(ValueError):
+            list(self.repo.iter_all(batch_size=0))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import sqlite3
+
+from src.database.schema import (
+    LATEST_VERSION,
+    get_schema_version,
+    initialize_database,
+    migrate,
+)
+
+
+class SchemaMigrationTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _indexes(self):
+        rows = self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        )
+        return {row[0] for row in rows}
+
+    def _insert_ticket(self, ticket_id: str, seat: str):
+        self.conn.execute(
+            "INSERT INTO tickets VALUES (?, 'event-1', 'part-1', 10.0, ?, 'Standard', '2025-01-01', 0)",
+            (ticket_id, seat)
+        )
+        self.conn.commit()
+
+    def test_fresh_database_reaches_latest_version(self):
+        initialize_database(self.conn)
+
+        self.assertEqual(get_schema_version(self.conn), LATEST_VERSION)
+        self.assertIn("ux_tickets_event_seat", self._indexes())
+        self.assertIn("idx_participants_email", self._indexes())
+
+        # idempotent
+        initialize_database(self.conn)
+        self.assertEqual(get_schema_version(self.conn), LATEST_VERSION)
+
+    def test_upgrade_in_place_keeps_data(self):
+        migrate(self.conn, target=1)
+        self._insert_ticket("t1", "A1")
+
+        migrate(self.conn)
+
+        self.assertEqual(get_schema_version(self.conn), LATEST_VERSION)
+        count = self.conn.execute("SELECT COUNT(*) FROM tickets").fetchone()[0]
+        self.assertEqual(count, 1)
+
+    def test_duplicate_seats_block_upgrade(self):
+        migrate(self.conn, target=1)
+        self._insert_ticket("t1", "A1")
+        self._insert_ticket("t2", "A1")
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            migrate(self.conn)
+
+        self.assertEqual(get_schema_version(self.conn), 1)
+        self.assertNotIn("ux_tickets_event_seat", self._indexes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+import sqlite3
+
+from src.database.schema import initialize_database
+from src.repositories.event_repository import EventRepository
+from src.repositories.ticket_repository import TicketRepository
+from src.repositories.venue_repository import VenueRepository
+from src.services.event_service import EventService
+from src.services.inventory.seat_inventory import SeatInventory
+from src.services.inventory.seat_map import SeatMap
+from src.services.ticket_service import TicketService
+from src.services.venue_service import VenueService
+
+
+class SeatMapTests(unittest.TestCase):
+    def test_claim_release(self):
+        seat_map = SeatMap(10)
+
+        self.assertTrue(seat_map.claim("3"))
+        self.assertFalse(seat_map.claim(3))
+        self.assertFalse(seat_map.is_free("3"))
+        self.assertTrue(seat_map.release("3"))
+        self.assertTrue(seat_map.is_free("3"))
+        self.assertEqual(seat_map.sold, 0)
+
+    def test_named_seats_count_towards_capacity(self):
+        seat_map = SeatMap(2)
+
+        self.assertTrue(seat_map.claim("A1"))
+        self.assertTrue(seat_map.claim("1"))
+        self.assertFalse(seat_map.claim("2"))
+        self.assertFalse(seat_map.is_free("2"))
+
+    def test_find_contiguous(self):
+        seat_map = SeatMap(40)
+        for seat in list(range(1, 18)) + [20, 21]:
+            seat_map.claim(seat)
+
+        self.assertEqual(seat_map.find_contiguous(2), [18, 19])
+        self.assertEqual(seat_map.find_contiguous(5), [22, 23, 24, 25, 26])
+        self.assertIsNone(seat_map.find_contiguous(30))
+
+
+class SeatInventoryTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+
+        venue_repo = VenueRepository(self.conn)
+        event_repo = EventRepository(self.conn)
+        ticket_repo = TicketRepository(self.conn)
+
+        self.ticket_repo = ticket_repo
+        self.inventory = SeatInventory(ticket_repo, event_repo, venue_repo)
+        self.venues = VenueService(venue_repo, inventory=self.inventory)
+        self.events = EventService(event_repo, inventory=self.inventory)
+        self.service = TicketService(ticket_repo, inventory=self.inventory)
+
+        self.venue = self.venues.create_venue(
+            "Small Hall", "Street 1", 3, "John Doe", "0501234567"
+        )
+        self.event = self.events.create_event(
+            "Concert", "2025-12-31", "20:00", "Music", "", 90, self.venue.id
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _sell(self, seat: str):
+        return self.service.sell_ticket(
+            event_id=self.event.id,
+            participant_id="part-1",
+            price=10.0,
+            seat_number=seat,
+            ticket_type="Standard",
+            purchase_date="2025-01-01"
+        )
+
+    def test_no_double_sale_and_capacity(self):
+        self._sell("1")
+        with self.assertRaises(ValueError):
+            self._sell("1")
+
+        self._sell("2")
+        self._sell("3")
+        with self.assertRaises(ValueError):
+            self._sell("A1")
+
+        self.assertEqual(self.inventory.availability(self.event.id), (3, 3))
+
+    def test_delete_releases_seat(self):
+        ticket = self._sell("1")
+        self.service.delete_ticket(ticket.id)
+
+        self.assertTrue(self.inventory.is_available(self.event.id, "1"))
+        self.assertEqual(self.inventory.best_available(self.event.id, 3), ["1", "2", "3"])
+
+    def test_rollback_releases_claim(self):
+        with self.assertRaises(RuntimeError):
+            with self.service.unit_of_work():
+                self._sell("2")
+                raise RuntimeError("abort")
+
+        self.assertTrue(self.inventory.is_available(self.event.id, "2"))
+
+    def _resize(self, capacity: int):
+        self.venues.update_venue(
+            self.venue.id, "Small Hall", "Street 1", capacity, "John Doe", "0501234567", True
+        )
+
+    def test_capacity_change_after_a_sale_resizes_the_map(self):
+        self._sell("1")
+        self._resize(1)
+        self.assertEqual(self.inventory.availability(self.event.id), (1, 1))
+        with self.assertRaisesRegex(ValueError, "sold out"):
+            self._sell("2")
+
+        self._resize(100)
+        self.assertEqual(self.inventory.availability(self.event.id), (1, 100))
+        self._sell("2")
+
+    def test_patched_capacity_and_venue_resize_the_map(self):
+        self._sell("1")
+        self.venues.patch_venue(self.venue.id, capacity=1)
+        self.assertEqual(self.inventory.availability(self.event.id), (1, 1))
+
+        big = self.venues.create_venue("Big Hall", "Street 2", 50, "John Doe", "0501234567")
+        self.events.patch_event(self.event.id, venue_id=big.id)
+        self.assertEqual(self.inventory.availability(self.event.id), (1, 50))
+
+    def test_moving_the_event_and_rolled_back_resize(self):
+        self._sell("1")
+        big = self.venues.create_venue("Big Hall", "Street 2", 50, "John Doe", "0501234567")
+        self.events.update_event(
+            self.event.id, "Concert", "2025-12-31", "20:00", "Music", "", 90, big.id, True
+        )
+        self.assertEqual(self.inventory.availability(self.event.id), (1, 50))
+
+        with self.assertRaises(RuntimeError):
+            with self.venues.unit_of_work():
+                self.venues.update_venue(
+                    big.id, "Big Hall", "Street 2", 2, "John Doe", "0501234567", True
+                )
+                self.assertEqual(self.inventory.availability(self.event.id), (1, 2))
+                raise RuntimeError("abort")
+        self.assertEqual(self.inventory.availability(self.event.id), (1, 50))
+
+    def test_map_is_rebuilt_from_tickets_table(self):
+        self._sell("2")
+
+        fresh = SeatInventory(
+            self.ticket_repo,
+            EventRepository(self.conn),
+            VenueRepository(self.conn)
+        )
+        self.assertFalse(fresh.is_available(self.event.id, "2"))
+        self.assertEqual(fresh.best_available(self.event.id), ["1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
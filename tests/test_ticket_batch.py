@@ -0,0 +1,57 @@
+import unittest
+import sqlite3
+
+from src.database.schema import initialize_database
+from src.repositories.ticket_repository import TicketRepository
+from src.services.ticket_service import TicketService
+
+
+class TicketBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+        self.service = TicketService(TicketRepository(self.conn))
+
+        sales = []
+        for i in range(6):
+            sales.append({
+                "event_id": "event-a" if i < 4 else "event-b",
+                "participant_id": f"part-{i % 2}",
+                "price": 100.0,
+                "seat_number": str(i),
+                "ticket_type": "VIP" if i == 0 else "Standard",
+                "purchase_date": f"2025-01-0{1 + i % 2}",
+                "is_used": i % 3 == 0,
+            })
+        self.service.sell_tickets_bulk(sales)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_totals(self):
+        batch = self.service.sales_batch()
+
+        self.assertEqual(batch.count(), 6)
+        self.assertAlmostEqual(batch.total_revenue(), 650.0)
+        self.assertEqual(batch.used_count(), 2)
+
+    def test_group_by(self):
+        batch = self.service.sales_batch()
+
+        self.assertEqual(batch.revenue_by_event(), {"event-a": 450.0, "event-b": 200.0})
+        self.assertEqual(batch.count_by_type(), {"VIP": 1, "Standard": 5})
+        self.assertEqual(batch.group_by("event_id", "used"), {"event-a": 2, "event-b": 0})
+        self.assertEqual(len(batch.revenue_by_date()), 2)
+
+        with self.assertRaises(ValueError):
+            batch.group_by("seat_number")
+
+    def test_filter_by_event(self):
+        batch = self.service.sales_batch("event-b")
+
+        self.assertEqual(batch.count(), 2)
+        self.assertEqual(batch.count_by_event(), {"event-b": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from benchmarks.stress_reservations import run_stress, setup_event
+from src.repositories.ticket_repository import TicketRepository
+from src.services.ticket_service import TicketService
+
+
+class ReserveTicketTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "test.db")
+        self.event_id = setup_event(self.db_path, capacity=2)
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.service = TicketService(TicketRepository(self.conn))
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def _reserve(self, seat: str, event_id: str | None = None):
+        return self.service.reserve_ticket(
+            event_id=event_id or self.event_id,
+            participant_id="part-1",
+            price=10.0,
+            seat_number=seat,
+            ticket_type="Student",
+            purchase_date="2025-01-01"
+        )
+
+    def test_reserve_until_sold_out(self):
+        ticket = self._reserve("1")
+        self.assertAlmostEqual(ticket.price, 7.0)
+
+        with self.assertRaisesRegex(ValueError, "already sold"):
+            self._reserve("1")
+
+        self._reserve("2")
+        with self.assertRaisesRegex(ValueError, "sold out"):
+            self._reserve("3")
+
+        with self.assertRaisesRegex(ValueError, "Event not found"):
+            self._reserve("1", event_id="missing")
+
+        self.assertFalse(self.conn.in_transaction)
+
+
+class ReservationStressTests(unittest.TestCase):
+    def test_no_oversell_under_contention(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            stats = run_stress(os.path.join(tmp, "stress.db"), processes=4, capacity=60)
+
+        self.assertEqual(stats["tickets_in_db"], 60)
+        self.assertEqual(stats["distinct_seats"], 60)
+        self.assertEqual(stats["sold_reported"], 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import sqlite3
+
+from src.database.schema import initialize_database
+from src.database.unit_of_work import UnitOfWork, in_unit_of_work
+from src.repositories.ticket_repository import TicketRepository
+from src.services.ticket_service import TicketService
+
+
+class UnitOfWorkTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        initialize_database(self.conn)
+        self.service = TicketService(TicketRepository(self.conn))
+
+        self.commits = 0
+        self.conn.set_trace_callback(self._trace)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _trace(self, statement: str):
+        if statement.strip().upper() == "COMMIT":
+            self.commits += 1
+
+    def _sell(self, seat: str, price: float = 10.0):
+        return self.service.sell_ticket(
+            event_id="event-1",
+            participant_id="part-1",
+            price=price,
+            seat_number=seat,
+            ticket_type="Standard",
+            purchase_date="2025-01-01"
+        )
+
+    def _count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM tickets").fetchone()[0]
+
+    def test_batch_commits_once(self):
+        with self.service.unit_of_work():
+            for i in range(50):
+                self._sell(str(i))
+            self.assertTrue(in_unit_of_work(self.conn))
+
+        self.assertFalse(in_unit_of_work(self.conn))
+        self.assertEqual(self._count(), 50)
+        self.assertEqual(self.commits, 1)
+
+    def test_rollback_on_error(self):
+        with self.assertRaises(ValueError):
+            with UnitOfWork(self.conn):
+                self._sell("1")
+                self._sell("2", price=-1.0)
+
+        self.assertEqual(self._count(), 0)
+
+    def test_nested_units_commit_with_outer(self):
+        with UnitOfWork(self.conn):
+            with UnitOfWork(self.conn):
+                self._sell("1")
+            self.assertEqual(self.commits, 0)
+            self._sell("2")
+
+        self.assertEqual(self._count(), 2)
+        self.assertEqual(self.commits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from src.utils.validators import (
+    validate_column,
+    validate_date,
+    validate_positive_int,
+    validate_records,
+    validate_time,
+)
+
+
+class FastPathTests(unittest.TestCase):
+    def test_dates_match_strptime_behaviour(self):
+        self.assertEqual(validate_date("2025-06-01"), "2025-06-01")
+        self.assertEqual(validate_date(" 2025-6-1 "), "2025-06-01")
+        for bad in ("2025-02-30", "2025-13-01", "20250601", "2025/06/01", ""):
+            with self.assertRaises(ValueError):
+                validate_date(bad)
+
+    def test_times_match_strptime_behaviour(self):
+        self.assertEqual(validate_time("09:30"), "09:30")
+        self.assertEqual(validate_time("9:5"), "09:05")
+        for bad in ("24:00", "12:60", "0930", ""):
+            with self.assertRaises(ValueError):
+                validate_time(bad)
+
+
+class ColumnValidationTests(unittest.TestCase):
+    def test_validate_column_reports_per_row_errors(self):
+        results, errors = validate_column(
+            ["5", "x", "5", "0"], lambda v: validate_positive_int(v, "Age")
+        )
+        self.assertEqual(results, [5, None, 5, None])
+        self.assertEqual(sorted(errors), [1, 3])
+        self.assertIn("integer", errors[1])
+
+    def test_cache_distinguishes_types(self):
+        results, errors = validate_column([True, 1], lambda v: validate_positive_int(str(v), "Age"))
+        self.assertEqual((results, list(errors)), ([None, 1], [0]))
+
+    def test_validate_records_first_error_per_row(self):
+        rows, errors = validate_records("participant", [
+            {"full_name": "ann lee", "age": "30", "gender": "f"},
+            {"full_name": "bob", "age": "-1", "gender": "x"},
+        ])
+        self.assertEqual(rows[0], {"full_name": "Ann Lee", "age": 30, "gender": "F"})
+        self.assertIsNone(rows[1])
+        self.assertEqual(list(errors), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()